@@ -1,14 +1,25 @@
-from eo_maxar.client import APIClient
+from eo_maxar.cache import MosaicSearchCache, ResponseCache
+from eo_maxar.client import APIClient, AsyncAPIClient
 from eo_maxar.collection import MaxarCollection
 from eo_maxar.config import Settings, settings
 from eo_maxar.loader import DataLoader
+from eo_maxar.pgstac import PgSTACClient
+from eo_maxar.proxy import MBTilesCache, TileProxy
+from eo_maxar.table import ItemTable
 from eo_maxar.visualiser import MapVisualizer
 
 __all__ = [
     "APIClient",
+    "AsyncAPIClient",
     "DataLoader",
+    "ItemTable",
+    "MBTilesCache",
     "MapVisualizer",
     "MaxarCollection",
+    "MosaicSearchCache",
+    "PgSTACClient",
+    "ResponseCache",
     "Settings",
+    "TileProxy",
     "settings",
 ]
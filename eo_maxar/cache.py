@@ -0,0 +1,318 @@
+"""On-disk caches for STAC and raster API reads and mosaic registrations."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+
+from eo_maxar.config import settings
+
+# Headers describing the wire encoding of the original body. The cache stores the
+# decoded body, so these must not be replayed on cached responses.
+_HOP_HEADERS = frozenset({"content-encoding", "content-length", "transfer-encoding", "connection"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+)
+"""
+
+
+class CacheEntry(NamedTuple):
+    """A cached HTTP response."""
+
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    stored_at: float
+
+    @property
+    def etag(self) -> str | None:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> str | None:
+        return self.headers.get("last-modified")
+
+
+class ResponseCache:
+    """SQLite-backed response store with a TTL and size-bounded LRU eviction.
+
+    Entries younger than ``ttl`` seconds are served without touching the network.
+    Stale entries are revalidated with ``If-None-Match`` / ``If-Modified-Since`` and
+    refreshed in place on a ``304 Not Modified``. When the stored bodies exceed
+    ``max_bytes``, the least recently accessed entries are evicted first.
+    """
+
+    def __init__(
+        self,
+        path: Path | None = None,
+        ttl: float | None = None,
+        max_bytes: int | None = None,
+    ) -> None:
+        self.path = path or settings.http_cache_dir / "responses.sqlite"
+        self.ttl = settings.http_cache_ttl if ttl is None else ttl
+        self.max_bytes = settings.http_cache_max_bytes if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Hit, miss and revalidation counters for this cache instance."""
+        return {"hits": self.hits, "misses": self.misses, "revalidations": self.revalidations}
+
+    def is_fresh(self, entry: CacheEntry) -> bool:
+        """Whether an entry can be served without revalidation."""
+        return time.time() - entry.stored_at < self.ttl
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Look up an entry and mark it as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+        status, headers, body, stored_at = row
+        return CacheEntry(status, json.loads(headers), body, stored_at)
+
+    def set(self, key: str, status: int, headers: dict[str, str], body: bytes) -> None:
+        """Store a response, evicting least recently used entries if over budget."""
+        now = time.time()
+        headers = {k.lower(): v for k, v in headers.items() if k.lower() not in _HOP_HEADERS}
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, status, json.dumps(headers), body, len(body), now, now),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def touch(self, key: str) -> None:
+        """Reset an entry's age after a successful revalidation."""
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ? WHERE key = ?", (time.time(), key)
+            )
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently accessed entries until the cache fits in ``max_bytes``."""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at ASC"
+        ).fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
+
+
+class _CachingMixin:
+    """Request/response bookkeeping shared by the sync and async caching transports."""
+
+    cache: ResponseCache
+
+    def _lookup(self, request: httpx.Request) -> tuple[httpx.Response | None, CacheEntry | None]:
+        """Return a cached response for fresh hits, or the stale entry to revalidate."""
+        if request.method != "GET":
+            return None, None
+        entry = self.cache.get(str(request.url))
+        if entry is None:
+            return None, None
+        if self.cache.is_fresh(entry):
+            self.cache.hits += 1
+            return self._from_entry(request, entry), entry
+        if entry.etag:
+            request.headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            request.headers["If-Modified-Since"] = entry.last_modified
+        return None, entry
+
+    def _revalidated(
+        self, request: httpx.Request, response: httpx.Response, entry: CacheEntry | None
+    ) -> httpx.Response | None:
+        """Return the cached response if the server confirmed it is still current."""
+        if entry is None or response.status_code != httpx.codes.NOT_MODIFIED:
+            return None
+        self.cache.touch(str(request.url))
+        self.cache.hits += 1
+        self.cache.revalidations += 1
+        return self._from_entry(request, entry)
+
+    def _store(self, request: httpx.Request, response: httpx.Response) -> None:
+        """Persist a successful GET response."""
+        if request.method != "GET":
+            return
+        self.cache.misses += 1
+        if response.status_code == httpx.codes.OK:
+            self.cache.set(
+                str(request.url), response.status_code, dict(response.headers), response.content
+            )
+
+    @staticmethod
+    def _from_entry(request: httpx.Request, entry: CacheEntry) -> httpx.Response:
+        return httpx.Response(
+            entry.status, headers=entry.headers, content=entry.body, request=request
+        )
+
+
+class CachingTransport(_CachingMixin, httpx.BaseTransport):
+    """An ``httpx`` transport that serves GET requests from a :class:`ResponseCache`."""
+
+    def __init__(self, cache: ResponseCache, transport: httpx.BaseTransport | None = None):
+        self.cache = cache
+        self.transport = transport or httpx.HTTPTransport()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        cached, entry = self._lookup(request)
+        if cached is not None:
+            return cached
+        response = self.transport.handle_request(request)
+        if (revalidated := self._revalidated(request, response, entry)) is not None:
+            response.close()
+            return revalidated
+        response.read()
+        self._store(request, response)
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+
+
+class AsyncCachingTransport(_CachingMixin, httpx.AsyncBaseTransport):
+    """The asynchronous counterpart of :class:`CachingTransport`."""
+
+    def __init__(
+        self, cache: ResponseCache, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        self.cache = cache
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        cached, entry = self._lookup(request)
+        if cached is not None:
+            return cached
+        response = await self.transport.handle_async_request(request)
+        if (revalidated := self._revalidated(request, response, entry)) is not None:
+            await response.aclose()
+            return revalidated
+        await response.aread()
+        self._store(request, response)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+def canonical_hash(obj: object) -> str:
+    """Return a stable SHA-256 hex digest of a JSON-serialisable object.
+
+    Keys are sorted and whitespace is stripped so that logically equal payloads hash
+    identically regardless of dict ordering.
+    """
+    encoded = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class MosaicSearchCache:
+    """Maps mosaic search payloads to the search IDs returned by titiler-pgstac.
+
+    Keys are a :func:`canonical_hash` of the collection, CQL2 filter, sort order and
+    bounds, so the display name does not affect reuse. With a ``path``, entries are
+    persisted as JSON and reused across sessions; otherwise they live in memory.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: dict[str, str] = {}
+        if path is not None and path.exists():
+            self._entries = json.loads(path.read_text())
+
+    @classmethod
+    def persistent(cls) -> MosaicSearchCache:
+        """Create a cache stored in ``settings.http_cache_dir``."""
+        return cls(settings.http_cache_dir / "mosaic_searches.json")
+
+    @staticmethod
+    def key(collection_id: str, payload: dict) -> str:
+        """Build the cache key for a mosaic registration payload."""
+        return canonical_hash({
+            "collection": collection_id,
+            "filter": payload.get("filter"),
+            "sortby": payload.get("sortby"),
+            "bounds": payload.get("metadata", {}).get("bounds"),
+        })
+
+    def get(self, key: str) -> str | None:
+        """Return the search ID registered for ``key``, if any."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, search_id: str) -> None:
+        """Record a search ID and persist the cache if it is file-backed."""
+        with self._lock:
+            self._entries[key] = search_id
+            self._save()
+
+    def discard(self, key: str) -> None:
+        """Forget one registered search, e.g. when the raster API no longer knows it."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._save()
+
+    def clear(self) -> None:
+        """Forget all registered searches, e.g. after the database has been reset."""
+        with self._lock:
+            self._entries.clear()
+            self._save()
+
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(self._entries, indent=2))
+        os.replace(tmp_path, self.path)
+
+    def __len__(self) -> int:
+        return len(self._entries)
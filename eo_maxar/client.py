@@ -1,7 +1,20 @@
+import asyncio
 import logging
+import threading
+from collections.abc import AsyncIterator, Awaitable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TypeVar
 
 import httpx
 
+from eo_maxar.cache import (
+    AsyncCachingTransport,
+    CachingTransport,
+    MosaicSearchCache,
+    ResponseCache,
+)
 from eo_maxar.config import settings
 from eo_maxar.models import (
     MosaicRegisterResponse,
@@ -9,15 +22,237 @@ from eo_maxar.models import (
     STACItem,
     TileJSON,
 )
+from eo_maxar.snapshot import write_items_snapshot
+from eo_maxar.table import ItemTable
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+def _next_link(data: dict) -> str | None:
+    """Return the ``href`` of the ``next`` link in a paginated STAC response, if any."""
+    return next(
+        (link["href"] for link in data.get("links", []) if link["rel"] == "next"),
+        None,
+    )
+
+
+def _next_search_request(data: dict, payload: dict) -> tuple[str, dict | None] | None:
+    """Return the URL and body for the next page of a ``POST /search`` response, if any.
+
+    The body is ``None`` when the ``next`` link should be followed with a GET.
+    """
+    link = next((link for link in data.get("links", []) if link["rel"] == "next"), None)
+    if link is None:
+        return None
+    if link.get("method", "GET").upper() != "POST":
+        return link["href"], None
+    body = link.get("body", {})
+    return link["href"], {**payload, **body} if link.get("merge") else body
+
+
+def _mosaic_payload(collection_id: str, bbox: list[float], filter_args: dict, name: str) -> dict:
+    """Build the CQL2 search payload used to register a mosaic with titiler-pgstac."""
+    base_filter = {
+        "op": "and",
+        "args": [
+            {"op": "in", "args": [{"property": "collection"}, [collection_id]]},
+            filter_args,
+        ],
+    }
+    return {
+        "filter-lang": "cql2-json",
+        "filter": base_filter,
+        "sortby": [{"field": "tile:clouds_percent", "direction": "asc"}],
+        "metadata": {"name": name, "bounds": bbox},
+    }
+
+
+# Item fields always requested with the fields extension, so that filtered responses
+# still validate as :class:`STACItem` and can be placed in time.
+_ITEM_CORE_FIELDS = (
+    "type",
+    "stac_version",
+    "id",
+    "bbox",
+    "geometry",
+    "assets",
+    "links",
+    "collection",
+    "properties.datetime",
+)
+
+DatetimeRange = str | tuple[datetime | None, datetime | None]
+
+
+def _datetime_interval(value: DatetimeRange) -> str | None:
+    """Format a datetime or ``(start, end)`` range as a STAC ``datetime`` parameter.
+
+    Either end of a range may be ``None`` for an open interval. A range open at both
+    ends does not filter anything and gives ``None``. Timezone-aware values are
+    converted to UTC; naive values are assumed to be UTC.
+    """
+    if isinstance(value, str):
+        return value
+    if value == (None, None):
+        return None
+    return "/".join(_utc_timestamp(moment) for moment in value)
+
+
+def _utc_timestamp(moment: datetime | None) -> str:
+    """Format one end of a datetime range, or ``..`` if it is open."""
+    if moment is None:
+        return ".."
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC)
+    return moment.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _search_payload(
+    collection_id: str,
+    bbox: list[float] | None = None,
+    intersects: dict | None = None,
+    datetime_range: DatetimeRange | None = None,
+    cql2_filter: dict | None = None,
+    fields: Iterable[str] | None = None,
+) -> dict:
+    """Build the body of a STAC API ``POST /search`` request for one collection."""
+    if bbox is not None and intersects is not None:
+        raise ValueError("Pass either bbox or intersects, not both.")
+    payload: dict = {"collections": [collection_id], "limit": settings.pagination_limit}
+    if bbox is not None:
+        payload["bbox"] = bbox
+    if intersects is not None:
+        payload["intersects"] = intersects
+    interval = _datetime_interval(datetime_range) if datetime_range is not None else None
+    if interval is not None:
+        payload["datetime"] = interval
+    if cql2_filter is not None:
+        payload["filter-lang"] = "cql2-json"
+        payload["filter"] = cql2_filter
+    if fields is not None:
+        names = (name.removeprefix("properties.") for name in fields)
+        requested = (f"properties.{name}" for name in names if name != "datetime")
+        include = [*_ITEM_CORE_FIELDS, *requested]
+        payload["fields"] = {"include": include}
+    return payload
+
+
+def _tilejson_params(asset: str | None) -> dict[str, str | int]:
+    """Build the query parameters shared by the raster API TileJSON endpoints."""
+    return {
+        "assets": asset or settings.default_asset,
+        "minzoom": settings.min_zoom,
+        "maxzoom": settings.max_zoom,
+    }
+
+
+def _http_limits() -> httpx.Limits:
+    """Connection pool limits for the STAC and raster API clients."""
+    return httpx.Limits(
+        max_connections=settings.http_max_connections,
+        max_keepalive_connections=settings.http_max_keepalive_connections,
+        keepalive_expiry=settings.http_keepalive_expiry,
+    )
+
+
+def _http_transport() -> httpx.HTTPTransport:
+    """Build a pooled transport configured from settings."""
+    return httpx.HTTPTransport(limits=_http_limits(), http2=settings.http2)
+
+
+def _async_http_transport() -> httpx.AsyncHTTPTransport:
+    """Build a pooled async transport configured from settings."""
+    return httpx.AsyncHTTPTransport(limits=_http_limits(), http2=settings.http2)
+
+
+_shared_http_client: httpx.Client | None = None
+_shared_http_client_lock = threading.Lock()
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide ``httpx.Client``, creating it on first use.
+
+    All :class:`~eo_maxar.collection.MaxarCollection` instances built without an
+    explicit client share this connection pool, so connections to the STAC and raster
+    APIs are kept alive and reused instead of re-opened per collection.
+    """
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is None or _shared_http_client.is_closed:
+            _shared_http_client = httpx.Client(transport=_http_transport())
+        return _shared_http_client
+
+
+def close_shared_http_client() -> None:
+    """Close the process-wide ``httpx.Client``, if one has been created."""
+    global _shared_http_client
+    with _shared_http_client_lock:
+        if _shared_http_client is not None:
+            _shared_http_client.close()
+            _shared_http_client = None
+
+
+_shared_search_cache: MosaicSearchCache | None = None
+
+
+def get_shared_search_cache() -> MosaicSearchCache:
+    """Return the process-wide mosaic search cache, creating it on first use.
+
+    The cache is stored in ``settings.http_cache_dir`` when
+    ``settings.mosaic_search_cache_persistent`` is set, so registered searches are
+    reused by every collection and across sessions; otherwise it lives in memory.
+    """
+    global _shared_search_cache
+    with _shared_http_client_lock:
+        if _shared_search_cache is None:
+            _shared_search_cache = (
+                MosaicSearchCache.persistent()
+                if settings.mosaic_search_cache_persistent
+                else MosaicSearchCache()
+            )
+        return _shared_search_cache
+
 
 class APIClient:
     """Client for interacting with the STAC and Raster APIs."""
 
-    def __init__(self) -> None:
-        self.http_client = httpx.Client()
+    def __init__(
+        self,
+        prefetch_pages: bool | None = None,
+        cache: ResponseCache | None = None,
+        http_client: httpx.Client | None = None,
+        search_cache: MosaicSearchCache | None = None,
+    ) -> None:
+        """Create a client.
+
+        Args:
+            prefetch_pages: Request the next page while the current one is parsed.
+                Defaults to ``settings.prefetch_pages``.
+            cache: Optional on-disk response cache for GET requests.
+            http_client: An existing ``httpx.Client`` to send requests with, e.g. the
+                one returned by :func:`get_shared_http_client`. The client is not
+                closed by :meth:`close`.
+            search_cache: Where registered mosaic search IDs are memoised. Defaults to
+                an in-memory cache; use :func:`get_shared_search_cache` or
+                :meth:`MosaicSearchCache.persistent` to reuse registrations across
+                sessions.
+        """
+        if http_client is not None and cache is not None:
+            raise ValueError("Pass either an http_client or a cache, not both.")
+        self.cache = cache
+        self.search_cache = search_cache if search_cache is not None else MosaicSearchCache()
+        # Search ID -> (cache key, payload), so stale cached IDs can be re-registered.
+        self._search_payloads: dict[str, tuple[str, dict]] = {}
+        self._owns_http_client = http_client is None
+        if http_client is None:
+            transport = _http_transport()
+            if cache is not None:
+                transport = CachingTransport(cache, transport)
+            http_client = httpx.Client(transport=transport)
+        self.http_client = http_client
+        self.prefetch_pages = settings.prefetch_pages if prefetch_pages is None else prefetch_pages
 
     def __enter__(self) -> "APIClient":
         return self
@@ -27,23 +262,15 @@ class APIClient:
 
     def get_all_collections(self) -> list[str]:
         """Fetch all collection names from the STAC API, handling pagination."""
-        url: str | None = f"{settings.stac_api_url}/collections"
+        url = f"{settings.stac_api_url}/collections"
         collection_ids: list[str] = []
 
-        while url:
-            try:
-                response = self.http_client.get(url)
-                response.raise_for_status()
-                data = response.json()
+        try:
+            for data in self._iter_pages(url):
                 collection_ids.extend(c["id"] for c in data.get("collections", []))
-                next_link = next(
-                    (link["href"] for link in data.get("links", []) if link["rel"] == "next"),
-                    None,
-                )
-                url = next_link
-            except httpx.RequestError as e:
-                logger.error("An error occurred while requesting %s.", e.request.url)
-                raise
+        except httpx.RequestError as e:
+            logger.error("An error occurred while requesting %s.", e.request.url)
+            raise
 
         return collection_ids
 
@@ -56,59 +283,198 @@ class APIClient:
 
     def get_collection_items(self, collection_id: str) -> list[STACItem]:
         """Retrieve all STAC items for a collection, handling pagination."""
-        url: str | None = f"{settings.stac_api_url}/collections/{collection_id}/items"
-        params: dict | None = {"limit": settings.pagination_limit}
-        all_items: list[dict] = []
-
-        while url:
-            response = self.http_client.get(url, params=params)
-            response.raise_for_status()
-            data = response.json()
-            all_items.extend(data["features"])
-            next_link = next(
-                (link for link in data["links"] if link["rel"] == "next"),
-                None,
+        return list(self.iter_collection_items(collection_id))
+
+    def iter_collection_items(self, collection_id: str) -> Iterator[STACItem]:
+        """Stream STAC items for a collection, validating and yielding them page by page.
+
+        Only one page of raw features is held in memory at a time, and the first
+        items are available as soon as the first page arrives.
+        """
+        url = f"{settings.stac_api_url}/collections/{collection_id}/items"
+        for data in self._iter_pages(url, {"limit": settings.pagination_limit}):
+            for feature in data["features"]:
+                yield STACItem.model_validate(feature)
+
+    def get_collection_item_table(self, collection_id: str) -> ItemTable:
+        """Retrieve all items for a collection as a columnar :class:`ItemTable`.
+
+        Columns are built straight from the page JSON, skipping per-item model
+        validation until items are materialised from the table.
+        """
+        url = f"{settings.stac_api_url}/collections/{collection_id}/items"
+        pages = self._iter_pages(url, {"limit": settings.pagination_limit})
+        return ItemTable.from_features(feature for page in pages for feature in page["features"])
+
+    def export_collection_items(self, collection_id: str, path: Path) -> Path:
+        """Download all items for a collection into a local GeoParquet snapshot.
+
+        The snapshot can be loaded back with
+        :func:`~eo_maxar.snapshot.read_items_snapshot` or passed to
+        :class:`~eo_maxar.collection.MaxarCollection` as ``snapshot_path``.
+        """
+        return write_items_snapshot(self.iter_collection_items(collection_id), path)
+
+    def search_items(
+        self,
+        collection_id: str,
+        bbox: list[float] | None = None,
+        intersects: dict | None = None,
+        datetime_range: DatetimeRange | None = None,
+        cql2_filter: dict | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[STACItem]:
+        """Retrieve the items of a collection that match a query, handling pagination.
+
+        See :meth:`iter_search_items` for the arguments.
+        """
+        return list(
+            self.iter_search_items(
+                collection_id, bbox, intersects, datetime_range, cql2_filter, fields
             )
-            url = next_link["href"] if next_link else None
-            params = None  # Only pass params on first request
+        )
 
-        return [STACItem.model_validate(item) for item in all_items]
+    def iter_search_items(
+        self,
+        collection_id: str,
+        bbox: list[float] | None = None,
+        intersects: dict | None = None,
+        datetime_range: DatetimeRange | None = None,
+        cql2_filter: dict | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> Iterator[STACItem]:
+        """Stream the items of a collection matched server-side by the STAC ``/search`` endpoint.
+
+        Args:
+            collection_id: The collection to search.
+            bbox: Only items intersecting [min_lon, min_lat, max_lon, max_lat].
+            intersects: Only items intersecting a GeoJSON geometry. Cannot be combined
+                with ``bbox``.
+            datetime_range: An RFC 3339 datetime or interval string, or a
+                ``(start, end)`` tuple where either end may be ``None``. ``(None, None)``
+                sends no datetime filter.
+            cql2_filter: A CQL2-JSON filter on item properties, e.g.
+                ``{"op": "<", "args": [{"property": "eo:cloud_cover"}, 10]}``.
+            fields: Property names to return, with or without a ``properties.``
+                prefix. Other properties are left out of the response; the item's
+                assets, links and geometry are always returned.
+        """
+        url = f"{settings.stac_api_url}/search"
+        payload = _search_payload(
+            collection_id, bbox, intersects, datetime_range, cql2_filter, fields
+        )
+        for data in self._iter_search_pages(url, payload):
+            for feature in data["features"]:
+                # The fields extension can drop ``properties`` when none were returned.
+                feature.setdefault("properties", {})
+                yield STACItem.model_validate(feature)
+
+    def _fetch_page(self, url: str, params: dict | None = None) -> dict:
+        """Fetch a single page of a paginated STAC response."""
+        response = self.http_client.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def _fetch_search_page(self, url: str, body: dict | None) -> dict:
+        """Fetch a single page of search results, with a POST if there is a body."""
+        if body is None:
+            return self._fetch_page(url)
+        response = self.http_client.post(url, json=body)
+        response.raise_for_status()
+        return response.json()
+
+    def _iter_search_pages(self, url: str, payload: dict) -> Iterator[dict]:
+        """Yield each page of a ``POST /search`` response, following ``next`` links.
+
+        Like :meth:`_iter_pages`, the following page is requested in the background
+        while the current one is processed when ``prefetch_pages`` is enabled.
+        """
+        request: tuple[str, dict | None] | None = (url, payload)
+        if not self.prefetch_pages:
+            while request is not None:
+                data = self._fetch_search_page(*request)
+                request = _next_search_request(data, payload)
+                yield data
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future[dict] | None = executor.submit(self._fetch_search_page, url, payload)
+            while future is not None:
+                data = future.result()
+                request = _next_search_request(data, payload)
+                future = executor.submit(self._fetch_search_page, *request) if request else None
+                yield data
+
+    def _iter_pages(self, url: str, params: dict | None = None) -> Iterator[dict]:
+        """Yield each page of a paginated STAC response, following ``next`` links.
+
+        ``params`` are only sent with the first request. When ``prefetch_pages`` is
+        enabled, the request for the following page is sent on a background thread as
+        soon as its ``next`` link is known, so it is in flight while the caller
+        processes the current page.
+        """
+        if not self.prefetch_pages:
+            next_url: str | None = url
+            while next_url:
+                data = self._fetch_page(next_url, params)
+                next_url = _next_link(data)
+                params = None  # Only pass params on first request
+                yield data
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future: Future[dict] | None = executor.submit(self._fetch_page, url, params)
+            while future is not None:
+                data = future.result()
+                next_url = _next_link(data)
+                future = executor.submit(self._fetch_page, next_url) if next_url else None
+                yield data
 
     def register_mosaic(
         self, collection_id: str, bbox: list[float], filter_args: dict, name: str
     ) -> str:
-        """Register a mosaic search with the raster API and return its search ID."""
+        """Register a mosaic search with the raster API and return its search ID.
+
+        Identical searches are only registered once; later calls return the search ID
+        recorded in ``search_cache``.
+        """
+        payload = _mosaic_payload(collection_id, bbox, filter_args, name)
+        key = MosaicSearchCache.key(collection_id, payload)
+        if (search_id := self.search_cache.get(key)) is None:
+            search_id = self._register_search(key, payload)
+        self._search_payloads[search_id] = (key, payload)
+        return search_id
+
+    def _register_search(self, key: str, payload: dict) -> str:
+        """POST a search to the raster API and record its ID in ``search_cache``."""
         url = f"{settings.raster_api_url}/searches/register"
-        base_filter = {
-            "op": "and",
-            "args": [
-                {"op": "in", "args": [{"property": "collection"}, [collection_id]]},
-                filter_args,
-            ],
-        }
-        payload = {
-            "filter-lang": "cql2-json",
-            "filter": base_filter,
-            "sortby": [{"field": "tile:clouds_percent", "direction": "asc"}],
-            "metadata": {"name": name, "bounds": bbox},
-        }
         response = self.http_client.post(url, json=payload)
         response.raise_for_status()
-        validated_response = MosaicRegisterResponse.model_validate_json(response.text)
-        return validated_response.id
+        search_id = MosaicRegisterResponse.model_validate_json(response.text).id
+        self.search_cache.set(key, search_id)
+        self._search_payloads[search_id] = (key, payload)
+        return search_id
 
     def get_tilejson(self, search_id: str, asset: str | None = None) -> TileJSON:
-        """Fetch TileJSON metadata for a registered mosaic search."""
-        url = f"{settings.raster_api_url}/searches/{search_id}/{settings.tilejson_path}"
-        params: dict[str, str | int] = {
-            "assets": asset or settings.default_asset,
-            "minzoom": settings.min_zoom,
-            "maxzoom": settings.max_zoom,
-        }
-        response = self.http_client.get(url, params=params)
+        """Fetch TileJSON metadata for a registered mosaic search.
+
+        If the raster API no longer knows a search returned by :meth:`register_mosaic`
+        (e.g. after the database was reloaded), its cached ID is dropped and the
+        search is registered again.
+        """
+        response = self._fetch_tilejson(search_id, asset)
+        if response.status_code == 404 and search_id in self._search_payloads:
+            key, payload = self._search_payloads.pop(search_id)
+            logger.info("Search %s is no longer registered; registering it again.", search_id)
+            self.search_cache.discard(key)
+            response = self._fetch_tilejson(self._register_search(key, payload), asset)
         response.raise_for_status()
         return TileJSON.model_validate_json(response.text)
 
+    def _fetch_tilejson(self, search_id: str, asset: str | None) -> httpx.Response:
+        url = f"{settings.raster_api_url}/searches/{search_id}/{settings.tilejson_path}"
+        return self.http_client.get(url, params=_tilejson_params(asset))
+
     def get_item_tilejson(
         self, collection_id: str, item_id: str, asset: str | None = None
     ) -> TileJSON:
@@ -117,15 +483,230 @@ class APIClient:
             f"{settings.raster_api_url}/collections/{collection_id}"
             f"/items/{item_id}/{settings.tilejson_path}"
         )
-        params: dict[str, str | int] = {
-            "assets": asset or settings.default_asset,
-            "minzoom": settings.min_zoom,
-            "maxzoom": settings.max_zoom,
-        }
+        response = self.http_client.get(url, params=_tilejson_params(asset))
+        response.raise_for_status()
+        return TileJSON.model_validate_json(response.text)
+
+    def get_vector_tilejson(self, collection_id: str | None = None) -> TileJSON:
+        """Discover the tipg vector tile URL template for pgSTAC item footprints.
+
+        Args:
+            collection_id: If set, restrict the tiles to items in this STAC collection.
+
+        Returns:
+            TileJSON whose ``tiles`` entry is the MVT URL template, with any filter
+            already encoded in its query string.
+        """
+        url = (
+            f"{settings.vector_api_url}/collections/{settings.vector_items_table}"
+            f"/{settings.tilejson_path}"
+        )
+        params: dict[str, str] = {"properties": "id,collection,datetime"}
+        if collection_id is not None:
+            params["filter-lang"] = "cql2-text"
+            params["filter"] = f"collection='{collection_id}'"
         response = self.http_client.get(url, params=params)
         response.raise_for_status()
         return TileJSON.model_validate_json(response.text)
 
     def close(self) -> None:
+        """Closes the HTTP client session, unless it was provided by the caller."""
+        if self._owns_http_client:
+            self.http_client.close()
+
+
+class AsyncAPIClient:
+    """Asynchronous client for the STAC and Raster APIs, built on ``httpx.AsyncClient``.
+
+    Mirrors :class:`APIClient` and adds gather-style helpers that fetch many
+    collections at once, bounded by ``max_concurrency`` in-flight requests.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        prefetch_pages: bool | None = None,
+        cache: ResponseCache | None = None,
+        search_cache: MosaicSearchCache | None = None,
+    ) -> None:
+        self.cache = cache
+        self.search_cache = search_cache if search_cache is not None else MosaicSearchCache()
+        self._search_payloads: dict[str, tuple[str, dict]] = {}
+        transport = _async_http_transport()
+        if cache is not None:
+            transport = AsyncCachingTransport(cache, transport)
+        self.http_client = httpx.AsyncClient(transport=transport)
+        self.max_concurrency = max_concurrency or settings.max_concurrency
+        self.prefetch_pages = settings.prefetch_pages if prefetch_pages is None else prefetch_pages
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    async def get_all_collections(self) -> list[str]:
+        """Fetch all collection names from the STAC API, handling pagination."""
+        url = f"{settings.stac_api_url}/collections"
+        collection_ids: list[str] = []
+
+        try:
+            async for data in self._iter_pages(url):
+                collection_ids.extend(c["id"] for c in data.get("collections", []))
+        except httpx.RequestError as e:
+            logger.error("An error occurred while requesting %s.", e.request.url)
+            raise
+
+        return collection_ids
+
+    async def get_collection(self, collection_id: str) -> STACCollection:
+        """Retrieve and validate metadata for a specific STAC collection."""
+        url = f"{settings.stac_api_url}/collections/{collection_id}"
+        response = await self.http_client.get(url)
+        response.raise_for_status()
+        return STACCollection.model_validate_json(response.text)
+
+    async def get_collection_items(self, collection_id: str) -> list[STACItem]:
+        """Retrieve all STAC items for a collection, handling pagination."""
+        return [item async for item in self.iter_collection_items(collection_id)]
+
+    async def iter_collection_items(self, collection_id: str) -> AsyncIterator[STACItem]:
+        """Stream STAC items for a collection, validating and yielding them page by page."""
+        url = f"{settings.stac_api_url}/collections/{collection_id}/items"
+        async for data in self._iter_pages(url, {"limit": settings.pagination_limit}):
+            for feature in data["features"]:
+                yield STACItem.model_validate(feature)
+
+    async def _fetch_page(self, url: str, params: dict | None = None) -> dict:
+        """Fetch a single page of a paginated STAC response."""
+        response = await self.http_client.get(url, params=params)
+        response.raise_for_status()
+        return response.json()
+
+    async def _iter_pages(self, url: str, params: dict | None = None) -> AsyncIterator[dict]:
+        """Yield each page of a paginated STAC response, following ``next`` links.
+
+        ``params`` are only sent with the first request. When ``prefetch_pages`` is
+        enabled, the following page is requested in a separate task while the caller
+        processes the current page.
+        """
+        if not self.prefetch_pages:
+            next_url: str | None = url
+            while next_url:
+                data = await self._fetch_page(next_url, params)
+                next_url = _next_link(data)
+                params = None  # Only pass params on first request
+                yield data
+            return
+
+        task: asyncio.Task[dict] | None = asyncio.create_task(self._fetch_page(url, params))
+        try:
+            while task is not None:
+                data = await task
+                next_url = _next_link(data)
+                task = asyncio.create_task(self._fetch_page(next_url)) if next_url else None
+                yield data
+        finally:
+            if task is not None:
+                task.cancel()
+
+    async def register_mosaic(
+        self, collection_id: str, bbox: list[float], filter_args: dict, name: str
+    ) -> str:
+        """Register a mosaic search with the raster API and return its search ID.
+
+        Identical searches are only registered once; later calls return the search ID
+        recorded in ``search_cache``.
+        """
+        payload = _mosaic_payload(collection_id, bbox, filter_args, name)
+        key = MosaicSearchCache.key(collection_id, payload)
+        if (search_id := self.search_cache.get(key)) is None:
+            search_id = await self._register_search(key, payload)
+        self._search_payloads[search_id] = (key, payload)
+        return search_id
+
+    async def _register_search(self, key: str, payload: dict) -> str:
+        """POST a search to the raster API and record its ID in ``search_cache``."""
+        url = f"{settings.raster_api_url}/searches/register"
+        response = await self.http_client.post(url, json=payload)
+        response.raise_for_status()
+        search_id = MosaicRegisterResponse.model_validate_json(response.text).id
+        self.search_cache.set(key, search_id)
+        self._search_payloads[search_id] = (key, payload)
+        return search_id
+
+    async def get_tilejson(self, search_id: str, asset: str | None = None) -> TileJSON:
+        """Fetch TileJSON metadata for a registered mosaic search.
+
+        Stale cached search IDs are re-registered as in :meth:`APIClient.get_tilejson`.
+        """
+        response = await self._fetch_tilejson(search_id, asset)
+        if response.status_code == 404 and search_id in self._search_payloads:
+            key, payload = self._search_payloads.pop(search_id)
+            logger.info("Search %s is no longer registered; registering it again.", search_id)
+            self.search_cache.discard(key)
+            search_id = await self._register_search(key, payload)
+            response = await self._fetch_tilejson(search_id, asset)
+        response.raise_for_status()
+        return TileJSON.model_validate_json(response.text)
+
+    async def _fetch_tilejson(self, search_id: str, asset: str | None) -> httpx.Response:
+        url = f"{settings.raster_api_url}/searches/{search_id}/{settings.tilejson_path}"
+        return await self.http_client.get(url, params=_tilejson_params(asset))
+
+    async def get_item_tilejson(
+        self, collection_id: str, item_id: str, asset: str | None = None
+    ) -> TileJSON:
+        """Fetch TileJSON metadata for a single STAC item."""
+        url = (
+            f"{settings.raster_api_url}/collections/{collection_id}"
+            f"/items/{item_id}/{settings.tilejson_path}"
+        )
+        response = await self.http_client.get(url, params=_tilejson_params(asset))
+        response.raise_for_status()
+        return TileJSON.model_validate_json(response.text)
+
+    async def get_collections(self, collection_ids: Iterable[str]) -> dict[str, STACCollection]:
+        """Fetch metadata for many collections concurrently.
+
+        Args:
+            collection_ids: The STAC collection identifiers to fetch.
+
+        Returns:
+            A mapping of collection ID to validated collection metadata.
+        """
+        ids = list(collection_ids)
+        collections = await self._gather(self.get_collection(cid) for cid in ids)
+        return dict(zip(ids, collections, strict=True))
+
+    async def get_collections_items(
+        self, collection_ids: Iterable[str]
+    ) -> dict[str, list[STACItem]]:
+        """Fetch all items for many collections concurrently.
+
+        Each collection is paginated sequentially, but up to ``max_concurrency``
+        collections are in flight at once.
+
+        Args:
+            collection_ids: The STAC collection identifiers to fetch items for.
+
+        Returns:
+            A mapping of collection ID to its validated items.
+        """
+        ids = list(collection_ids)
+        items = await self._gather(self.get_collection_items(cid) for cid in ids)
+        return dict(zip(ids, items, strict=True))
+
+    async def _gather(self, aws: Iterable[Awaitable[T]]) -> list[T]:
+        """Await many coroutines with at most ``max_concurrency`` running at once."""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def bounded(aw: Awaitable[T]) -> T:
+            async with semaphore:
+                return await aw
+
+        return await asyncio.gather(*(bounded(aw) for aw in aws))
+
+    async def close(self) -> None:
         """Closes the HTTP client session."""
-        self.http_client.close()
+        await self.http_client.aclose()
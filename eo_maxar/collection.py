@@ -1,13 +1,33 @@
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from functools import cached_property
+from pathlib import Path
 from typing import Literal
 
 import ipyleaflet
 
-from eo_maxar.client import APIClient
+from eo_maxar.cache import canonical_hash
+from eo_maxar.client import (
+    APIClient,
+    DatetimeRange,
+    get_shared_http_client,
+    get_shared_search_cache,
+)
+from eo_maxar.config import settings
 from eo_maxar.models import STACCollection, STACItem, TileJSON
+from eo_maxar.planner import MosaicPlan, plan_mosaic
+from eo_maxar.snapshot import read_items_snapshot, write_items_snapshot
+from eo_maxar.spatial import ItemSpatialIndex
+from eo_maxar.table import ItemTable
+from eo_maxar.temporal import ItemTemporalIndex
 from eo_maxar.visualiser import MapVisualizer
 
+MosaicSpec = tuple[list[float], datetime, Literal["pre", "post"]]
+
+# Lazily computed attributes cleared by ``MaxarCollection.refresh``.
+_CACHED_PROPERTIES = ("info", "items", "item_table", "spatial_index", "temporal_index")
+
 
 class MaxarCollection:
     """A high-level interface to interact with a specific Maxar STAC collection."""
@@ -17,10 +37,22 @@ class MaxarCollection:
         collection_id: str,
         client: APIClient | None = None,
         visualizer: MapVisualizer | None = None,
+        snapshot_path: Path | None = None,
     ):
         self.collection_id = collection_id
-        self._client = client or APIClient()
+        self.snapshot_path = snapshot_path
+        self._owns_client = client is None
+        self._client = client or APIClient(
+            http_client=get_shared_http_client(), search_cache=get_shared_search_cache()
+        )
         self._visualizer = visualizer or MapVisualizer()
+        self._query_cache: dict[str, list[STACItem]] = {}
+
+    def __enter__(self) -> "MaxarCollection":
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
 
     @classmethod
     def create(cls, collection_id: str) -> "MaxarCollection":
@@ -32,11 +64,18 @@ class MaxarCollection:
         Returns:
             A fully wired MaxarCollection instance.
         """
-        return cls(
-            collection_id=collection_id,
-            client=APIClient(),
-            visualizer=MapVisualizer(),
-        )
+        return cls(collection_id=collection_id, visualizer=MapVisualizer())
+
+    def close(self) -> None:
+        """Releases the API client if this collection created it.
+
+        The default client sends requests through the process-wide connection pool
+        from :func:`~eo_maxar.client.get_shared_http_client` and reuses mosaic searches
+        from :func:`~eo_maxar.client.get_shared_search_cache`, which stay open for
+        other collections. Injected clients are left for the caller to close.
+        """
+        if self._owns_client:
+            self._client.close()
 
     @cached_property
     def info(self) -> STACCollection:
@@ -45,16 +84,132 @@ class MaxarCollection:
 
     @cached_property
     def items(self) -> list[STACItem]:
-        """Lazily fetches and caches all items within the collection."""
+        """Lazily fetches and caches all items within the collection.
+
+        Items are read from ``snapshot_path`` when it was given, otherwise from the API.
+        """
+        if self.snapshot_path is not None:
+            return read_items_snapshot(self.snapshot_path)
         return self._client.get_collection_items(self.collection_id)
 
+    def query_items(
+        self,
+        bbox: list[float] | None = None,
+        intersects: dict | None = None,
+        datetime_range: DatetimeRange | None = None,
+        cql2_filter: dict | None = None,
+        fields: Iterable[str] | None = None,
+    ) -> list[STACItem]:
+        """Fetches only the items matching a query, filtered server-side by the STAC API.
+
+        Unlike :attr:`items`, only the matching items are transferred and validated.
+        Results are cached per query until :meth:`refresh` is called. See
+        :meth:`~eo_maxar.client.APIClient.iter_search_items` for the arguments.
+        """
+        fields = list(fields) if fields is not None else None
+        key = canonical_hash([bbox, intersects, datetime_range, cql2_filter, fields])
+        if (items := self._query_cache.get(key)) is None:
+            items = self._client.search_items(
+                self.collection_id, bbox, intersects, datetime_range, cql2_filter, fields
+            )
+            self._query_cache[key] = items
+        return items
+
+    def to_snapshot(self, path: Path) -> Path:
+        """Writes the collection's items to a local GeoParquet snapshot.
+
+        Pass the returned path as ``snapshot_path`` to warm-start a later session
+        without re-reading the collection from the API.
+        """
+        return write_items_snapshot(self.items, path)
+
+    @cached_property
+    def item_table(self) -> ItemTable:
+        """Lazily builds and caches a columnar table of the collection's items.
+
+        Reuses :attr:`items` if it has already been loaded, otherwise the table is
+        built directly from the API page JSON.
+        """
+        if "items" in self.__dict__ or self.snapshot_path is not None:
+            return ItemTable.from_items(self.items)
+        return self._client.get_collection_item_table(self.collection_id)
+
+    @cached_property
+    def spatial_index(self) -> ItemSpatialIndex:
+        """Lazily builds an STRtree over the footprints of :attr:`items`."""
+        return ItemSpatialIndex(self.items)
+
+    @cached_property
+    def temporal_index(self) -> ItemTemporalIndex:
+        """Lazily builds a sorted acquisition-time index over :attr:`items`."""
+        return ItemTemporalIndex(self.items)
+
+    def items_before(self, date: datetime) -> list[STACItem]:
+        """Returns items acquired strictly before ``date``, oldest first."""
+        return self.temporal_index.before(date)
+
+    def items_after(self, date: datetime) -> list[STACItem]:
+        """Returns items acquired at or after ``date``, oldest first."""
+        return self.temporal_index.after(date)
+
+    def items_between(self, start: datetime, end: datetime) -> list[STACItem]:
+        """Returns items acquired in ``[start, end)``, oldest first."""
+        return self.temporal_index.between(start, end)
+
+    def refresh(self) -> None:
+        """Drops cached metadata, items, query results and derived indexes."""
+        for name in _CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
+        self._query_cache.clear()
+
+    def items_intersecting(self, bbox: list[float]) -> list[STACItem]:
+        """Returns the items whose footprint intersects a bounding box.
+
+        Args:
+            bbox: Bounding box [min_lon, min_lat, max_lon, max_lat].
+        """
+        return self.spatial_index.intersecting(bbox)
+
+    def items_containing(self, point: tuple[float, float]) -> list[STACItem]:
+        """Returns the items whose footprint covers a ``(lon, lat)`` point."""
+        return self.spatial_index.containing(point)
+
+    def nearest_item(self, point: tuple[float, float]) -> STACItem | None:
+        """Returns the item whose footprint is closest to a ``(lon, lat)`` point."""
+        return self.spatial_index.nearest(point)
+
+    def iter_items(self) -> Iterator[STACItem]:
+        """Streams the collection's items page by page without caching them.
+
+        If :attr:`items` has already been loaded or comes from a snapshot, it is
+        reused instead of hitting the API.
+        """
+        if "items" in self.__dict__ or self.snapshot_path is not None:
+            yield from self.items
+        else:
+            yield from self._client.iter_collection_items(self.collection_id)
+
     def collection_bbox_map(self, map_kwargs: dict | None = None) -> ipyleaflet.Map:
         """Creates a map showing the footprints of the entire collection."""
         return self._visualizer.create_collection_footprints_map(self.info, map_kwargs)
 
+    def viewport_footprints_map(
+        self, map_kwargs: dict | None = None, max_features: int | None = None
+    ) -> ipyleaflet.Map:
+        """Creates a map that loads item footprints incrementally as the view changes."""
+        return self._visualizer.create_viewport_footprints_map(
+            self.spatial_index, map_kwargs, max_features
+        )
+
+    def vector_footprints_map(self, map_kwargs: dict | None = None) -> ipyleaflet.Map:
+        """Creates a map of the collection's item footprints served as vector tiles."""
+        tilejson = self._client.get_vector_tilejson(self.collection_id)
+        return self._visualizer.create_vector_footprints_map(tilejson, map_kwargs)
+
     def pre_post_map(self, event_date: datetime, map_kwargs: dict | None = None) -> ipyleaflet.Map:
         """Creates a map showing pre-event (blue) and post-event (red) item footprints."""
-        return self._visualizer.create_pre_post_event_map(self.items, event_date, map_kwargs)
+        pre_items, post_items = self.temporal_index.partition(event_date)
+        return self._visualizer.create_partitioned_event_map(pre_items, post_items, map_kwargs)
 
     def single_cog_map(
         self, item_id: str, asset: str | None = None, map_kwargs: dict | None = None
@@ -89,6 +244,63 @@ class MaxarCollection:
         search_id = self._client.register_mosaic(self.collection_id, bbox, filter_args, name)
         return self._client.get_tilejson(search_id)
 
+    def get_mosaic_tilejsons(
+        self, specs: Iterable[MosaicSpec], max_workers: int | None = None
+    ) -> list[TileJSON]:
+        """Registers and resolves many mosaics concurrently.
+
+        Each spec is resolved on a worker thread, so the register and TileJSON round
+        trips for different specs overlap instead of running back to back.
+
+        Args:
+            specs: ``(bbox, event_date, period)`` tuples, as accepted by
+                :meth:`_get_mosaic_tilejson`.
+            max_workers: Maximum number of specs resolved at once. Defaults to
+                ``settings.max_concurrency``.
+
+        Returns:
+            TileJSON metadata for each spec, in the same order as ``specs``.
+        """
+        specs = list(specs)
+        if not specs:
+            return []
+        workers = min(len(specs), max_workers or settings.max_concurrency)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda spec: self._get_mosaic_tilejson(*spec), specs))
+
+    def plan_mosaic(
+        self,
+        bbox: list[float],
+        event_date: datetime,
+        period: Literal["pre", "post"],
+        target_coverage: float = 0.99,
+    ) -> MosaicPlan:
+        """Selects a minimal set of low-cloud, near-nadir items covering a bounding box.
+
+        See :func:`eo_maxar.planner.plan_mosaic` for the selection strategy.
+        """
+        return plan_mosaic(self.items_intersecting(bbox), bbox, event_date, period, target_coverage)
+
+    def planned_mosaic_tilejson(self, plan: MosaicPlan, bbox: list[float], name: str) -> TileJSON:
+        """Registers a mosaic limited to the items in ``plan`` and fetches its TileJSON."""
+        if not plan.item_ids:
+            raise ValueError("Mosaic plan does not contain any items.")
+        search_id = self._client.register_mosaic(self.collection_id, bbox, plan.filter_args(), name)
+        return self._client.get_tilejson(search_id)
+
+    def planned_mosaic_map(
+        self,
+        bbox: list[float],
+        event_date: datetime,
+        period: Literal["pre", "post"],
+        map_kwargs: dict | None = None,
+    ) -> ipyleaflet.Map:
+        """Creates a map of a mosaic built only from the planned covering items."""
+        plan = self.plan_mosaic(bbox, event_date, period)
+        name = "Pre-event (planned)" if period == "pre" else "Post-event (planned)"
+        tilejson = self.planned_mosaic_tilejson(plan, bbox, name)
+        return self._visualizer.create_tile_map(tilejson, map_kwargs)
+
     def pre_event_mosaic_map(
         self, bbox: list[float], event_date: datetime, map_kwargs: dict | None = None
     ) -> ipyleaflet.Map:
@@ -107,6 +319,8 @@ class MaxarCollection:
         self, bbox: list[float], event_date: datetime, map_kwargs: dict | None = None
     ) -> ipyleaflet.Map:
         """Creates a split-view map comparing pre- and post-event mosaics."""
-        pre_tilejson = self._get_mosaic_tilejson(bbox, event_date, "pre")
-        post_tilejson = self._get_mosaic_tilejson(bbox, event_date, "post")
+        pre_tilejson, post_tilejson = self.get_mosaic_tilejsons([
+            (bbox, event_date, "pre"),
+            (bbox, event_date, "post"),
+        ])
         return self._visualizer.create_split_map(pre_tilejson, post_tilejson, map_kwargs)
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 from pydantic import computed_field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -9,6 +10,8 @@ class Settings(BaseSettings):
 
     stac_api_url: str = "http://localhost:8081"
     raster_api_url: str = "http://localhost:8082"
+    vector_api_url: str = "http://localhost:8083"
+    vector_items_table: str = "pgstac.items"
     tilejson_path: str = "WebMercatorQuad/tilejson.json"
 
     postgres_user: str = "username"
@@ -28,6 +31,17 @@ class Settings(BaseSettings):
 
     default_data_dir: Path = Path("data")
     files_to_load: list[str] = ["collections.json.zip", "items.json.zip"]
+    loader_batch_size: int = 10_000
+    loader_pool_size: int = 4
+    loader_incremental: bool = True
+    loader_max_workers: int = 4
+    loader_count_existing: bool = False
+    loader_summary_path: Path | None = Path(".cache/eo_maxar/load_summary.json")
+    pgstac_context: bool = False
+    pgstac_maintenance: bool = True
+    pgstac_partition_trunc: Literal["year", "month"] | None = "month"
+    pgstac_pool_size: int = 4
+    pgstac_itersize: int = 1000
 
     map_layout: dict = {"height": "700px"}
 
@@ -35,7 +49,26 @@ class Settings(BaseSettings):
     min_zoom: int = 12
     max_zoom: int = 22
     default_asset: str = "visual"
+    footprint_precision: int | None = 6
+    footprint_simplify_zoom: int | None = None
+    viewport_max_features: int = 500
+    prefetch_max_tiles: int = 10_000
     pagination_limit: int = 100
+    max_concurrency: int = 8
+    prefetch_pages: bool = False
+
+    http_max_connections: int = 20
+    http_max_keepalive_connections: int = 10
+    http_keepalive_expiry: float = 30.0
+    http2: bool = False
+
+    http_cache_dir: Path = Path(".cache/eo_maxar")
+    http_cache_ttl: int = 24 * 60 * 60
+    http_cache_max_bytes: int = 512 * 1024 * 1024
+    mosaic_search_cache_persistent: bool = True
+    tile_cache_max_bytes: int = 1024 * 1024 * 1024
+    tile_proxy_host: str = "127.0.0.1"
+    tile_proxy_port: int = 0
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="ignore")
 
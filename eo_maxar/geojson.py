@@ -2,6 +2,18 @@
 
 from __future__ import annotations
 
+import json
+from collections.abc import Iterable, Sequence
+
+import numpy as np
+import shapely
+
+from eo_maxar.models import STACItem
+from eo_maxar.spatial import item_footprint
+
+# Web Mercator tile size in pixels, used to relate zoom levels to ground resolution.
+_TILE_SIZE = 256
+
 
 def bbox_to_polygon_geometry(bbox: list[float]) -> dict:
     """Convert a bounding box to a GeoJSON Polygon geometry.
@@ -48,3 +60,56 @@ def bboxes_to_feature_collection(bboxes: list[list[float]], main_bbox: list[floa
             for bbox in bboxes
         ],
     }
+
+
+def tolerance_for_zoom(zoom: int, pixels: float = 1.0) -> float:
+    """Approximate size in degrees of ``pixels`` screen pixels at a Web Mercator zoom.
+
+    Args:
+        zoom: Web Mercator zoom level.
+        pixels: Number of screen pixels the tolerance should span.
+
+    Returns:
+        A simplification tolerance in degrees of longitude.
+    """
+    return pixels * 360 / (_TILE_SIZE * 2**zoom)
+
+
+def items_to_footprint_collection(
+    items: Iterable[STACItem],
+    properties: Sequence[str] = ("datetime",),
+    precision: int | None = None,
+    zoom: int | None = None,
+) -> dict:
+    """Convert STAC items to a slim GeoJSON FeatureCollection of their footprints.
+
+    Only the geometry, item ID and the requested properties are kept; assets and
+    links are dropped.
+
+    Args:
+        items: The items to serialise.
+        properties: Item property keys to copy onto each feature.
+        precision: If set, round coordinates to this many decimal places.
+        zoom: If set, simplify footprints with Douglas-Peucker to roughly one pixel
+            at this zoom level. Footprints that would collapse are kept as-is.
+
+    Returns:
+        GeoJSON FeatureCollection dict.
+    """
+    tolerance = tolerance_for_zoom(zoom) if zoom is not None else None
+    features = []
+    for item in items:
+        geometry = item_footprint(item)
+        if tolerance is not None:
+            simplified = shapely.simplify(geometry, tolerance, preserve_topology=False)
+            if not simplified.is_empty:
+                geometry = simplified
+        if precision is not None:
+            geometry = shapely.transform(geometry, lambda coords: np.round(coords, precision))
+        features.append({
+            "type": "Feature",
+            "id": item.id,
+            "geometry": json.loads(shapely.to_geojson(geometry)),
+            "properties": {key: item.properties.get(key) for key in properties},
+        })
+    return {"type": "FeatureCollection", "features": features}
@@ -1,22 +1,395 @@
+import io
+import json
 import logging
-import subprocess
+import multiprocessing
+import time
 import zipfile
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from datetime import UTC, datetime
 from pathlib import Path
+from typing import Any, Literal, TextIO
 
 import psycopg
-from psycopg import sql
+from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
+from pydantic import BaseModel, computed_field
+from pypgstac.db import PgstacDB
+from pypgstac.load import Loader, Methods, chunked_iterable
 
 from eo_maxar.config import Settings
+from eo_maxar.manifest import LoadManifest, file_digest, record_checksums, record_key
+from eo_maxar.table import CLOUD_PERCENT_PROPERTY, GSD_PROPERTY, OFF_NADIR_PROPERTY
 
 logger = logging.getLogger(__name__)
 
+# Item properties registered as pgSTAC queryables, each indexed on every partition so
+# the CQL2 filters and sorts issued for mosaics can use an index.
+QUERYABLES: list[dict] = [
+    {
+        "name": "datetime",
+        "definition": {
+            "description": "Datetime",
+            "type": "string",
+            "title": "Acquired",
+            "format": "date-time",
+            "pattern": "(\\+00:00|Z)$",
+        },
+        "wrapper": None,
+        "index": "BTREE",
+    },
+    {
+        "name": CLOUD_PERCENT_PROPERTY,
+        "definition": {"type": "number", "title": "Cloud cover (%)", "minimum": 0, "maximum": 100},
+        "wrapper": "to_float",
+        "index": "BTREE",
+    },
+    {
+        "name": OFF_NADIR_PROPERTY,
+        "definition": {"type": "number", "title": "Off-nadir angle", "minimum": 0, "maximum": 90},
+        "wrapper": "to_float",
+        "index": "BTREE",
+    },
+    {
+        "name": GSD_PROPERTY,
+        "definition": {"type": "number", "title": "Ground sample distance", "minimum": 0},
+        "wrapper": "to_float",
+        "index": "BTREE",
+    },
+]
+
+# Suffixes of archive members and files that hold STAC JSON or NDJSON records.
+_RECORD_SUFFIXES = (".json", ".ndjson", ".jsonl", ".geojson")
+_READ_CHUNK_SIZE = 1024 * 1024
+
+
+class _JsonReader:
+    """A buffered reader that decodes JSON values from a text stream one at a time."""
+
+    def __init__(self, stream: TextIO, chunk_size: int) -> None:
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self, size: int) -> bool:
+        """Append up to ``size`` characters to the unread part of the buffer."""
+        chunk = self.stream.read(size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or ``""`` at the end."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos].isspace():
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if self.eof or not self._fill(self.chunk_size):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consume ``char`` as the next non-whitespace character."""
+        if self.peek() != char:
+            raise json.JSONDecodeError(f"Expecting {char!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    def _raw_decode(self) -> tuple[Any, int] | None:
+        """Decode the value at ``pos`` if it is complete in the buffer."""
+        try:
+            value, end = self.decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            return None
+        # A number or literal ending at the buffer edge may continue in the next chunk.
+        if end == len(self.buffer) and not self.eof and self.buffer[end - 1] not in '}]"':
+            return None
+        return value, end
+
+    def decode_buffered(self) -> tuple[bool, Any]:
+        """Decode the next value only if it is already complete in the buffer.
+
+        Returns:
+            ``(True, value)``, or ``(False, None)`` if more input is needed.
+        """
+        self.peek()
+        if (decoded := self._raw_decode()) is None:
+            return False, None
+        value, self.pos = decoded
+        return True, value
+
+    def decode(self) -> Any:
+        """Decode the next value, reading more of the stream while it is incomplete.
+
+        Each refill reads at least as much as is already buffered, so a value spanning
+        many chunks is re-parsed a logarithmic number of times rather than once per
+        chunk.
+        """
+        self.peek()
+        while (decoded := self._raw_decode()) is None:
+            if self.eof or not self._fill(max(self.chunk_size, len(self.buffer) - self.pos)):
+                # Re-raise the decoder's error for the truncated value.
+                self.decoder.raw_decode(self.buffer, self.pos)
+        value, self.pos = decoded
+        return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the elements of the array whose ``[`` has just been consumed."""
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.pos += 1
+                return
+            if char == ",":
+                self.pos += 1
+            elif not char:
+                raise json.JSONDecodeError("Unterminated array", self.buffer, self.pos)
+            else:
+                yield self.decode()
+
+    def iter_document(self) -> Iterator[dict]:
+        """Decode a large top-level object key by key.
+
+        A ``features`` array is streamed element by element unless the object has
+        already been seen to be something other than a ``FeatureCollection``. Any
+        other object is yielded whole once complete.
+        """
+        self.expect("{")
+        record: dict = {}
+        streamed = False
+        while (char := self.peek()) != "}":
+            if char == ",":
+                self.pos += 1
+                continue
+            key = self.decode()
+            self.expect(":")
+            is_collection = record.get("type", "FeatureCollection") == "FeatureCollection"
+            if key == "features" and is_collection and self.peek() == "[":
+                self.pos += 1
+                yield from self.iter_array()
+                streamed = True
+            else:
+                record[key] = self.decode()
+        self.pos += 1
+        if not streamed:
+            yield record
+
+
+def iter_json_records(stream: TextIO, chunk_size: int = _READ_CHUNK_SIZE) -> Iterator[dict]:
+    """Incrementally parse records from a JSON array, NDJSON or single JSON document.
+
+    The stream is read ``chunk_size`` characters at a time and decoded one record at
+    a time, so memory use is bounded by the largest record rather than the file. The
+    features of a top-level ``FeatureCollection`` are streamed one by one in the same
+    way as the elements of an array.
+
+    Args:
+        stream: Text stream to read from.
+        chunk_size: Number of characters to read per refill.
+
+    Yields:
+        One dict per collection or item.
+
+    Raises:
+        json.JSONDecodeError: If the stream ends in the middle of a record.
+    """
+    reader = _JsonReader(stream, chunk_size)
+    if reader.peek() == "[":
+        reader.pos += 1
+        yield from reader.iter_array()
+        return
+    while reader.peek():
+        complete, record = reader.decode_buffered()
+        if not complete:
+            # Too large for the buffer, e.g. a whole FeatureCollection.
+            yield from reader.iter_document()
+        elif isinstance(record, dict) and record.get("type") == "FeatureCollection":
+            yield from record.get("features", [])
+        else:
+            yield record
+
+
+def _is_record_member(name: str) -> bool:
+    """Whether an archive member holds records, skipping directories and macOS junk."""
+    path = Path(name)
+    return (
+        not name.endswith("/")
+        and "__MACOSX" not in path.parts
+        and not path.name.startswith(".")
+        and path.suffix in _RECORD_SUFFIXES
+    )
+
+
+def iter_file_records(path: Path) -> Iterator[dict]:
+    """Stream records from a JSON/NDJSON file or every record file in a zip archive.
+
+    Zip members are decompressed and parsed on the fly without being extracted.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as archive:
+            for name in archive.namelist():
+                if not _is_record_member(name):
+                    continue
+                with archive.open(name) as member:
+                    yield from iter_json_records(io.TextIOWrapper(member, encoding="utf-8"))
+    else:
+        with path.open(encoding="utf-8") as stream:
+            yield from iter_json_records(stream)
+
+
+class BatchTiming(BaseModel):
+    """Timing of one batch of records written to pgSTAC.
+
+    ``rows`` were sent to pgSTAC, of which ``existing`` were already present and
+    ignored. ``existing`` costs an extra query per batch, so it is only counted for
+    insert-ignore loads with ``settings.loader_count_existing`` set and is 0 otherwise.
+    ``skipped`` records were left out because the load manifest showed
+    them unchanged. ``parse_seconds`` is the time spent reading and decoding the
+    batch and ``seconds`` the time spent writing it.
+    """
+
+    item_type: str
+    file: str
+    batch: int
+    rows: int
+    skipped: int = 0
+    existing: int = 0
+    parse_seconds: float = 0.0
+    seconds: float
+
+    @property
+    def inserted(self) -> int:
+        return self.rows - self.existing
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+class FileLoadResult(BaseModel):
+    """Outcome of loading one file.
+
+    ``status`` is ``"loaded"``, ``"unchanged"`` (skipped by the manifest),
+    ``"missing"`` or ``"failed"``, in which case ``error`` holds the message.
+    """
+
+    path: str
+    item_type: str
+    status: Literal["loaded", "unchanged", "missing", "failed"] = "loaded"
+    bytes_read: int = 0
+    written: int = 0
+    skipped: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+    batches: list[BatchTiming] = []
+
+
+class StageMetrics(BaseModel):
+    """Throughput of one stage of :meth:`DataLoader.run`.
+
+    The ``parse`` stage sums the time every worker spent decoding records, so with
+    parallel workers it can exceed the wall time of the ``load`` stage that contains
+    it.
+    """
+
+    stage: str
+    seconds: float = 0.0
+    bytes_read: int = 0
+    records: int = 0
+    inserted: int = 0
+    ignored: int = 0
+
+    @computed_field
+    @property
+    def records_per_second(self) -> float:
+        return self.records / self.seconds if self.seconds else 0.0
+
+
+class LoadSummary(BaseModel):
+    """Metrics for a full :meth:`DataLoader.run`, written as JSON when it finishes."""
+
+    started_at: datetime
+    seconds: float
+    stages: list[StageMetrics]
+    files: list[FileLoadResult]
+
+
+def _load_file_in_worker(settings: Settings, item_type: str, path: Path) -> FileLoadResult:
+    """Load one file in a worker process with its own loader and connection pool."""
+    loader = DataLoader(settings)
+    try:
+        return loader._load_file(item_type, path)
+    finally:
+        loader.close()
+
 
 class DataLoader:
-    """Handles unzipping and loading STAC data into the pgSTAC database."""
+    """Handles loading STAC data into the pgSTAC database.
+
+    Records are streamed straight out of the files in ``settings.files_to_load``
+    (zip archives are read without extracting) and written in-process with
+    pypgstac's :class:`~pypgstac.load.Loader` over a ``psycopg_pool`` connection
+    pool, in batches of ``settings.loader_batch_size``. Each batch's timing is kept
+    in :attr:`batch_timings`. Several files are loaded in parallel worker processes;
+    see :meth:`load_paths`.
+
+    With ``settings.loader_incremental`` enabled, a :class:`~eo_maxar.manifest.LoadManifest`
+    is consulted so unchanged files are skipped outright and, in changed files, only
+    new or modified records are upserted.
+
+    Args:
+        settings: Application settings.
+        pool: Connection pool to load over. Created from the settings if omitted.
+        progress: Called with each :class:`BatchTiming` as batches complete. Batches
+            loaded in worker processes are reported when their file finishes.
+    """
 
-    def __init__(self, settings: Settings):
+    def __init__(
+        self,
+        settings: Settings,
+        pool: ConnectionPool | None = None,
+        progress: Callable[[BatchTiming], None] | None = None,
+    ):
         self.settings = settings
         self.data_path = self.settings.default_data_dir
+        self.progress = progress
+        self.batch_timings: list[BatchTiming] = []
+        self.file_results: list[FileLoadResult] = []
+        self.stages: list[StageMetrics] = []
+        self._pool = pool
+        self._owns_pool = pool is None
+        self._manifest: LoadManifest | None = None
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Connection pool used for loading, opened on first use."""
+        if self._pool is None:
+            self._pool = ConnectionPool(
+                self.settings.database_dsn,
+                min_size=1,
+                max_size=self.settings.loader_pool_size,
+                open=True,
+            )
+        return self._pool
+
+    @property
+    def manifest(self) -> LoadManifest:
+        """Manifest of previously loaded files and records."""
+        if self._manifest is None:
+            self._manifest = LoadManifest(self.pool)
+        return self._manifest
+
+    def close(self) -> None:
+        """Close the connection pool if this loader created it."""
+        if self._owns_pool and self._pool is not None:
+            self._pool.close()
+            self._pool = None
+            self._manifest = None
 
     def health_check(self) -> bool:
         """Verify the database is reachable before attempting to load.
@@ -32,25 +405,86 @@ class DataLoader:
             logger.error("Database health check failed: %s", e)
             return False
 
-    def run(self) -> None:
-        """Executes the full data loading and configuration workflow."""
+    def run(self, paths: Iterable[Path] | None = None) -> LoadSummary:
+        """Executes the full data loading and configuration workflow.
+
+        A :class:`LoadSummary` is written to ``settings.loader_summary_path`` when the
+        run finishes, including when it fails.
+
+        Args:
+            paths: Files or directories to load. Defaults to ``settings.files_to_load``
+                inside the data directory.
+
+        Returns:
+            Per-stage and per-file metrics for the run.
+        """
         logger.info("Starting data loading and setup process...")
-        self._unzip_files()
-        self._load_data_to_pgstac()
-        self._configure_pgstac_context()
+        started_at = datetime.now(UTC)
+        start = time.perf_counter()
+        self.stages = []
+        try:
+            self._run_stage("load", self._load_data_to_pgstac, paths)
+            self._run_stage("configure", self._configure_pgstac_context)
+            if self.settings.pgstac_maintenance:
+                self._run_stage("maintenance", self._run_maintenance)
+        finally:
+            self.close()
+            summary = self._summarise(started_at, time.perf_counter() - start)
+            self._write_summary(summary)
         logger.info("Data loading process completed successfully.")
+        return summary
 
-    def _unzip_files(self) -> None:
-        """Unzips all required data files from the settings."""
-        self.data_path.mkdir(exist_ok=True)
-        for file_name in self.settings.files_to_load:
-            zip_path = self.data_path / file_name
-            if zip_path.exists():
-                logger.info("Unzipping %s...", zip_path)
-                with zipfile.ZipFile(zip_path, "r") as zip_ref:
-                    zip_ref.extractall(self.data_path)
-            else:
-                logger.warning("File not found, skipping unzip: %s", zip_path)
+    def _run_stage(self, stage: str, func: Callable[..., object], *args: object) -> None:
+        """Call one stage of :meth:`run`, recording its wall time even if it fails."""
+        start = time.perf_counter()
+        try:
+            func(*args)
+        finally:
+            self.stages.append(StageMetrics(stage=stage, seconds=time.perf_counter() - start))
+
+    def _summarise(self, started_at: datetime, seconds: float) -> LoadSummary:
+        """Combine stage wall times with the per-batch counts into a summary."""
+        batches = self.batch_timings
+        records = sum(b.rows + b.skipped for b in batches)
+        parse = StageMetrics(
+            stage="parse",
+            seconds=sum(b.parse_seconds for b in batches),
+            bytes_read=sum(r.bytes_read for r in self.file_results),
+            records=records,
+        )
+        stages = [parse]
+        for stage in self.stages:
+            if stage.stage == "load":
+                stage = stage.model_copy(
+                    update={
+                        "records": records,
+                        "inserted": sum(b.inserted for b in batches),
+                        "ignored": sum(b.existing + b.skipped for b in batches),
+                    }
+                )
+            stages.append(stage)
+        return LoadSummary(
+            started_at=started_at, seconds=seconds, stages=stages, files=self.file_results
+        )
+
+    def _write_summary(self, summary: LoadSummary) -> None:
+        """Log the summary and write it as JSON to ``settings.loader_summary_path``."""
+        for stage in summary.stages:
+            logger.info(
+                "Stage %s: %.2fs, %d records (%.0f/s), %d inserted, %d ignored, %d bytes read",
+                stage.stage,
+                stage.seconds,
+                stage.records,
+                stage.records_per_second,
+                stage.inserted,
+                stage.ignored,
+                stage.bytes_read,
+            )
+        path = self.settings.loader_summary_path
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(summary.model_dump_json(indent=2))
+            logger.info("Wrote load summary to %s", path)
 
     @staticmethod
     def _item_type_from_filename(file_zip: str) -> str:
@@ -64,69 +498,338 @@ class DataLoader:
         """
         return Path(file_zip).name.split(".")[0]
 
-    def _load_data_to_pgstac(self) -> None:
-        """Loads collections and items into pgSTAC using the pypgstac CLI."""
-        for file_zip in self.settings.files_to_load:
-            item_type = self._item_type_from_filename(file_zip)
-            file_path = self.data_path / f"{item_type}.json"
-
-            if not file_path.exists():
-                logger.warning(
-                    "%s file not found, skipping load: %s",
-                    item_type.capitalize(),
-                    file_path,
+    @classmethod
+    def _table_for(cls, path: Path) -> str:
+        """Return the pgSTAC table a file loads into: ``"collections"`` or ``"items"``."""
+        is_collections = cls._item_type_from_filename(path.name) == "collections"
+        return "collections" if is_collections else "items"
+
+    @staticmethod
+    def _expand_paths(paths: Iterable[Path]) -> list[Path]:
+        """Replace directories with the record files and archives found beneath them."""
+        files: list[Path] = []
+        for path in paths:
+            if path.is_dir():
+                files.extend(
+                    sorted(
+                        p
+                        for p in path.rglob("*")
+                        if p.is_file()
+                        and not p.name.startswith(".")
+                        and "__MACOSX" not in p.parts
+                        and (p.suffix == ".zip" or p.suffix in _RECORD_SUFFIXES)
+                    )
                 )
-                continue
+            else:
+                files.append(path)
+        return files
 
-            logger.info("Loading %s from %s into pgSTAC...", item_type, file_path)
+    def load_paths(
+        self, paths: Iterable[Path], max_workers: int | None = None
+    ) -> list[FileLoadResult]:
+        """Load many files or directories, in parallel worker processes.
 
-            command = [
-                "pypgstac",
-                "load",
-                item_type,
-                str(file_path),
-                "--dsn",
-                self.settings.database_dsn,
-                "--method",
-                "insert_ignore",
+        Collection files are loaded first, then item files, so items never reference
+        a collection that is not yet in the database. Within each phase up to
+        ``max_workers`` files load concurrently, each in its own process with its own
+        connection pool. A failing file does not stop the others.
+
+        Args:
+            paths: Files or directories. Files named ``collections.*`` hold
+                collections; every other file holds items.
+            max_workers: Maximum worker processes. Defaults to
+                ``settings.loader_max_workers``.
+
+        Returns:
+            One result per file, collections first.
+        """
+        files = self._expand_paths(paths)
+        results: list[FileLoadResult] = []
+        for item_type in ("collections", "items"):
+            group = [path for path in files if self._table_for(path) == item_type]
+            results.extend(self._load_group(item_type, group, max_workers))
+        return results
+
+    def _load_group(
+        self, item_type: str, files: list[Path], max_workers: int | None
+    ) -> list[FileLoadResult]:
+        """Load files of one type, in a process pool when more than one worker is useful."""
+        workers = min(max_workers or self.settings.loader_max_workers, len(files))
+        if workers <= 1:
+            return [self._load_file(item_type, path) for path in files]
+
+        if self.settings.loader_incremental:
+            # Create the manifest tables once here, as concurrent CREATE TABLE IF NOT
+            # EXISTS statements from the workers can fail with a unique violation.
+            self.manifest.ensure_schema()
+        results: list[FileLoadResult] = []
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(_load_file_in_worker, self.settings, item_type, path)
+                for path in files
             ]
+            for path, future in zip(files, futures, strict=True):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = FileLoadResult(
+                        path=str(path), item_type=item_type, status="failed", error=str(e)
+                    )
+                self.batch_timings.extend(result.batches)
+                if self.progress is not None:
+                    for timing in result.batches:
+                        self.progress(timing)
+                results.append(result)
+        return results
 
-            result = subprocess.run(  # noqa: S603
-                command, capture_output=True, text=True, check=False
+    def _load_data_to_pgstac(self, paths: Iterable[Path] | None = None) -> None:
+        """Streams collections and items from their files into pgSTAC.
+
+        Raises:
+            RuntimeError: If any file failed to load, listing every failure.
+        """
+        if paths is None:
+            paths = [self.data_path / name for name in self.settings.files_to_load]
+        results = self.load_paths(paths)
+        self.file_results = results
+        failures = [result for result in results if result.status == "failed"]
+        if failures:
+            error_message = "\n".join(
+                f"pypgstac failed for {result.path}: {result.error}" for result in failures
             )
+            logger.error(error_message)
+            raise RuntimeError(error_message)
 
-            if result.returncode != 0:
-                error_message = (
-                    f"pypgstac failed for {file_path}.\n"
-                    f"Stdout: {result.stdout}\n"
-                    f"Stderr: {result.stderr}"
+    def _load_file(self, item_type: str, file_path: Path) -> FileLoadResult:
+        """Load one file, skipping it if the manifest shows it is unchanged."""
+        result = FileLoadResult(path=str(file_path), item_type=item_type)
+        if not file_path.exists():
+            logger.warning(
+                "%s file not found, skipping load: %s", item_type.capitalize(), file_path
+            )
+            result.status = "missing"
+            return result
+
+        logger.info("Loading %s from %s into pgSTAC...", item_type, file_path)
+        result.bytes_read = file_path.stat().st_size
+        start = time.perf_counter()
+        first_batch = len(self.batch_timings)
+        try:
+            manifest = self.manifest if self.settings.loader_incremental else None
+            digest = ""
+            if manifest is not None:
+                digest = file_digest(file_path)
+                if manifest.is_loaded(file_path, digest):
+                    logger.info("%s is unchanged since it was last loaded, skipping.", file_path)
+                    result.status = "unchanged"
+                    return result
+
+            result.written, result.skipped = self._load_records(
+                item_type, str(file_path), iter_file_records(file_path), manifest
+            )
+            if manifest is not None:
+                manifest.record_file(file_path, digest, item_type, result.written + result.skipped)
+        except Exception as e:
+            logger.error("pypgstac failed for %s: %s", file_path, e)
+            result.status = "failed"
+            result.error = str(e)
+        finally:
+            result.seconds = time.perf_counter() - start
+            result.batches = self.batch_timings[first_batch:]
+
+        if result.status == "loaded":
+            logger.info(
+                "Successfully loaded %d %s (%d unchanged).",
+                result.written,
+                item_type,
+                result.skipped,
+            )
+        return result
+
+    def _load_records(
+        self,
+        item_type: str,
+        source: str,
+        records: Iterable[dict],
+        manifest: LoadManifest | None = None,
+    ) -> tuple[int, int]:
+        """Write records to pgSTAC in batches, recording a timing per batch.
+
+        Args:
+            item_type: ``"collections"`` or ``"items"``.
+            source: Name of the file the records came from, for reporting.
+            records: Collection or item dicts.
+            manifest: When given, records whose checksum matches the manifest are
+                skipped and the rest are upserted. Otherwise every record is
+                inserted, ignoring ones that already exist.
+
+        Returns:
+            The number of records written and the number skipped as unchanged.
+        """
+        batch_size = self.settings.loader_batch_size
+        insert_mode = Methods.upsert if manifest is not None else Methods.insert_ignore
+        written = skipped = 0
+        batches = chunked_iterable(records, batch_size)
+        with PgstacDB(pool=self.pool) as db:
+            loader = Loader(db=db)
+            number = 0
+            while True:
+                parse_start = time.perf_counter()
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                number += 1
+                start = time.perf_counter()
+                pending = list(batch)
+                checksums = {}
+                existing = 0
+                if manifest is not None:
+                    checksums = record_checksums(pending)
+                    changed = manifest.changed(item_type, checksums)
+                    pending = [record for record in pending if record_key(record) in changed]
+                    checksums = {key: checksums[key] for key in changed}
+                elif pending and self.settings.loader_count_existing:
+                    existing = self._count_existing(db, item_type, pending)
+
+                if pending and item_type == "collections":
+                    loader.load_collections(iter(pending), insert_mode=insert_mode)
+                elif pending:
+                    loader.load_items(iter(pending), insert_mode=insert_mode, chunksize=batch_size)
+                if manifest is not None:
+                    manifest.record_items(item_type, checksums)
+
+                timing = BatchTiming(
+                    item_type=item_type,
+                    file=source,
+                    batch=number,
+                    rows=len(pending),
+                    skipped=len(batch) - len(pending),
+                    existing=existing,
+                    parse_seconds=start - parse_start,
+                    seconds=time.perf_counter() - start,
                 )
-                logger.error(error_message)
-                raise RuntimeError(error_message)
+                self.batch_timings.append(timing)
+                if self.progress is not None:
+                    self.progress(timing)
+                logger.info(
+                    "Loaded %s batch %d: %d inserted, %d ignored, %d unchanged "
+                    "in %.2fs (%.0f rows/s)",
+                    item_type,
+                    timing.batch,
+                    timing.inserted,
+                    timing.existing,
+                    timing.skipped,
+                    timing.seconds,
+                    timing.rows_per_second,
+                )
+                written += timing.rows
+                skipped += timing.skipped
+        return written, skipped
+
+    @staticmethod
+    def _count_existing(db: PgstacDB, item_type: str, records: list[dict]) -> int:
+        """Count records already in pgSTAC, which an insert-ignore load will skip."""
+        if item_type == "collections":
+            count = db.query_one(
+                "SELECT count(*) FROM collections WHERE id = ANY(%s);",
+                [[record["id"] for record in records]],
+            )
+        else:
+            keys = [record_key(record) for record in records]
+            count = db.query_one(
+                """
+                SELECT count(*) FROM items i
+                JOIN unnest(%s::text[], %s::text[]) AS k(collection, id)
+                    ON i.collection = k.collection AND i.id = k.id;
+                """,
+                [[collection for collection, _ in keys], [id_ for _, id_ in keys]],
+            )
+        return int(count or 0)
 
-            logger.info("Successfully loaded %s.", item_type)
-            if result.stdout:
-                logger.debug("pypgstac stdout: %s", result.stdout)
+    def _connect(self) -> psycopg.Connection:
+        """Open an autocommit connection with the pgSTAC search path."""
+        return psycopg.connect(
+            self.settings.database_dsn,
+            autocommit=True,
+            options="-c search_path=pgstac,public -c application_name=pgstac",
+        )
 
     def _configure_pgstac_context(self) -> None:
-        """Connects to the database to enable the pgstac context setting."""
-        logger.info("Configuring pgSTAC 'context' setting...")
+        """Connects to the database to set the pgstac context setting.
+
+        ``context`` makes every search count its total matches, which slows searches
+        down, so it is only turned on when ``settings.pgstac_context`` is set.
+        """
+        value = "on" if self.settings.pgstac_context else "off"
+        logger.info("Setting pgSTAC 'context' to '%s'...", value)
         try:
-            with (
-                psycopg.connect(
-                    self.settings.database_dsn,
-                    autocommit=True,
-                    options="-c search_path=pgstac,public -c application_name=pgstac",
-                ) as conn,
-                conn.cursor() as cursor,
-            ):
+            with self._connect() as conn, conn.cursor() as cursor:
                 pgstac_settings_sql = """
                     INSERT INTO pgstac_settings (name, value)
-                    VALUES ('context', 'on')
+                    VALUES ('context', %s)
                     ON CONFLICT (name) DO UPDATE SET value = excluded.value;
                 """
-                cursor.execute(sql.SQL(pgstac_settings_sql))
-            logger.info("Successfully enabled pgSTAC context.")
+                cursor.execute(pgstac_settings_sql, (value,))
+            logger.info("Successfully set pgSTAC context to '%s'.", value)
         except psycopg.Error as e:
             logger.exception("Database configuration failed: %s", e)
             raise
+
+    def _run_maintenance(self) -> None:
+        """Tune pgSTAC for the loaded data.
+
+        Sets every collection's ``partition_trunc`` to ``settings.pgstac_partition_trunc``
+        (pgSTAC repartitions existing items when this changes), registers
+        :data:`QUERYABLES` so their indexes are created on every partition, and
+        refreshes planner statistics with ``ANALYZE``.
+        """
+        logger.info("Running pgSTAC maintenance...")
+        try:
+            with self._connect() as conn, conn.cursor() as cursor:
+                partition_trunc = self.settings.pgstac_partition_trunc
+                if partition_trunc is not None:
+                    cursor.execute(
+                        """
+                        UPDATE collections SET partition_trunc = %s
+                        WHERE partition_trunc IS DISTINCT FROM %s;
+                        """,
+                        (partition_trunc, partition_trunc),
+                    )
+                    logger.info(
+                        "Set %s partitioning on %d collections.", partition_trunc, cursor.rowcount
+                    )
+
+                for queryable in QUERYABLES:
+                    params = {**queryable, "definition": Jsonb(queryable["definition"])}
+                    # Statements with parameters cannot be batched into one execute.
+                    cursor.execute(
+                        """
+                        UPDATE queryables
+                        SET definition = %(definition)s,
+                            property_wrapper = %(wrapper)s,
+                            property_index_type = %(index)s
+                        WHERE name = %(name)s AND collection_ids IS NULL;
+                        """,
+                        params,
+                    )
+                    cursor.execute(
+                        """
+                        INSERT INTO queryables
+                            (name, definition, property_wrapper, property_index_type)
+                        SELECT %(name)s, %(definition)s, %(wrapper)s, %(index)s
+                        WHERE NOT EXISTS (
+                            SELECT 1 FROM queryables
+                            WHERE name = %(name)s AND collection_ids IS NULL
+                        );
+                        """,
+                        params,
+                    )
+                cursor.execute("SELECT maintain_partitions();")
+                cursor.execute("ANALYZE collections;")
+                cursor.execute("ANALYZE items;")
+            logger.info("pgSTAC maintenance completed.")
+        except psycopg.Error as e:
+            logger.exception("Database maintenance failed: %s", e)
+            raise
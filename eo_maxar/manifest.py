@@ -0,0 +1,146 @@
+"""Load manifest recording what has already been written to pgSTAC.
+
+The manifest lives in the same database as pgSTAC, so recreating the database also
+resets it. Two side tables are kept in the ``public`` schema:
+
+* ``eo_maxar_load_manifest`` holds the SHA-256 digest of every file loaded, so an
+  unchanged file can be skipped without reading it.
+* ``eo_maxar_record_checksums`` holds a checksum per collection and item, so a
+  changed file only writes the records that are new or differ from what is stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections.abc import Iterable
+from pathlib import Path
+
+from psycopg_pool import ConnectionPool
+
+from eo_maxar.cache import canonical_hash
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS public.eo_maxar_load_manifest (
+    path text PRIMARY KEY,
+    sha256 text NOT NULL,
+    item_type text NOT NULL,
+    records integer NOT NULL,
+    loaded_at timestamptz NOT NULL DEFAULT now()
+);
+CREATE TABLE IF NOT EXISTS public.eo_maxar_record_checksums (
+    item_type text NOT NULL,
+    collection text NOT NULL,
+    id text NOT NULL,
+    checksum text NOT NULL,
+    PRIMARY KEY (item_type, collection, id)
+);
+"""
+
+# (collection, id) identifying a record. Collections use an empty collection.
+RecordKey = tuple[str, str]
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(1024 * 1024):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def record_key(record: dict) -> RecordKey:
+    """Return the ``(collection, id)`` key of a collection or item record."""
+    if record.get("type") == "Collection":
+        return "", record["id"]
+    return record.get("collection") or "", record["id"]
+
+
+def record_checksums(records: Iterable[dict]) -> dict[RecordKey, str]:
+    """Map each record's key to a checksum of its canonical JSON."""
+    return {record_key(record): canonical_hash(record) for record in records}
+
+
+class LoadManifest:
+    """Reads and updates the load manifest tables over a connection pool."""
+
+    def __init__(self, pool: ConnectionPool) -> None:
+        self.pool = pool
+        self._ready = False
+
+    def ensure_schema(self) -> None:
+        """Create the manifest tables if they do not exist yet."""
+        if not self._ready:
+            with self.pool.connection() as conn:
+                conn.execute(_SCHEMA)
+            self._ready = True
+
+    def is_loaded(self, path: Path, digest: str) -> bool:
+        """Whether ``path`` was last loaded with exactly this content digest."""
+        self.ensure_schema()
+        with self.pool.connection() as conn:
+            row = conn.execute(
+                "SELECT sha256 FROM public.eo_maxar_load_manifest WHERE path = %s",
+                (str(path),),
+            ).fetchone()
+        return row is not None and row[0] == digest
+
+    def record_file(self, path: Path, digest: str, item_type: str, records: int) -> None:
+        """Mark a file as fully loaded."""
+        self.ensure_schema()
+        with self.pool.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO public.eo_maxar_load_manifest (path, sha256, item_type, records)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (path) DO UPDATE SET
+                    sha256 = EXCLUDED.sha256,
+                    item_type = EXCLUDED.item_type,
+                    records = EXCLUDED.records,
+                    loaded_at = now()
+                """,
+                (str(path), digest, item_type, records),
+            )
+
+    def changed(self, item_type: str, checksums: dict[RecordKey, str]) -> set[RecordKey]:
+        """Return the keys whose checksum is new or differs from the stored one."""
+        if not checksums:
+            return set()
+        self.ensure_schema()
+        collections, ids, values = _columns(checksums)
+        with self.pool.connection() as conn:
+            rows = conn.execute(
+                """
+                SELECT k.collection, k.id
+                FROM unnest(%s::text[], %s::text[], %s::text[]) AS k(collection, id, checksum)
+                LEFT JOIN public.eo_maxar_record_checksums c
+                    ON c.item_type = %s AND c.collection = k.collection AND c.id = k.id
+                WHERE c.checksum IS DISTINCT FROM k.checksum
+                """,
+                (collections, ids, values, item_type),
+            ).fetchall()
+        return {(collection, id_) for collection, id_ in rows}
+
+    def record_items(self, item_type: str, checksums: dict[RecordKey, str]) -> None:
+        """Store the checksums of records that have been written."""
+        if not checksums:
+            return
+        self.ensure_schema()
+        collections, ids, values = _columns(checksums)
+        with self.pool.connection() as conn:
+            conn.execute(
+                """
+                INSERT INTO public.eo_maxar_record_checksums (item_type, collection, id, checksum)
+                SELECT %s, * FROM unnest(%s::text[], %s::text[], %s::text[])
+                ON CONFLICT (item_type, collection, id)
+                DO UPDATE SET checksum = EXCLUDED.checksum
+                """,
+                (item_type, collections, ids, values),
+            )
+
+
+def _columns(checksums: dict[RecordKey, str]) -> tuple[list[str], list[str], list[str]]:
+    """Split a checksum mapping into parallel arrays for ``unnest``."""
+    collections = [collection for collection, _ in checksums]
+    ids = [id_ for _, id_ in checksums]
+    return collections, ids, list(checksums.values())
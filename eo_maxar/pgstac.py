@@ -0,0 +1,137 @@
+"""Read STAC metadata straight from the pgSTAC database."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+import httpx
+from psycopg import sql
+from psycopg.types.json import Jsonb
+from psycopg_pool import ConnectionPool
+
+from eo_maxar.cache import MosaicSearchCache, ResponseCache
+from eo_maxar.client import APIClient
+from eo_maxar.config import settings
+from eo_maxar.models import STACCollection, STACItem
+from eo_maxar.table import ItemTable
+
+# pgSTAC's ``search()`` builds its WHERE clause and sort order with ``search_query``,
+# using the configured queryables, then reads rows through ``search_rows``. That is a
+# PL/pgSQL function which materialises its whole result before returning a row, so the
+# items table is queried directly with the same clauses to stream rows as they are
+# found. Items are hydrated by ``format_item``, as in ``search()``.
+_SEARCH_CLAUSES_SQL = "SELECT _where, orderby FROM search_query(%s)"
+_SEARCH_ITEMS_SQL = "SELECT format_item(i, %s) FROM items i WHERE {where} ORDER BY {orderby}"
+
+
+class PgSTACClient(APIClient):
+    """An :class:`~eo_maxar.client.APIClient` that reads collections and items from pgSTAC.
+
+    Collection and item reads run SQL against ``settings.database_dsn`` over a
+    ``psycopg_pool`` connection pool instead of paging through the STAC API. Items are
+    selected with the WHERE clause and sort order pgSTAC's ``search_query`` builds, so
+    filters and sort order follow the same rules as the STAC API. They are streamed
+    from a server-side cursor ``settings.pgstac_itersize`` rows at a time rather than
+    fetched page by page with tokens, and ``search()``'s ``context`` counts are not
+    computed.
+    Mosaic registration and TileJSON requests still go to the raster and vector
+    APIs over HTTP, so the client can be passed anywhere an ``APIClient`` is
+    expected, e.g. ``MaxarCollection(collection_id, client=PgSTACClient())``.
+    """
+
+    def __init__(
+        self,
+        pool: ConnectionPool | None = None,
+        prefetch_pages: bool | None = None,
+        cache: ResponseCache | None = None,
+        http_client: httpx.Client | None = None,
+        search_cache: MosaicSearchCache | None = None,
+    ) -> None:
+        """Create a client.
+
+        Args:
+            pool: Connection pool to the pgSTAC database. Created from
+                ``settings.database_dsn`` if omitted, and closed by :meth:`close`.
+            prefetch_pages: See :class:`~eo_maxar.client.APIClient`.
+            cache: See :class:`~eo_maxar.client.APIClient`.
+            http_client: See :class:`~eo_maxar.client.APIClient`.
+            search_cache: See :class:`~eo_maxar.client.APIClient`.
+        """
+        super().__init__(
+            prefetch_pages=prefetch_pages,
+            cache=cache,
+            http_client=http_client,
+            search_cache=search_cache,
+        )
+        self._owns_pool = pool is None
+        self.pool = pool or ConnectionPool(
+            settings.database_dsn,
+            min_size=1,
+            max_size=settings.pgstac_pool_size,
+            kwargs={"options": "-c search_path=pgstac,public"},
+            open=True,
+        )
+
+    def get_all_collections(self) -> list[str]:
+        """Return the IDs of every collection, paging through pgSTAC's ``collection_search``."""
+        collection_ids: list[str] = []
+        search: dict = {"limit": settings.pagination_limit, "fields": {"include": ["id"]}}
+        offset = 0
+        with self.pool.connection() as conn:
+            while True:
+                row = conn.execute(
+                    "SELECT collection_search(%s)", (Jsonb({**search, "offset": offset}),)
+                ).fetchone()
+                page = row[0] if row is not None else {}
+                collections = page.get("collections", [])
+                collection_ids.extend(c["id"] for c in collections)
+                offset += len(collections)
+                has_next = any(link["rel"] == "next" for link in page.get("links", []))
+                if not collections or not has_next:
+                    return collection_ids
+
+    def get_collection(self, collection_id: str) -> STACCollection:
+        """Read and validate a collection with pgSTAC's ``get_collection``.
+
+        Raises:
+            LookupError: If the collection does not exist.
+        """
+        with self.pool.connection() as conn:
+            row = conn.execute("SELECT get_collection(%s)", (collection_id,)).fetchone()
+        if row is None or row[0] is None:
+            raise LookupError(f"Collection {collection_id!r} not found in pgSTAC.")
+        return STACCollection.model_validate(row[0])
+
+    def iter_collection_items(self, collection_id: str) -> Iterator[STACItem]:
+        """Stream a collection's items from a server-side cursor.
+
+        A pooled connection is held until the iterator is exhausted or closed.
+        """
+        for feature in self._iter_item_features(collection_id):
+            yield STACItem.model_validate(feature)
+
+    def get_collection_item_table(self, collection_id: str) -> ItemTable:
+        """Read a collection's items into a columnar :class:`ItemTable`."""
+        return ItemTable.from_features(self._iter_item_features(collection_id))
+
+    def _iter_item_features(self, collection_id: str) -> Iterator[dict]:
+        """Yield hydrated item JSON for a collection, ``pgstac_itersize`` rows at a time."""
+        search = {"collections": [collection_id]}
+        with self.pool.connection() as conn:
+            where, orderby = conn.execute(_SEARCH_CLAUSES_SQL, (Jsonb(search),)).fetchone()
+            query = sql.SQL(_SEARCH_ITEMS_SQL).format(
+                where=sql.SQL(where or "TRUE"), orderby=sql.SQL(orderby)
+            )
+            with conn.cursor(name=f"eo_maxar_items_{id(self)}") as cursor:
+                cursor.itersize = settings.pgstac_itersize
+                cursor.execute(query, (Jsonb({}),))
+                for (feature,) in cursor:
+                    # pgSTAC only stores the links an item was loaded with.
+                    feature.setdefault("links", [])
+                    yield feature
+
+    def close(self) -> None:
+        """Close the connection pool if this client created it, and the HTTP client."""
+        if self._owns_pool:
+            self.pool.close()
+        super().close()
@@ -0,0 +1,100 @@
+"""Client-side planning of mosaics from a minimal set of covering items."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Literal
+
+import shapely
+from pydantic import BaseModel
+
+from eo_maxar.models import STACItem
+from eo_maxar.spatial import item_footprint
+from eo_maxar.table import CLOUD_PERCENT_PROPERTY, OFF_NADIR_PROPERTY, to_datetime64
+
+# Coverage gains smaller than this fraction of the AOI are not worth another COG read.
+_MIN_GAIN_FRACTION = 1e-6
+
+
+class MosaicPlan(BaseModel):
+    """The items selected to cover an area of interest."""
+
+    item_ids: list[str]
+    coverage: float
+
+    def filter_args(self) -> dict:
+        """CQL2 filter restricting a mosaic search to the planned items."""
+        return {"op": "in", "args": [{"property": "id"}, self.item_ids]}
+
+
+def item_penalty(item: STACItem) -> float:
+    """Cost multiplier for using an item: ``1`` for clear, nadir imagery, higher otherwise.
+
+    Cloud cover is scaled from percent and the off-nadir angle from degrees so that a
+    fully cloudy or 90° off-nadir item costs twice as much as an ideal one.
+    """
+    cloud = item.properties.get(CLOUD_PERCENT_PROPERTY) or 0
+    off_nadir = item.properties.get(OFF_NADIR_PROPERTY) or 0
+    return 1 + cloud / 100 + abs(off_nadir) / 90
+
+
+def in_period(item: STACItem, event_date: datetime, period: Literal["pre", "post"]) -> bool:
+    """Whether an item falls before (``"pre"``) or at/after (``"post"``) the event."""
+    item_dt = to_datetime64(item.properties.get("datetime"))
+    event_dt = to_datetime64(event_date)
+    return bool(item_dt < event_dt) if period == "pre" else bool(item_dt >= event_dt)
+
+
+def plan_mosaic(
+    items: Iterable[STACItem],
+    bbox: list[float],
+    event_date: datetime,
+    period: Literal["pre", "post"],
+    target_coverage: float = 0.99,
+) -> MosaicPlan:
+    """Greedily select a small set of items that covers an area of interest.
+
+    At each step the item adding the most uncovered area per unit of
+    :func:`item_penalty` is chosen, so low-cloud, near-nadir imagery is preferred
+    when several items cover the same ground. Selection stops once
+    ``target_coverage`` is reached or no remaining item adds coverage.
+
+    Args:
+        items: Candidate items, e.g. from ``MaxarCollection.items_intersecting(bbox)``.
+        bbox: Area of interest [min_lon, min_lat, max_lon, max_lat].
+        event_date: The event date to filter imagery by.
+        period: ``"pre"`` for images before the event, ``"post"`` for after.
+        target_coverage: Fraction of the AOI at which to stop adding items.
+
+    Returns:
+        The selected item IDs, in selection order, and the fraction of the AOI they
+        cover.
+    """
+    aoi = shapely.box(*bbox)
+    if aoi.area == 0:
+        raise ValueError(f"bbox must have a non-zero area, got {bbox}")
+
+    candidates = [
+        (item.id, clipped, item_penalty(item))
+        for item in items
+        if in_period(item, event_date, period)
+        and not (clipped := item_footprint(item).intersection(aoi)).is_empty
+    ]
+
+    selected: list[str] = []
+    covered = shapely.Polygon()
+    while candidates and covered.area / aoi.area < target_coverage:
+        best_index, best_score, best_gain = -1, -math.inf, 0.0
+        for index, (_, footprint, penalty) in enumerate(candidates):
+            gain = footprint.difference(covered).area
+            if gain / penalty > best_score:
+                best_index, best_score, best_gain = index, gain / penalty, gain
+        if best_gain <= _MIN_GAIN_FRACTION * aoi.area:
+            break
+        item_id, footprint, _ = candidates.pop(best_index)
+        selected.append(item_id)
+        covered = covered.union(footprint)
+
+    return MosaicPlan(item_ids=selected, coverage=covered.area / aoi.area)
@@ -0,0 +1,339 @@
+"""A local caching tile proxy backed by MBTiles files."""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import TracebackType
+
+import httpx
+
+from eo_maxar.cache import canonical_hash
+from eo_maxar.client import get_shared_http_client
+from eo_maxar.config import settings
+from eo_maxar.models import TileJSON
+from eo_maxar.tiles import tile_url
+
+# The MBTiles ``tiles`` table plus two bookkeeping columns used for LRU eviction.
+# Readers that select the standard columns by name are unaffected.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS metadata (name TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE IF NOT EXISTS tiles (
+    zoom_level INTEGER NOT NULL,
+    tile_column INTEGER NOT NULL,
+    tile_row INTEGER NOT NULL,
+    tile_data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE UNIQUE INDEX IF NOT EXISTS tile_index ON tiles (zoom_level, tile_column, tile_row);
+"""
+
+_FORMATS = {
+    "image/png": "png",
+    "image/jpeg": "jpg",
+    "image/jpg": "jpg",
+    "image/webp": "webp",
+    "application/x-protobuf": "pbf",
+    "application/vnd.mapbox-vector-tile": "pbf",
+}
+_MEDIA_TYPES = {
+    "png": "image/png",
+    "jpg": "image/jpeg",
+    "webp": "image/webp",
+    "pbf": "application/x-protobuf",
+}
+
+
+class MBTilesCache:
+    """A size-bounded XYZ tile store in the MBTiles SQLite layout.
+
+    Tiles are addressed with XYZ coordinates and stored with the TMS row flip the
+    MBTiles spec requires, so the file can be opened by any MBTiles viewer. When the
+    stored tiles exceed ``max_bytes``, the least recently read ones are evicted.
+    """
+
+    def __init__(self, path: Path, max_bytes: int | None = None) -> None:
+        self.path = path
+        self.max_bytes = settings.tile_cache_max_bytes if max_bytes is None else max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM tiles").fetchone()
+        return count
+
+    @property
+    def metadata(self) -> dict[str, str]:
+        """The MBTiles ``metadata`` table as a dict."""
+        with self._lock:
+            return dict(self._conn.execute("SELECT name, value FROM metadata").fetchall())
+
+    def set_metadata(self, **values: str | int | float) -> None:
+        """Insert or replace MBTiles metadata entries."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO metadata VALUES (?, ?)",
+                [(name, str(value)) for name, value in values.items()],
+            )
+            self._conn.commit()
+
+    def get(self, z: int, x: int, y: int) -> bytes | None:
+        """Return a tile's bytes and mark it as recently used."""
+        key = (z, x, (1 << z) - 1 - y)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT tile_data FROM tiles "
+                "WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE tiles SET accessed_at = ? "
+                "WHERE zoom_level = ? AND tile_column = ? AND tile_row = ?",
+                (time.time(), *key),
+            )
+            self._conn.commit()
+        self.hits += 1
+        return row[0]
+
+    def set(self, z: int, x: int, y: int, data: bytes) -> None:
+        """Store a tile, evicting least recently used tiles if over budget."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO tiles VALUES (?, ?, ?, ?, ?, ?)",
+                (z, x, (1 << z) - 1 - y, data, len(data), time.time()),
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        """Drop least recently read tiles until the store fits in ``max_bytes``."""
+        (total,) = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM tiles").fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT rowid, size FROM tiles ORDER BY accessed_at ASC"
+        ).fetchall()
+        for rowid, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM tiles WHERE rowid = ?", (rowid,))
+            total -= size
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        self._conn.close()
+
+
+class _Layer:
+    """An upstream tile URL template and the MBTiles store caching it."""
+
+    def __init__(self, template: str, store: MBTilesCache) -> None:
+        self.template = template
+        self.store = store
+
+
+class TileProxy:
+    """A local HTTP server that serves tiles from MBTiles, fetching misses upstream.
+
+    Register a TileJSON to get a copy whose tile URL points at this proxy. Each
+    upstream URL template gets its own ``.mbtiles`` file named after a hash of the
+    template, so restarting the proxy and registering the same layer again reuses
+    the stored tiles. Layers stored by an earlier session can also be reopened from
+    their MBTiles metadata with :meth:`open`, without a TileJSON from the upstream
+    API, and requests for a stored layer's ID reopen it automatically. Stored tiles
+    are then served even when the upstream API is unreachable.
+
+    Example:
+        >>> with TileProxy() as proxy:
+        ...     visualizer = MapVisualizer(tile_proxy=proxy)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        max_bytes: int | None = None,
+        http_client: httpx.Client | None = None,
+        host: str | None = None,
+        port: int | None = None,
+    ) -> None:
+        self.cache_dir = cache_dir or settings.http_cache_dir / "tiles"
+        self.max_bytes = max_bytes
+        self._client = http_client or get_shared_http_client()
+        self._layers: dict[str, _Layer] = {}
+        self._layers_lock = threading.Lock()
+        self._server = ThreadingHTTPServer(
+            (
+                host or settings.tile_proxy_host,
+                settings.tile_proxy_port if port is None else port,
+            ),
+            self._handler(),
+        )
+        self._server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> TileProxy:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    @property
+    def url(self) -> str:
+        """Base URL the proxy listens on."""
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> TileProxy:
+        """Serve requests on a background daemon thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def close(self) -> None:
+        """Stop the server and close every MBTiles store."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+        with self._layers_lock:
+            for layer in self._layers.values():
+                layer.store.close()
+            self._layers.clear()
+
+    def register(self, tilejson: TileJSON) -> TileJSON:
+        """Route a layer through the proxy.
+
+        Args:
+            tilejson: TileJSON whose first tile URL template is the upstream source.
+
+        Returns:
+            A copy of ``tilejson`` with ``tiles`` pointing at this proxy.
+        """
+        template = tilejson.tiles[0]
+        layer_id = canonical_hash(template)[:16]
+        with self._layers_lock:
+            if layer_id not in self._layers:
+                store = MBTilesCache(self.cache_dir / f"{layer_id}.mbtiles", self.max_bytes)
+                store.set_metadata(
+                    name=tilejson.name or layer_id,
+                    bounds=",".join(str(v) for v in tilejson.bounds),
+                    minzoom=tilejson.minzoom,
+                    maxzoom=tilejson.maxzoom,
+                    source=template,
+                )
+                self._layers[layer_id] = _Layer(template, store)
+        return self._proxied(tilejson, layer_id)
+
+    def stored_layers(self) -> list[str]:
+        """IDs of the layers with an ``.mbtiles`` store in ``cache_dir``."""
+        return sorted(path.stem for path in self.cache_dir.glob("*.mbtiles"))
+
+    def open(self, layer_id: str) -> TileJSON:
+        """Reopen a layer stored by an earlier session from its MBTiles metadata.
+
+        Args:
+            layer_id: A layer ID from :meth:`stored_layers`, or from a proxied tile URL.
+
+        Returns:
+            TileJSON for the layer with ``tiles`` pointing at this proxy.
+
+        Raises:
+            KeyError: If there is no stored layer with this ID.
+        """
+        layer = self._layer(layer_id)
+        if layer is None:
+            raise KeyError(f"No stored tile layer {layer_id!r} in {self.cache_dir}.")
+        metadata = layer.store.metadata
+        tilejson = TileJSON(
+            tilejson="3.0.0",
+            name=metadata.get("name"),
+            tiles=[layer.template],
+            minzoom=int(metadata["minzoom"]),
+            maxzoom=int(metadata["maxzoom"]),
+            bounds=[float(v) for v in metadata["bounds"].split(",")],
+        )
+        return self._proxied(tilejson, layer_id)
+
+    def _layer(self, layer_id: str) -> _Layer | None:
+        """Return a registered layer, reopening its store from disk if it exists."""
+        with self._layers_lock:
+            if (layer := self._layers.get(layer_id)) is not None:
+                return layer
+            path = self.cache_dir / f"{layer_id}.mbtiles"
+            if not layer_id.isalnum() or not path.is_file():
+                return None
+            store = MBTilesCache(path, self.max_bytes)
+            if (template := store.metadata.get("source")) is None:
+                store.close()
+                return None
+            layer = self._layers[layer_id] = _Layer(template, store)
+            return layer
+
+    def _proxied(self, tilejson: TileJSON, layer_id: str) -> TileJSON:
+        return tilejson.model_copy(update={"tiles": [f"{self.url}/{layer_id}/{{z}}/{{x}}/{{y}}"]})
+
+    def fetch(self, layer_id: str, z: int, x: int, y: int) -> tuple[int, bytes, str]:
+        """Return ``(status, body, media type)`` for a tile, going upstream on a miss."""
+        layer = self._layer(layer_id)
+        if layer is None:
+            return HTTPStatus.NOT_FOUND, b"", "text/plain"
+        data = layer.store.get(z, x, y)
+        if data is not None:
+            fmt = layer.store.metadata.get("format", "png")
+            return HTTPStatus.OK, data, _MEDIA_TYPES.get(fmt, "application/octet-stream")
+
+        try:
+            response = self._client.get(tile_url(layer.template, z, x, y))
+        except httpx.HTTPError:
+            return HTTPStatus.BAD_GATEWAY, b"", "text/plain"
+        media_type = response.headers.get("content-type", "application/octet-stream")
+        if response.status_code == HTTPStatus.OK:
+            fmt = _FORMATS.get(media_type.split(";")[0].strip())
+            if fmt and "format" not in layer.store.metadata:
+                layer.store.set_metadata(format=fmt)
+            layer.store.set(z, x, y, response.content)
+        return response.status_code, response.content, media_type
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        proxy = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                try:
+                    layer_id, z, x, y = self.path.split("?")[0].strip("/").split("/")
+                    status, body, media_type = proxy.fetch(layer_id, int(z), int(x), int(y))
+                except ValueError:
+                    status, body, media_type = HTTPStatus.NOT_FOUND, b"", "text/plain"
+                self.send_response(status)
+                self.send_header("Content-Type", media_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.send_header("Access-Control-Allow-Origin", "*")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: object) -> None:
+                pass
+
+        return Handler
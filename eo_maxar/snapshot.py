@@ -0,0 +1,138 @@
+"""Local Parquet snapshots of collection items.
+
+Snapshots follow the stac-geoparquet layout: one row per item, core STAC fields and
+flattened ``properties`` as top-level columns, geometry as WKB with GeoParquet
+metadata, and ``assets``/``links`` as JSON strings. A property whose name clashes with
+a core column is stored as ``properties.<name>``, and a property column whose values
+Arrow cannot store as one type (e.g. numbers in some items and strings in others) is
+stored as JSON strings and listed in the frame's ``attrs``.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable
+from pathlib import Path
+
+import geopandas as gpd
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+from shapely.geometry import shape
+
+from eo_maxar.models import STACItem
+
+# Columns holding top-level STAC item fields; every other column is a property.
+_CORE_COLUMNS = ("type", "stac_version", "id", "collection", "bbox", "geometry", "assets", "links")
+# Prefix for properties whose names clash with a core column.
+_PROPERTY_PREFIX = "properties."
+# ``attrs`` key listing the property columns stored as JSON strings. GeoPandas keeps a
+# frame's ``attrs`` in the Parquet schema metadata under ``_ATTRS_METADATA_KEY``.
+_JSON_COLUMNS_ATTR = "json_columns"
+_ATTRS_METADATA_KEY = b"PANDAS_ATTRS"
+
+
+def _property_column(name: str) -> str:
+    return f"{_PROPERTY_PREFIX}{name}" if name in _CORE_COLUMNS else name
+
+
+def _needs_json(values: pd.Series) -> bool:
+    """Whether a property column's values cannot be stored as a single Arrow type."""
+    present = values.dropna()
+    if len({type(value) for value in present}) > 1:
+        return True
+    try:
+        pa.array(present.tolist())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return True
+    return False
+
+
+def items_to_geodataframe(items: Iterable[STACItem]) -> gpd.GeoDataFrame:
+    """Flatten STAC items into a GeoDataFrame in the snapshot layout."""
+    rows: list[dict] = []
+    geometries = []
+    for item in items:
+        rows.append({
+            "type": item.type,
+            "stac_version": item.stac_version,
+            "id": item.id,
+            "collection": item.collection,
+            "bbox": item.bbox,
+            "assets": json.dumps(item.assets),
+            "links": json.dumps([link.model_dump(exclude_none=True) for link in item.links]),
+            **{_property_column(name): value for name, value in item.properties.items()},
+        })
+        geometries.append(shape(item.geometry) if item.geometry else None)
+    gdf = gpd.GeoDataFrame(rows, geometry=geometries, crs="EPSG:4326")
+    json_columns = [
+        name
+        for name in gdf.columns
+        if name not in _CORE_COLUMNS and gdf[name].dtype == object and _needs_json(gdf[name])
+    ]
+    for name in json_columns:
+        gdf[name] = gdf[name].map(json.dumps, na_action="ignore")
+    gdf.attrs[_JSON_COLUMNS_ATTR] = json_columns
+    return gdf
+
+
+def write_items_snapshot(items: Iterable[STACItem], path: Path) -> Path:
+    """Write items to a GeoParquet snapshot file.
+
+    Args:
+        items: The items to write.
+        path: Destination ``.parquet`` file. Parent directories are created.
+
+    Returns:
+        The path written to.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    items_to_geodataframe(items).to_parquet(path, index=False)
+    return path
+
+
+def read_snapshot_geodataframe(path: Path) -> gpd.GeoDataFrame:
+    """Read a snapshot as a GeoDataFrame for offline analysis."""
+    return gpd.read_parquet(path, memory_map=True)
+
+
+def read_items_snapshot(path: Path) -> list[STACItem]:
+    """Read a snapshot back into validated STAC items.
+
+    The file is memory-mapped rather than read into a separate buffer. Properties
+    that were absent on an item (stored as nulls) are dropped again, except
+    ``datetime`` which STAC allows to be null.
+    """
+    table = pq.read_table(path, memory_map=True)
+    attrs = json.loads((table.schema.metadata or {}).get(_ATTRS_METADATA_KEY, b"{}"))
+    json_columns = set(attrs.get(_JSON_COLUMNS_ATTR, []))
+    property_columns = [name for name in table.column_names if name not in _CORE_COLUMNS]
+    items = []
+    for row in table.to_pylist():
+        geometry = row["geometry"]
+        properties = {
+            name.removeprefix(_PROPERTY_PREFIX): (
+                json.loads(row[name])
+                if name in json_columns and row[name] is not None
+                else row[name]
+            )
+            for name in property_columns
+            if row[name] is not None or name == "datetime"
+        }
+        items.append(
+            STACItem.model_validate({
+                "type": row["type"],
+                "stac_version": row["stac_version"],
+                "id": row["id"],
+                "collection": row["collection"],
+                "bbox": row["bbox"],
+                "geometry": (
+                    json.loads(shapely.to_geojson(shapely.from_wkb(geometry))) if geometry else None
+                ),
+                "properties": properties,
+                "assets": json.loads(row["assets"]),
+                "links": json.loads(row["links"]),
+            })
+        )
+    return items
@@ -0,0 +1,59 @@
+"""Spatial indexing of STAC item footprints."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+from shapely.geometry.base import BaseGeometry
+
+from eo_maxar.models import STACItem
+
+
+def item_footprint(item: STACItem) -> BaseGeometry:
+    """Return an item's footprint geometry, falling back to its bbox."""
+    if item.geometry:
+        return shape(item.geometry)
+    return shapely.box(*item.bbox)
+
+
+class ItemSpatialIndex:
+    """An STRtree over item footprints for fast AOI and point lookups.
+
+    Query results are returned in the same order as the items the index was built
+    from.
+    """
+
+    def __init__(self, items: Sequence[STACItem]) -> None:
+        self.items = list(items)
+        self.footprints = np.array([item_footprint(item) for item in self.items], dtype=object)
+        self.tree = shapely.STRtree(self.footprints)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def intersecting_indices(self, bbox: list[float]) -> np.ndarray:
+        """Return sorted indices of items whose footprint intersects ``bbox``."""
+        return np.sort(self.tree.query(shapely.box(*bbox), predicate="intersects"))
+
+    def intersecting(self, bbox: list[float]) -> list[STACItem]:
+        """Return the items whose footprint intersects ``bbox``.
+
+        Args:
+            bbox: Bounding box [min_lon, min_lat, max_lon, max_lat].
+        """
+        return [self.items[i] for i in self.intersecting_indices(bbox)]
+
+    def containing(self, point: tuple[float, float]) -> list[STACItem]:
+        """Return the items whose footprint covers a ``(lon, lat)`` point."""
+        indices = self.tree.query(shapely.Point(point), predicate="covered_by")
+        return [self.items[i] for i in np.sort(indices)]
+
+    def nearest(self, point: tuple[float, float]) -> STACItem | None:
+        """Return the item whose footprint is closest to a ``(lon, lat)`` point."""
+        if not self.items:
+            return None
+        index = self.tree.nearest(shapely.Point(point))
+        return self.items[int(index)]
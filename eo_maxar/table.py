@@ -0,0 +1,217 @@
+"""Columnar storage for STAC items backed by NumPy arrays."""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Literal
+
+import numpy as np
+
+from eo_maxar.models import STACItem
+
+# STAC property keys used by the Maxar open data items.
+CATALOG_ID_PROPERTY = "catalog_id"
+CLOUD_PERCENT_PROPERTY = "tile:clouds_percent"
+GSD_PROPERTY = "gsd"
+OFF_NADIR_PROPERTY = "view:off_nadir"
+
+SortColumn = Literal["ids", "catalog_ids", "datetime", "cloud_percent", "gsd", "off_nadir"]
+
+
+def to_datetime64(value: str | datetime | None) -> np.datetime64:
+    """Convert an ISO 8601 string or datetime to a naive UTC ``datetime64[ms]``.
+
+    Timezone-aware values are converted to UTC; naive values are assumed to be UTC.
+    ``None`` becomes ``NaT``.
+    """
+    if value is None:
+        return np.datetime64("NaT", "ms")
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return np.datetime64(value, "ms")
+
+
+def _as_float(value: object) -> float:
+    return float(value) if isinstance(value, int | float) else np.nan
+
+
+def _missing(values: np.ndarray) -> np.ndarray:
+    """Boolean mask of missing entries in a float, datetime or object column."""
+    if values.dtype.kind == "f":
+        return np.isnan(values)
+    if values.dtype.kind == "M":
+        return np.isnat(values)
+    return np.array([value is None for value in values], dtype=bool)
+
+
+class ItemTable:
+    """A columnar, filterable view over many STAC items.
+
+    Frequently queried fields are held as NumPy arrays so filters and sorts are
+    vectorised. The full item is kept as compact JSON and only validated into a
+    :class:`~eo_maxar.models.STACItem` when requested via :meth:`item` or
+    :meth:`to_items`.
+
+    Attributes:
+        ids: Item identifiers (interned strings).
+        catalog_ids: Maxar catalog identifiers (interned strings, or ``None``).
+        bbox: ``(N, 4)`` float array of ``[min_lon, min_lat, max_lon, max_lat]``.
+        datetime: Acquisition times as naive UTC ``datetime64[ms]``.
+        cloud_percent: ``tile:clouds_percent`` values, ``NaN`` when missing.
+        gsd: Ground sample distance, ``NaN`` when missing.
+        off_nadir: ``view:off_nadir`` angles, ``NaN`` when missing.
+    """
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        catalog_ids: np.ndarray,
+        bbox: np.ndarray,
+        datetime: np.ndarray,
+        cloud_percent: np.ndarray,
+        gsd: np.ndarray,
+        off_nadir: np.ndarray,
+        features: np.ndarray,
+    ) -> None:
+        self.ids = ids
+        self.catalog_ids = catalog_ids
+        self.bbox = bbox
+        self.datetime = datetime
+        self.cloud_percent = cloud_percent
+        self.gsd = gsd
+        self.off_nadir = off_nadir
+        self._features = features
+
+    @classmethod
+    def from_features(cls, features: Iterable[dict]) -> ItemTable:
+        """Build a table directly from raw GeoJSON feature dicts, e.g. API page JSON."""
+        ids: list[str] = []
+        catalog_ids: list[str | None] = []
+        bboxes: list[list[float]] = []
+        datetimes: list[np.datetime64] = []
+        cloud_percent: list[float] = []
+        gsd: list[float] = []
+        off_nadir: list[float] = []
+        encoded: list[str] = []
+
+        for feature in features:
+            properties = feature.get("properties", {})
+            catalog_id = properties.get(CATALOG_ID_PROPERTY)
+            ids.append(sys.intern(feature["id"]))
+            catalog_ids.append(sys.intern(catalog_id) if catalog_id else None)
+            bboxes.append(feature["bbox"])
+            datetimes.append(to_datetime64(properties.get("datetime")))
+            cloud_percent.append(_as_float(properties.get(CLOUD_PERCENT_PROPERTY)))
+            gsd.append(_as_float(properties.get(GSD_PROPERTY)))
+            off_nadir.append(_as_float(properties.get(OFF_NADIR_PROPERTY)))
+            encoded.append(json.dumps(feature, separators=(",", ":")))
+
+        return cls(
+            ids=np.array(ids, dtype=object),
+            catalog_ids=np.array(catalog_ids, dtype=object),
+            bbox=np.array(bboxes, dtype=np.float64).reshape(-1, 4),
+            datetime=np.array(datetimes, dtype="datetime64[ms]"),
+            cloud_percent=np.array(cloud_percent, dtype=np.float64),
+            gsd=np.array(gsd, dtype=np.float64),
+            off_nadir=np.array(off_nadir, dtype=np.float64),
+            features=np.array(encoded, dtype=object),
+        )
+
+    @classmethod
+    def from_items(cls, items: Iterable[STACItem]) -> ItemTable:
+        """Build a table from already validated items."""
+        return cls.from_features(item.model_dump(by_alias=True) for item in items)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, key: np.ndarray | slice) -> ItemTable:
+        """Select rows with a boolean mask, an index array or a slice."""
+        return ItemTable(
+            ids=self.ids[key],
+            catalog_ids=self.catalog_ids[key],
+            bbox=self.bbox[key],
+            datetime=self.datetime[key],
+            cloud_percent=self.cloud_percent[key],
+            gsd=self.gsd[key],
+            off_nadir=self.off_nadir[key],
+            features=self._features[key],
+        )
+
+    def mask(
+        self,
+        bbox: list[float] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_cloud_percent: float | None = None,
+        max_off_nadir: float | None = None,
+        max_gsd: float | None = None,
+    ) -> np.ndarray:
+        """Build a boolean mask of rows matching every given criterion.
+
+        Args:
+            bbox: Keep items whose bbox intersects ``[min_lon, min_lat, max_lon, max_lat]``.
+            start: Keep items acquired at or after this time.
+            end: Keep items acquired before this time.
+            max_cloud_percent: Keep items at or below this cloud cover.
+            max_off_nadir: Keep items at or below this off-nadir angle.
+            max_gsd: Keep items at or below this ground sample distance.
+
+        Returns:
+            A boolean array with one entry per row.
+        """
+        keep = np.ones(len(self), dtype=bool)
+        if bbox is not None:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            keep &= (
+                (self.bbox[:, 0] <= max_lon)
+                & (self.bbox[:, 2] >= min_lon)
+                & (self.bbox[:, 1] <= max_lat)
+                & (self.bbox[:, 3] >= min_lat)
+            )
+        if start is not None:
+            keep &= self.datetime >= to_datetime64(start)
+        if end is not None:
+            keep &= self.datetime < to_datetime64(end)
+        if max_cloud_percent is not None:
+            keep &= self.cloud_percent <= max_cloud_percent
+        if max_off_nadir is not None:
+            keep &= self.off_nadir <= max_off_nadir
+        if max_gsd is not None:
+            keep &= self.gsd <= max_gsd
+        return keep
+
+    def filter(
+        self,
+        bbox: list[float] | None = None,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        max_cloud_percent: float | None = None,
+        max_off_nadir: float | None = None,
+        max_gsd: float | None = None,
+    ) -> ItemTable:
+        """Return the rows matching every given criterion. See :meth:`mask`."""
+        return self[self.mask(bbox, start, end, max_cloud_percent, max_off_nadir, max_gsd)]
+
+    def sort_by(self, column: SortColumn, descending: bool = False) -> ItemTable:
+        """Return the rows ordered by a column. Missing values always sort last."""
+        values = getattr(self, column)
+        missing = _missing(values)
+        present = np.flatnonzero(~missing)
+        order = present[np.argsort(values[present], kind="stable")]
+        if descending:
+            order = order[::-1]
+        return self[np.concatenate([order, np.flatnonzero(missing)])]
+
+    def item(self, index: int) -> STACItem:
+        """Materialise the full item at ``index``."""
+        return STACItem.model_validate_json(self._features[index])
+
+    def to_items(self) -> list[STACItem]:
+        """Materialise every row as a full :class:`~eo_maxar.models.STACItem`."""
+        return [STACItem.model_validate_json(feature) for feature in self._features]
@@ -0,0 +1,53 @@
+"""Sorted temporal indexing of STAC items."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+
+import numpy as np
+
+from eo_maxar.models import STACItem
+from eo_maxar.table import to_datetime64
+
+
+class ItemTemporalIndex:
+    """Items sorted by acquisition time, with binary-search range lookups.
+
+    Items without a ``datetime`` property are excluded from every query.
+    Ranges are half-open: ``start`` is inclusive and ``end`` is exclusive, matching
+    the ``lt``/``ge`` filters used for pre- and post-event mosaics.
+    """
+
+    def __init__(self, items: Sequence[STACItem]) -> None:
+        datetimes = np.array(
+            [to_datetime64(item.properties.get("datetime")) for item in items],
+            dtype="datetime64[ms]",
+        )
+        order = np.argsort(datetimes, kind="stable")
+        valid = order[~np.isnat(datetimes[order])]
+        self.items = [items[i] for i in valid]
+        self.datetimes = datetimes[valid]
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def _position(self, date: datetime) -> int:
+        return int(np.searchsorted(self.datetimes, to_datetime64(date), side="left"))
+
+    def before(self, date: datetime) -> list[STACItem]:
+        """Return items acquired strictly before ``date``, oldest first."""
+        return self.items[: self._position(date)]
+
+    def after(self, date: datetime) -> list[STACItem]:
+        """Return items acquired at or after ``date``, oldest first."""
+        return self.items[self._position(date) :]
+
+    def between(self, start: datetime, end: datetime) -> list[STACItem]:
+        """Return items acquired in ``[start, end)``, oldest first."""
+        return self.items[self._position(start) : self._position(end)]
+
+    def partition(self, date: datetime) -> tuple[list[STACItem], list[STACItem]]:
+        """Split items into those before ``date`` and those at or after it."""
+        position = self._position(date)
+        return self.items[:position], self.items[position:]
@@ -0,0 +1,166 @@
+"""XYZ tile helpers and a concurrent tile cache warmer."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+from pydantic import BaseModel
+
+from eo_maxar.client import get_shared_http_client
+from eo_maxar.config import settings
+from eo_maxar.models import TileJSON
+
+logger = logging.getLogger(__name__)
+
+# Latitude limit of the WebMercatorQuad tile matrix set.
+_MAX_LATITUDE = 85.0511287798066
+
+
+def lonlat_to_tile(lon: float, lat: float, zoom: int) -> tuple[int, int]:
+    """Return the WebMercatorQuad ``(x, y)`` tile containing a point at a zoom level."""
+    lat = max(-_MAX_LATITUDE, min(_MAX_LATITUDE, lat))
+    n = 2**zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tiles_for_bbox(bbox: list[float], zoom: int) -> Iterator[tuple[int, int, int]]:
+    """Yield the ``(z, x, y)`` tiles covering a bounding box at one zoom level.
+
+    Args:
+        bbox: Bounding box [min_lon, min_lat, max_lon, max_lat].
+        zoom: Web Mercator zoom level.
+    """
+    min_lon, min_lat, max_lon, max_lat = bbox
+    min_x, min_y = lonlat_to_tile(min_lon, max_lat, zoom)
+    max_x, max_y = lonlat_to_tile(max_lon, min_lat, zoom)
+    for x in range(min_x, max_x + 1):
+        for y in range(min_y, max_y + 1):
+            yield zoom, x, y
+
+
+def count_tiles(bbox: list[float], zoom: int) -> int:
+    """Return how many tiles :func:`tiles_for_bbox` yields without enumerating them."""
+    min_lon, min_lat, max_lon, max_lat = bbox
+    min_x, min_y = lonlat_to_tile(min_lon, max_lat, zoom)
+    max_x, max_y = lonlat_to_tile(max_lon, min_lat, zoom)
+    return (max_x - min_x + 1) * (max_y - min_y + 1)
+
+
+def tile_url(template: str, z: int, x: int, y: int) -> str:
+    """Fill the ``{z}``, ``{x}`` and ``{y}`` placeholders of a tile URL template."""
+    return template.replace("{z}", str(z)).replace("{x}", str(x)).replace("{y}", str(y))
+
+
+class PrefetchStats(BaseModel):
+    """Progress and throughput of a tile prefetch run."""
+
+    total: int
+    zooms: list[int] = []
+    succeeded: int = 0
+    failed: int = 0
+    bytes: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        return self.succeeded + self.failed
+
+    @property
+    def tiles_per_second(self) -> float:
+        return self.completed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+
+def _default_zooms(tilejson: TileJSON, bbox: list[float]) -> list[int]:
+    """Zooms from ``tilejson.minzoom`` upwards whose combined tiles fit the prefetch budget."""
+    zooms: list[int] = []
+    total = 0
+    for zoom in range(tilejson.minzoom, tilejson.maxzoom + 1):
+        total += count_tiles(bbox, zoom)
+        if total > settings.prefetch_max_tiles:
+            break
+        zooms.append(zoom)
+    if not zooms:
+        logger.warning(
+            "Bounding box needs more than %d tiles at zoom %d; nothing will be prefetched.",
+            settings.prefetch_max_tiles,
+            tilejson.minzoom,
+        )
+    return zooms
+
+
+def prefetch_tiles(
+    tilejson: TileJSON,
+    bbox: list[float],
+    zooms: Iterable[int] | None = None,
+    max_workers: int | None = None,
+    http_client: httpx.Client | None = None,
+    progress: Callable[[PrefetchStats], None] | None = None,
+) -> PrefetchStats:
+    """Request every tile covering a bounding box so the tile server caches warm up.
+
+    Args:
+        tilejson: TileJSON of the layer to warm, e.g. a registered mosaic.
+        bbox: Bounding box [min_lon, min_lat, max_lon, max_lat].
+        zooms: Zoom levels to fetch. Defaults to ``tilejson.minzoom`` up to the
+            highest zoom, at most ``tilejson.maxzoom``, whose tiles fit within
+            ``settings.prefetch_max_tiles``. The zooms fetched are reported in the
+            returned stats.
+        max_workers: Maximum concurrent requests. Defaults to
+            ``settings.max_concurrency``.
+        http_client: Client to send requests with. Defaults to the shared client.
+        progress: Called with a snapshot of the stats after each tile completes.
+
+    Returns:
+        Final counts, bytes downloaded and elapsed time.
+
+    Raises:
+        ValueError: If explicit ``zooms`` would request more than
+            ``settings.prefetch_max_tiles`` tiles.
+    """
+    zooms = _default_zooms(tilejson, bbox) if zooms is None else list(zooms)
+    total = sum(count_tiles(bbox, zoom) for zoom in zooms)
+    if total > settings.prefetch_max_tiles:
+        raise ValueError(
+            f"Prefetch would request {total} tiles, more than the limit of "
+            f"{settings.prefetch_max_tiles}. Narrow the bbox or zoom range."
+        )
+    tiles = [tile for zoom in zooms for tile in tiles_for_bbox(bbox, zoom)]
+
+    client = http_client or get_shared_http_client()
+    template = tilejson.tiles[0]
+    stats = PrefetchStats(total=total, zooms=zooms)
+    lock = threading.Lock()
+    start = time.perf_counter()
+
+    def fetch(tile: tuple[int, int, int]) -> None:
+        try:
+            response = client.get(tile_url(template, *tile))
+            response.raise_for_status()
+            size, ok = len(response.content), True
+        except httpx.HTTPError:
+            size, ok = 0, False
+        with lock:
+            if ok:
+                stats.succeeded += 1
+                stats.bytes += size
+            else:
+                stats.failed += 1
+            stats.elapsed_seconds = time.perf_counter() - start
+            snapshot = stats.model_copy()
+        if progress is not None:
+            progress(snapshot)
+
+    with ThreadPoolExecutor(max_workers=max_workers or settings.max_concurrency) as executor:
+        list(executor.map(fetch, tiles))
+
+    stats.elapsed_seconds = time.perf_counter() - start
+    return stats
@@ -2,10 +2,14 @@ from datetime import datetime
 from typing import Any
 
 import ipyleaflet
+import shapely
 
 from eo_maxar.config import settings
-from eo_maxar.geojson import bboxes_to_feature_collection
+from eo_maxar.geojson import bboxes_to_feature_collection, items_to_footprint_collection
 from eo_maxar.models import STACCollection, STACItem, TileJSON
+from eo_maxar.proxy import TileProxy
+from eo_maxar.spatial import ItemSpatialIndex
+from eo_maxar.temporal import ItemTemporalIndex
 
 # Map style constants
 _MAIN_BBOX_STYLE: dict[str, Any] = {
@@ -18,10 +22,91 @@ _FEATURE_STYLE: dict[str, Any] = {"fillOpacity": 0.1, "weight": 1, "color": "blu
 _PRE_EVENT_COLOR = "blue"
 _POST_EVENT_COLOR = "red"
 _PRE_POST_BASE_STYLE: dict[str, Any] = {"fillOpacity": 0.5, "weight": 0.2}
+# tipg names the single MVT layer in each tile "default".
+_VECTOR_TILE_LAYER = "default"
+_VECTOR_FOOTPRINT_STYLE: dict[str, Any] = {
+    "fill": True,
+    "fillColor": "blue",
+    "fillOpacity": 0.1,
+    "color": "blue",
+    "weight": 1,
+}
+
+
+class ViewportFootprints:
+    """Keeps a map's footprint layers in sync with its visible extent.
+
+    Observes the map's ``bounds`` and ``zoom`` and, on each change, queries a spatial
+    index for the items in view. Footprints entering the view are added as
+    individual layers and those leaving it are removed, so only the difference is
+    sent to the browser. At most ``max_features`` footprints are shown at once.
+    """
+
+    def __init__(
+        self,
+        m: ipyleaflet.Map,
+        index: ItemSpatialIndex,
+        max_features: int | None = None,
+        style: dict[str, Any] | None = None,
+    ) -> None:
+        self.map = m
+        self.index = index
+        self.max_features = max_features or settings.viewport_max_features
+        self.style = style or _FEATURE_STYLE
+        self.group = ipyleaflet.LayerGroup(name="Footprints")
+        self._layers: dict[str, ipyleaflet.GeoJSON] = {}
+        m.add(self.group)
+        m.observe(self._on_view_change, names=["bounds", "zoom"])
+
+    @property
+    def visible_ids(self) -> set[str]:
+        """IDs of the items whose footprints are currently drawn."""
+        return set(self._layers)
+
+    def _on_view_change(self, change: dict) -> None:
+        self.update()
+
+    def update(self, bounds: tuple | None = None) -> None:
+        """Add and remove footprints to match a view extent.
+
+        Args:
+            bounds: ``((south, west), (north, east))`` as reported by the map's
+                ``bounds`` trait. Defaults to the map's current bounds.
+        """
+        bounds = bounds or self.map.bounds
+        if not bounds:
+            return  # The frontend has not reported an extent yet.
+        (south, west), (north, east) = bounds
+        in_view = self.index.intersecting([west, south, east, north])[: self.max_features]
+        wanted = {item.id: item for item in in_view}
+
+        for item_id in self._layers.keys() - wanted.keys():
+            self.group.remove(self._layers.pop(item_id))
+        for item_id in wanted.keys() - self._layers.keys():
+            data = items_to_footprint_collection(
+                [wanted[item_id]], precision=settings.footprint_precision
+            )
+            layer = ipyleaflet.GeoJSON(data=data, style=self.style)
+            self.group.add(layer)
+            self._layers[item_id] = layer
 
 
 class MapVisualizer:
-    """Handles the creation of ipyleaflet maps for visualizing geospatial data."""
+    """Handles the creation of ipyleaflet maps for visualizing geospatial data.
+
+    Args:
+        tile_proxy: Optional running :class:`~eo_maxar.proxy.TileProxy`. When given,
+            raster tile layers are served through it instead of the raster API.
+    """
+
+    def __init__(self, tile_proxy: TileProxy | None = None) -> None:
+        self.tile_proxy = tile_proxy
+
+    def _tile_url(self, tilejson: TileJSON) -> str:
+        """Return the tile URL template for a raster layer, via the proxy if enabled."""
+        if self.tile_proxy is not None:
+            tilejson = self.tile_proxy.register(tilejson)
+        return tilejson.tiles[0]
 
     def _create_base_map(
         self,
@@ -45,7 +130,7 @@ class MapVisualizer:
         bounds = tilejson.bounds
         m = self._create_base_map(bounds, overrides=map_kwargs)
         tile_layer = ipyleaflet.TileLayer(
-            url=tilejson.tiles[0],
+            url=self._tile_url(tilejson),
             min_zoom=tilejson.minzoom,
             max_zoom=tilejson.maxzoom,
             bounds=[[bounds[1], bounds[0]], [bounds[3], bounds[2]]],
@@ -63,13 +148,48 @@ class MapVisualizer:
         left_bounds = left_tilejson.bounds
         m = self._create_base_map(left_bounds, overrides=map_kwargs)
 
-        left_layer = ipyleaflet.TileLayer(url=left_tilejson.tiles[0])
-        right_layer = ipyleaflet.TileLayer(url=right_tilejson.tiles[0])
+        left_layer = ipyleaflet.TileLayer(url=self._tile_url(left_tilejson))
+        right_layer = ipyleaflet.TileLayer(url=self._tile_url(right_tilejson))
 
         split_control = ipyleaflet.SplitMapControl(left_layer=left_layer, right_layer=right_layer)
         m.add(split_control)
         return m
 
+    def create_vector_footprints_map(
+        self, tilejson: TileJSON, map_kwargs: dict | None = None
+    ) -> ipyleaflet.Map:
+        """Creates a map rendering item footprints from vector tiles.
+
+        Footprints are streamed tile by tile from the vector tile server, so browser
+        memory and notebook output size do not grow with the number of items.
+        """
+        m = self._create_base_map(tilejson.bounds, overrides=map_kwargs)
+        vector_layer = ipyleaflet.VectorTileLayer(
+            url=tilejson.tiles[0],
+            min_zoom=tilejson.minzoom,
+            max_native_zoom=tilejson.maxzoom,
+            layer_styles={_VECTOR_TILE_LAYER: _VECTOR_FOOTPRINT_STYLE},
+        )
+        m.add(vector_layer)
+        return m
+
+    def create_viewport_footprints_map(
+        self,
+        index: ItemSpatialIndex,
+        map_kwargs: dict | None = None,
+        max_features: int | None = None,
+    ) -> ipyleaflet.Map:
+        """Creates a map that only draws the item footprints inside the current view.
+
+        See :class:`ViewportFootprints` for how features are loaded as the map moves.
+        """
+        if not len(index):
+            raise ValueError("Item list cannot be empty.")
+        bounds = shapely.total_bounds(index.footprints).tolist()
+        m = self._create_base_map(bounds, overrides=map_kwargs)
+        ViewportFootprints(m, index, max_features=max_features).update()
+        return m
+
     def create_collection_footprints_map(
         self, collection: STACCollection, map_kwargs: dict | None = None
     ) -> ipyleaflet.Map:
@@ -94,24 +214,45 @@ class MapVisualizer:
         event_date: datetime,
         map_kwargs: dict | None = None,
     ) -> ipyleaflet.Map:
-        """Creates a map styling STAC item footprints based on an event date."""
+        """Creates a map styling STAC item footprints based on an event date.
+
+        Items are split at ``event_date`` with an :class:`ItemTemporalIndex`; items
+        without a ``datetime`` are left off the map. See
+        :meth:`create_partitioned_event_map` for lists that are already split.
+        """
         if not items:
             raise ValueError("Item list cannot be empty.")
+        pre_event_items, post_event_items = ItemTemporalIndex(items).partition(event_date)
+        return self.create_partitioned_event_map(pre_event_items, post_event_items, map_kwargs)
+
+    def create_partitioned_event_map(
+        self,
+        pre_event_items: list[STACItem],
+        post_event_items: list[STACItem],
+        map_kwargs: dict | None = None,
+    ) -> ipyleaflet.Map:
+        """Creates a map of STAC item footprints already partitioned by an event date.
+        Each period is drawn as its own layer with a fixed style, so restyling does
+        not need to inspect individual features. Footprints are sent as slim GeoJSON,
+        quantized to ``settings.footprint_precision`` and, if
+        ``settings.footprint_simplify_zoom`` is set, simplified to about a pixel at
+        that zoom level.
+        """
+        if not pre_event_items and not post_event_items:
+            raise ValueError("Item list cannot be empty.")
 
-        m = self._create_base_map(items[0].bbox, overrides=map_kwargs)
+        first_item = pre_event_items[0] if pre_event_items else post_event_items[0]
+        m = self._create_base_map(first_item.bbox, overrides=map_kwargs)
 
-        def style_callback(feature: dict) -> dict:
-            item_dt = datetime.fromisoformat(
-                feature["properties"]["datetime"].replace("Z", "+00:00")
+        for name, items, color in (
+            ("Pre-event", pre_event_items, _PRE_EVENT_COLOR),
+            ("Post-event", post_event_items, _POST_EVENT_COLOR),
+        ):
+            geojson_data = items_to_footprint_collection(
+                items,
+                precision=settings.footprint_precision,
+                zoom=settings.footprint_simplify_zoom,
             )
-            style: dict[str, Any] = dict(_PRE_POST_BASE_STYLE)
-            style["fillColor"] = _PRE_EVENT_COLOR if item_dt < event_date else _POST_EVENT_COLOR
-            return style
-
-        geojson_data = {
-            "type": "FeatureCollection",
-            "features": [item.model_dump(by_alias=True) for item in items],
-        }
-        geo_json_layer = ipyleaflet.GeoJSON(data=geojson_data, style_callback=style_callback)
-        m.add(geo_json_layer)
+            style = {**_PRE_POST_BASE_STYLE, "fillColor": color}
+            m.add(ipyleaflet.GeoJSON(data=geojson_data, style=style, name=name))
         return m
@@ -1,7 +1,11 @@
 """Shared fixtures for the test suite."""
 
+import copy
+
 import pytest
 
+from eo_maxar.models import STACItem
+
 SAMPLE_COLLECTION_DATA = {
     "id": "maxar-open-data__turkey-earthquake-2023",
     "title": "Turkey Earthquake 2023",
@@ -37,6 +41,17 @@ SAMPLE_ITEM_DATA = {
     "collection": "maxar-open-data__turkey-earthquake-2023",
 }
 
+
+def make_item_data(**overrides: object) -> dict:
+    """Return a copy of ``SAMPLE_ITEM_DATA`` with top-level fields replaced."""
+    return {**copy.deepcopy(SAMPLE_ITEM_DATA), **overrides}
+
+
+def make_item(**overrides: object) -> STACItem:
+    """Build a validated :class:`STACItem` from :func:`make_item_data`."""
+    return STACItem.model_validate(make_item_data(**overrides))
+
+
 SAMPLE_TILEJSON_DATA = {
     "tilejson": "2.2.0",
     "name": "Pre-event",
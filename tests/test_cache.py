@@ -0,0 +1,194 @@
+"""Tests for the response and mosaic search caches."""
+
+import json
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from eo_maxar.cache import MosaicSearchCache, ResponseCache, canonical_hash
+from eo_maxar.client import APIClient
+from eo_maxar.config import settings
+from tests.conftest import (
+    SAMPLE_COLLECTION_DATA,
+    SAMPLE_MOSAIC_REGISTER_DATA,
+    SAMPLE_TILEJSON_DATA,
+)
+
+COLLECTION_URL = f"{settings.stac_api_url}/collections/maxar-open-data__turkey-earthquake-2023"
+MOSAIC_PAYLOAD = {
+    "filter": {"op": "lt", "args": [{"property": "datetime"}, "2023-02-06T00:00:00Z"]},
+    "sortby": [{"field": "tile:clouds_percent", "direction": "asc"}],
+    "metadata": {"name": "Pre-event", "bounds": [36.0, 37.0, 36.5, 37.5]},
+}
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> ResponseCache:
+    return ResponseCache(path=tmp_path / "responses.sqlite", ttl=60, max_bytes=1024 * 1024)
+
+
+class TestResponseCacheStore:
+    def test_set_and_get_round_trip(self, cache: ResponseCache) -> None:
+        cache.set("key", 200, {"ETag": '"v1"', "Content-Encoding": "gzip"}, b"body")
+        entry = cache.get("key")
+
+        assert entry is not None
+        assert entry.body == b"body"
+        assert entry.etag == '"v1"'
+        assert "content-encoding" not in entry.headers
+
+    def test_missing_key_returns_none(self, cache: ResponseCache) -> None:
+        assert cache.get("missing") is None
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=tmp_path / "lru.sqlite", ttl=60, max_bytes=10)
+        cache.set("a", 200, {}, b"12345")
+        cache.set("b", 200, {}, b"12345")
+        cache.get("a")  # "b" is now the least recently used entry
+        cache.set("c", 200, {}, b"12345")
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.get("c") is not None
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "persist.sqlite"
+        ResponseCache(path=path).set("key", 200, {}, b"body")
+        assert ResponseCache(path=path).get("key") is not None
+
+
+class TestCachingClient:
+    @respx.mock
+    def test_fresh_entry_served_from_disk(self, cache: ResponseCache) -> None:
+        route = respx.get(COLLECTION_URL).respond(json=SAMPLE_COLLECTION_DATA)
+
+        with APIClient(cache=cache) as client:
+            first = client.get_collection("maxar-open-data__turkey-earthquake-2023")
+            second = client.get_collection("maxar-open-data__turkey-earthquake-2023")
+
+        assert first == second
+        assert route.call_count == 1
+        assert cache.stats == {"hits": 1, "misses": 1, "revalidations": 0}
+
+    @respx.mock
+    def test_stale_entry_revalidated_with_etag(self, tmp_path: Path) -> None:
+        cache = ResponseCache(path=tmp_path / "stale.sqlite", ttl=0)
+        route = respx.get(COLLECTION_URL).mock(
+            side_effect=[
+                httpx.Response(200, json=SAMPLE_COLLECTION_DATA, headers={"ETag": '"v1"'}),
+                httpx.Response(304),
+            ]
+        )
+
+        with APIClient(cache=cache) as client:
+            client.get_collection("maxar-open-data__turkey-earthquake-2023")
+            result = client.get_collection("maxar-open-data__turkey-earthquake-2023")
+
+        assert result.id == "maxar-open-data__turkey-earthquake-2023"
+        assert route.calls[1].request.headers["If-None-Match"] == '"v1"'
+        assert cache.revalidations == 1
+
+    @respx.mock
+    def test_post_requests_bypass_cache(self, cache: ResponseCache) -> None:
+        route = respx.post(url__startswith=f"{settings.raster_api_url}/searches/register").respond(
+            json=SAMPLE_MOSAIC_REGISTER_DATA
+        )
+
+        with APIClient(cache=cache) as client:
+            client.register_mosaic("c", [0, 0, 1, 1], {}, "Pre-event")
+            client.register_mosaic("c", [0, 0, 2, 2], {}, "Pre-event")
+
+        assert route.call_count == 2
+        assert cache.stats == {"hits": 0, "misses": 0, "revalidations": 0}
+
+
+class TestCanonicalHash:
+    def test_key_order_does_not_matter(self) -> None:
+        assert canonical_hash({"a": 1, "b": [1, 2]}) == canonical_hash({"b": [1, 2], "a": 1})
+
+    def test_different_values_differ(self) -> None:
+        assert canonical_hash({"a": 1}) != canonical_hash({"a": 2})
+
+
+class TestMosaicSearchCache:
+    def test_key_ignores_display_name(self) -> None:
+        renamed = {**MOSAIC_PAYLOAD, "metadata": {**MOSAIC_PAYLOAD["metadata"], "name": "Other"}}
+        assert MosaicSearchCache.key("c", MOSAIC_PAYLOAD) == MosaicSearchCache.key("c", renamed)
+
+    def test_key_depends_on_bounds(self) -> None:
+        moved = {**MOSAIC_PAYLOAD, "metadata": {"name": "Pre-event", "bounds": [0, 0, 1, 1]}}
+        assert MosaicSearchCache.key("c", MOSAIC_PAYLOAD) != MosaicSearchCache.key("c", moved)
+
+    def test_persists_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "searches.json"
+        MosaicSearchCache(path).set("key", "abc123")
+        assert MosaicSearchCache(path).get("key") == "abc123"
+
+    def test_clear_removes_entries(self, tmp_path: Path) -> None:
+        path = tmp_path / "searches.json"
+        cache = MosaicSearchCache(path)
+        cache.set("key", "abc123")
+        cache.clear()
+        assert len(MosaicSearchCache(path)) == 0
+
+    def test_discard_removes_one_entry(self, tmp_path: Path) -> None:
+        path = tmp_path / "searches.json"
+        cache = MosaicSearchCache(path)
+        cache.set("stale", "abc123")
+        cache.set("other", "def456")
+        cache.discard("stale")
+        reloaded = MosaicSearchCache(path)
+        assert reloaded.get("stale") is None
+        assert reloaded.get("other") == "def456"
+
+    @respx.mock
+    def test_stale_cached_search_is_registered_again(self, tmp_path: Path) -> None:
+        path = tmp_path / "searches.json"
+        register = respx.post(url__startswith=f"{settings.raster_api_url}/searches/register").mock(
+            side_effect=[
+                httpx.Response(200, json={"id": "stale"}),
+                httpx.Response(200, json=SAMPLE_MOSAIC_REGISTER_DATA),
+            ]
+        )
+        respx.get(url__startswith=f"{settings.raster_api_url}/searches/stale/").respond(404)
+        respx.get(url__startswith=f"{settings.raster_api_url}/searches/abc123/").respond(
+            json=SAMPLE_TILEJSON_DATA
+        )
+        with APIClient(search_cache=MosaicSearchCache(path)) as client:
+            client.register_mosaic("c", [0, 0, 1, 1], {"op": "lt"}, "Pre-event")
+
+        # A later session reuses the cached ID after the database has been reset.
+        with APIClient(search_cache=MosaicSearchCache(path)) as client:
+            search_id = client.register_mosaic("c", [0, 0, 1, 1], {"op": "lt"}, "Pre-event")
+            tilejson = client.get_tilejson(search_id)
+            again = client.register_mosaic("c", [0, 0, 1, 1], {"op": "lt"}, "Pre-event")
+
+        assert search_id == "stale"
+        assert again == "abc123"
+        assert tilejson.tiles == SAMPLE_TILEJSON_DATA["tiles"]
+        assert register.call_count == 2
+        assert list(json.loads(path.read_text()).values()) == ["abc123"]
+
+    @respx.mock
+    def test_unknown_search_404_is_raised(self) -> None:
+        respx.get(url__startswith=f"{settings.raster_api_url}/searches/nope/").respond(404)
+
+        with APIClient() as client, pytest.raises(httpx.HTTPStatusError):
+            client.get_tilejson("nope")
+
+    @respx.mock
+    def test_client_registers_identical_search_once(self, tmp_path: Path) -> None:
+        route = respx.post(url__startswith=f"{settings.raster_api_url}/searches/register").respond(
+            json=SAMPLE_MOSAIC_REGISTER_DATA
+        )
+        search_cache = MosaicSearchCache(tmp_path / "searches.json")
+
+        with APIClient(search_cache=search_cache) as client:
+            first = client.register_mosaic("c", [0, 0, 1, 1], {"op": "lt"}, "Pre-event")
+        with APIClient(search_cache=MosaicSearchCache(tmp_path / "searches.json")) as client:
+            second = client.register_mosaic("c", [0, 0, 1, 1], {"op": "lt"}, "Pre-event")
+
+        assert first == second == "abc123"
+        assert route.call_count == 1
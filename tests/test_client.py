@@ -1,12 +1,20 @@
 """Tests for APIClient."""
 
+import asyncio
 import json
+import time
+from datetime import datetime, timedelta, timezone
 
 import httpx
 import pytest
 import respx
 
-from eo_maxar.client import APIClient
+from eo_maxar.client import (
+    APIClient,
+    AsyncAPIClient,
+    close_shared_http_client,
+    get_shared_http_client,
+)
 from eo_maxar.config import settings
 from eo_maxar.models import STACCollection, STACItem, TileJSON
 from tests.conftest import (
@@ -31,6 +39,32 @@ class TestAPIClientContextManager:
         assert client.__enter__() is client
         client.close()
 
+    def test_injected_http_client_is_not_closed(self) -> None:
+        http_client = httpx.Client()
+        with APIClient(http_client=http_client) as client:
+            assert client.http_client is http_client
+        assert not http_client.is_closed
+        http_client.close()
+
+    def test_rejects_http_client_with_cache(self, tmp_path) -> None:
+        from eo_maxar.cache import ResponseCache
+
+        with pytest.raises(ValueError, match="either an http_client or a cache"):
+            APIClient(http_client=httpx.Client(), cache=ResponseCache(tmp_path / "c.sqlite"))
+
+
+class TestSharedHTTPClient:
+    def test_returns_same_client(self) -> None:
+        assert get_shared_http_client() is get_shared_http_client()
+
+    def test_recreated_after_close(self) -> None:
+        first = get_shared_http_client()
+        close_shared_http_client()
+        assert first.is_closed
+        second = get_shared_http_client()
+        assert second is not first
+        assert not second.is_closed
+
 
 class TestGetAllCollections:
     @respx.mock
@@ -133,6 +167,224 @@ class TestGetCollectionItems:
         assert "limit=" not in str(req2.calls[0].request.url)
 
 
+class TestIterCollectionItems:
+    @respx.mock
+    def test_yields_first_page_before_requesting_next(self) -> None:
+        page1 = {
+            "type": "FeatureCollection",
+            "features": [SAMPLE_ITEM_DATA],
+            "links": [{"rel": "next", "href": f"{settings.stac_api_url}/items?token=xyz"}],
+        }
+        respx.get(
+            url__startswith=f"{settings.stac_api_url}/collections/turkey-earthquake-2023/items"
+        ).respond(json=page1)
+        req2 = respx.get(url__startswith=f"{settings.stac_api_url}/items").respond(
+            json=SAMPLE_ITEMS_PAGE_DATA
+        )
+
+        with APIClient() as client:
+            stream = client.iter_collection_items("turkey-earthquake-2023")
+            first = next(stream)
+            assert isinstance(first, STACItem)
+            assert not req2.called
+            rest = list(stream)
+
+        assert len(rest) == 1
+        assert req2.called
+
+
+class TestPrefetchPages:
+    @staticmethod
+    def _mock_two_pages() -> tuple[respx.Route, respx.Route]:
+        page1 = {
+            "type": "FeatureCollection",
+            "features": [SAMPLE_ITEM_DATA],
+            "links": [{"rel": "next", "href": f"{settings.stac_api_url}/items?token=xyz"}],
+        }
+        req1 = respx.get(
+            url__startswith=f"{settings.stac_api_url}/collections/turkey-earthquake-2023/items"
+        ).respond(json=page1)
+        req2 = respx.get(url__startswith=f"{settings.stac_api_url}/items").respond(
+            json=SAMPLE_ITEMS_PAGE_DATA
+        )
+        return req1, req2
+
+    @respx.mock
+    def test_next_page_requested_while_current_page_is_consumed(self) -> None:
+        _, req2 = self._mock_two_pages()
+
+        with APIClient(prefetch_pages=True) as client:
+            stream = client.iter_collection_items("turkey-earthquake-2023")
+            next(stream)
+            deadline = time.monotonic() + 1
+            while not req2.called and time.monotonic() < deadline:
+                time.sleep(0.001)
+            assert req2.called
+            assert len(list(stream)) == 1
+
+    @respx.mock
+    def test_prefetch_passes_limit_only_on_first_request(self) -> None:
+        req1, req2 = self._mock_two_pages()
+
+        with APIClient(prefetch_pages=True) as client:
+            result = client.get_collection_items("turkey-earthquake-2023")
+
+        assert len(result) == 2
+        assert "limit=" in str(req1.calls[0].request.url)
+        assert "limit=" not in str(req2.calls[0].request.url)
+
+    @respx.mock
+    def test_async_prefetch_returns_all_items(self) -> None:
+        self._mock_two_pages()
+
+        async def run() -> list[STACItem]:
+            async with AsyncAPIClient(prefetch_pages=True) as client:
+                return await client.get_collection_items("turkey-earthquake-2023")
+
+        assert len(asyncio.run(run())) == 2
+
+
+class TestSearchItems:
+    @respx.mock
+    def test_posts_query_to_search(self) -> None:
+        route = respx.post(f"{settings.stac_api_url}/search").respond(json=SAMPLE_ITEMS_PAGE_DATA)
+        cql2_filter = {"op": "<", "args": [{"property": "eo:cloud_cover"}, 10]}
+
+        with APIClient(prefetch_pages=False) as client:
+            result = client.search_items(
+                "turkey-earthquake-2023",
+                bbox=[36.0, 37.0, 36.5, 37.5],
+                datetime_range=(datetime(2023, 2, 6), None),
+                cql2_filter=cql2_filter,
+            )
+
+        assert [item.id for item in result] == ["item-001"]
+        payload = json.loads(route.calls[0].request.content)
+        assert payload["collections"] == ["turkey-earthquake-2023"]
+        assert payload["bbox"] == [36.0, 37.0, 36.5, 37.5]
+        assert payload["datetime"] == "2023-02-06T00:00:00Z/.."
+        assert payload["filter-lang"] == "cql2-json"
+        assert payload["filter"] == cql2_filter
+        assert payload["limit"] == settings.pagination_limit
+        assert "fields" not in payload
+
+    @respx.mock
+    def test_fields_keep_core_item_fields(self) -> None:
+        route = respx.post(f"{settings.stac_api_url}/search").respond(json=SAMPLE_ITEMS_PAGE_DATA)
+
+        with APIClient(prefetch_pages=False) as client:
+            client.search_items("turkey-earthquake-2023", fields=["datetime"])
+
+        include = json.loads(route.calls[0].request.content)["fields"]["include"]
+        assert "properties.datetime" in include
+        assert {"id", "bbox", "geometry", "assets", "links", "collection"} <= set(include)
+
+    @respx.mock
+    def test_fields_strip_properties_prefix(self) -> None:
+        route = respx.post(f"{settings.stac_api_url}/search").respond(json=SAMPLE_ITEMS_PAGE_DATA)
+
+        with APIClient(prefetch_pages=False) as client:
+            client.search_items(
+                "turkey-earthquake-2023", fields=["properties.gsd", "properties.datetime"]
+            )
+
+        include = json.loads(route.calls[0].request.content)["fields"]["include"]
+        assert "properties.gsd" in include
+        assert include.count("properties.datetime") == 1
+        assert not any(name.startswith("properties.properties.") for name in include)
+
+    @respx.mock
+    def test_unbounded_datetime_range_is_omitted(self) -> None:
+        route = respx.post(f"{settings.stac_api_url}/search").respond(json=SAMPLE_ITEMS_PAGE_DATA)
+
+        with APIClient(prefetch_pages=False) as client:
+            client.search_items("turkey-earthquake-2023", datetime_range=(None, None))
+
+        assert "datetime" not in json.loads(route.calls[0].request.content)
+
+    @respx.mock
+    def test_empty_fields_still_validate(self) -> None:
+        feature = {k: v for k, v in SAMPLE_ITEM_DATA.items() if k != "properties"}
+        route = respx.post(f"{settings.stac_api_url}/search").respond(
+            json={"type": "FeatureCollection", "features": [feature], "links": []}
+        )
+
+        with APIClient(prefetch_pages=False) as client:
+            result = client.search_items("turkey-earthquake-2023", fields=[])
+
+        assert result[0].properties == {}
+        include = json.loads(route.calls[0].request.content)["fields"]["include"]
+        assert "properties.datetime" in include
+
+    @respx.mock
+    def test_aware_datetimes_converted_to_utc(self) -> None:
+        route = respx.post(f"{settings.stac_api_url}/search").respond(json=SAMPLE_ITEMS_PAGE_DATA)
+        start = datetime(2023, 2, 6, 3, 0, tzinfo=timezone(timedelta(hours=3)))
+
+        with APIClient(prefetch_pages=False) as client:
+            client.search_items("turkey-earthquake-2023", datetime_range=(start, None))
+
+        payload = json.loads(route.calls[0].request.content)
+        assert payload["datetime"] == "2023-02-06T00:00:00Z/.."
+
+    def test_rejects_bbox_with_intersects(self) -> None:
+        with APIClient() as client, pytest.raises(ValueError, match="bbox or intersects"):
+            client.search_items(
+                "turkey-earthquake-2023",
+                bbox=[36.0, 37.0, 36.5, 37.5],
+                intersects={"type": "Point", "coordinates": [36.2, 37.2]},
+            )
+
+    @pytest.mark.parametrize("prefetch_pages", [False, True])
+    @respx.mock
+    def test_follows_post_next_links(self, prefetch_pages: bool) -> None:
+        page1 = {
+            "type": "FeatureCollection",
+            "features": [SAMPLE_ITEM_DATA],
+            "links": [
+                {
+                    "rel": "next",
+                    "href": f"{settings.stac_api_url}/search",
+                    "method": "POST",
+                    "body": {"token": "next:abc"},
+                    "merge": True,
+                }
+            ],
+        }
+        route = respx.post(f"{settings.stac_api_url}/search").mock(
+            side_effect=[
+                httpx.Response(200, json=page1),
+                httpx.Response(200, json=SAMPLE_ITEMS_PAGE_DATA),
+            ]
+        )
+
+        with APIClient(prefetch_pages=prefetch_pages) as client:
+            result = client.search_items("turkey-earthquake-2023", bbox=[36.0, 37.0, 36.5, 37.5])
+
+        assert len(result) == 2
+        second = json.loads(route.calls[1].request.content)
+        assert second["token"] == page1["links"][0]["body"]["token"]
+        assert second["bbox"] == [36.0, 37.0, 36.5, 37.5]
+
+    @respx.mock
+    def test_follows_get_next_links(self) -> None:
+        page1 = {
+            "type": "FeatureCollection",
+            "features": [SAMPLE_ITEM_DATA],
+            "links": [{"rel": "next", "href": f"{settings.stac_api_url}/search?token=xyz"}],
+        }
+        respx.post(f"{settings.stac_api_url}/search").respond(json=page1)
+        req2 = respx.get(url__startswith=f"{settings.stac_api_url}/search").respond(
+            json=SAMPLE_ITEMS_PAGE_DATA
+        )
+
+        with APIClient(prefetch_pages=False) as client:
+            result = client.search_items("turkey-earthquake-2023")
+
+        assert len(result) == 2
+        assert req2.called
+
+
 class TestRegisterMosaic:
     @respx.mock
     def test_returns_search_id(self) -> None:
@@ -213,3 +465,106 @@ class TestGetItemTileJSON:
 
         assert route.called
         assert "assets=visual" in str(route.calls[0].request.url)
+
+
+class TestAsyncAPIClient:
+    @respx.mock
+    def test_get_collection_items_handles_pagination(self) -> None:
+        page1 = {
+            "type": "FeatureCollection",
+            "features": [SAMPLE_ITEM_DATA],
+            "links": [{"rel": "next", "href": f"{settings.stac_api_url}/items?token=xyz"}],
+        }
+        respx.get(
+            url__startswith=f"{settings.stac_api_url}/collections/turkey-earthquake-2023/items"
+        ).respond(json=page1)
+        respx.get(url__startswith=f"{settings.stac_api_url}/items").respond(
+            json=SAMPLE_ITEMS_PAGE_DATA
+        )
+
+        async def run() -> list[STACItem]:
+            async with AsyncAPIClient() as client:
+                return await client.get_collection_items("turkey-earthquake-2023")
+
+        result = asyncio.run(run())
+        assert len(result) == 2
+        assert all(isinstance(item, STACItem) for item in result)
+
+    @respx.mock
+    def test_register_mosaic_and_get_tilejson(self) -> None:
+        route = respx.post(url__startswith=f"{settings.raster_api_url}/searches/register").respond(
+            json=SAMPLE_MOSAIC_REGISTER_DATA
+        )
+        respx.get(
+            url__startswith=f"{settings.raster_api_url}/searches/abc123/{settings.tilejson_path}"
+        ).respond(json=SAMPLE_TILEJSON_DATA)
+
+        async def run() -> TileJSON:
+            async with AsyncAPIClient() as client:
+                search_id = await client.register_mosaic(
+                    "turkey-earthquake-2023", [36.0, 37.0, 36.5, 37.5], {"op": "lt"}, "Pre-event"
+                )
+                return await client.get_tilejson(search_id)
+
+        result = asyncio.run(run())
+        assert isinstance(result, TileJSON)
+        payload = json.loads(route.calls[0].request.content)
+        assert payload["filter"]["args"][1] == {"op": "lt"}
+
+    @respx.mock
+    def test_get_collections_fetches_each_id(self) -> None:
+        route = respx.get(url__startswith=f"{settings.stac_api_url}/collections/").respond(
+            json=SAMPLE_COLLECTION_DATA
+        )
+        ids = ["collection-1", "collection-2", "collection-3"]
+
+        async def run() -> dict[str, STACCollection]:
+            async with AsyncAPIClient(max_concurrency=2) as client:
+                return await client.get_collections(ids)
+
+        result = asyncio.run(run())
+        assert list(result) == ids
+        assert route.call_count == 3
+
+    def test_gather_respects_concurrency_limit(self) -> None:
+        in_flight = 0
+        peak = 0
+
+        async def task() -> None:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+        async def run() -> None:
+            async with AsyncAPIClient(max_concurrency=2) as client:
+                await client._gather(task() for _ in range(6))
+
+        asyncio.run(run())
+        assert peak == 2
+
+
+class TestGetVectorTileJSON:
+    @respx.mock
+    def test_filters_to_collection(self) -> None:
+        route = respx.get(
+            url__startswith=f"{settings.vector_api_url}/collections/{settings.vector_items_table}/{settings.tilejson_path}"
+        ).respond(json=SAMPLE_TILEJSON_DATA)
+        with APIClient() as client:
+            result = client.get_vector_tilejson("turkey-earthquake-2023")
+
+        assert isinstance(result, TileJSON)
+        params = route.calls[0].request.url.params
+        assert params["filter"] == "collection='turkey-earthquake-2023'"
+        assert params["filter-lang"] == "cql2-text"
+
+    @respx.mock
+    def test_without_collection_has_no_filter(self) -> None:
+        route = respx.get(url__startswith=settings.vector_api_url).respond(
+            json=SAMPLE_TILEJSON_DATA
+        )
+        with APIClient() as client:
+            client.get_vector_tilejson()
+
+        assert "filter" not in route.calls[0].request.url.params
@@ -1,5 +1,6 @@
 """Tests for MaxarCollection."""
 
+import threading
 from datetime import UTC, datetime
 from unittest.mock import MagicMock
 
@@ -30,6 +31,13 @@ def _make_mock_client(
 
 
 class TestMaxarCollectionCreate:
+    def test_default_client_uses_shared_search_cache(self) -> None:
+        from eo_maxar.client import get_shared_search_cache
+
+        with MaxarCollection("collection-1") as first, MaxarCollection("collection-2") as second:
+            assert first._client.search_cache is get_shared_search_cache()
+            assert second._client.search_cache is first._client.search_cache
+
     def test_create_factory_method(self) -> None:
         collection = MaxarCollection.create("turkey-earthquake-2023")
         assert collection.collection_id == "turkey-earthquake-2023"
@@ -48,6 +56,22 @@ class TestMaxarCollectionCreate:
         assert collection._client is mock_client
         assert collection._visualizer is mock_visualizer
 
+    def test_default_clients_share_connection_pool(self) -> None:
+        first = MaxarCollection("collection-1")
+        second = MaxarCollection("collection-2")
+        assert first._client.http_client is second._client.http_client
+
+    def test_context_manager_keeps_shared_pool_open(self) -> None:
+        with MaxarCollection("test-collection") as collection:
+            http_client = collection._client.http_client
+        assert not http_client.is_closed
+
+    def test_close_leaves_injected_client_open(self) -> None:
+        mock_client = MagicMock()
+        with MaxarCollection("test-collection", client=mock_client):
+            pass
+        mock_client.close.assert_not_called()
+
 
 class TestMaxarCollectionInfo:
     def test_info_calls_get_collection(self) -> None:
@@ -78,6 +102,114 @@ class TestMaxarCollectionInfo:
         assert len(items) == 1
         mock_client.get_collection_items.assert_called_once_with("test-collection")
 
+    def test_iter_items_streams_from_client(self) -> None:
+        from tests.conftest import SAMPLE_ITEM_DATA
+
+        mock_client = MagicMock()
+        mock_client.iter_collection_items.return_value = iter([
+            STACItem.model_validate(SAMPLE_ITEM_DATA)
+        ])
+        collection = MaxarCollection("test-collection", client=mock_client)
+
+        items = list(collection.iter_items())
+
+        assert len(items) == 1
+        mock_client.iter_collection_items.assert_called_once_with("test-collection")
+        assert "items" not in collection.__dict__
+
+    def test_iter_items_reuses_cached_items(self) -> None:
+        mock_client = MagicMock()
+        collection = MaxarCollection("test-collection", client=mock_client)
+        collection.__dict__["items"] = []
+
+        assert list(collection.iter_items()) == []
+        mock_client.iter_collection_items.assert_not_called()
+
+    def test_item_table_reuses_loaded_items(self) -> None:
+        from tests.conftest import SAMPLE_ITEM_DATA
+
+        mock_client = _make_mock_client(item_data=SAMPLE_ITEM_DATA)
+        collection = MaxarCollection("test-collection", client=mock_client)
+        _ = collection.items
+
+        assert list(collection.item_table.ids) == ["item-001"]
+        mock_client.get_collection_item_table.assert_not_called()
+
+    def test_item_table_fetched_from_client(self) -> None:
+        mock_client = MagicMock()
+        collection = MaxarCollection("test-collection", client=mock_client)
+
+        assert collection.item_table is mock_client.get_collection_item_table.return_value
+        mock_client.get_collection_item_table.assert_called_once_with("test-collection")
+
+    def test_items_intersecting_uses_spatial_index(self) -> None:
+        from tests.conftest import SAMPLE_ITEM_DATA
+
+        mock_client = _make_mock_client(item_data=SAMPLE_ITEM_DATA)
+        collection = MaxarCollection("test-collection", client=mock_client)
+
+        assert [i.id for i in collection.items_intersecting([36.1, 37.1, 36.2, 37.2])] == [
+            "item-001"
+        ]
+        assert collection.items_intersecting([0, 0, 1, 1]) == []
+        assert [i.id for i in collection.items_containing((36.25, 37.25))] == ["item-001"]
+        nearest = collection.nearest_item((0.0, 0.0))
+        assert nearest is not None
+        assert nearest.id == "item-001"
+
+    def test_refresh_invalidates_items_and_index(self) -> None:
+        from tests.conftest import SAMPLE_ITEM_DATA
+
+        mock_client = _make_mock_client(item_data=SAMPLE_ITEM_DATA)
+        collection = MaxarCollection("test-collection", client=mock_client)
+        first_index = collection.spatial_index
+
+        collection.refresh()
+
+        assert collection.spatial_index is not first_index
+        assert mock_client.get_collection_items.call_count == 2
+
+
+class TestQueryItems:
+    def test_passes_query_to_client(self) -> None:
+        mock_client = _make_mock_client()
+        mock_client.search_items.return_value = []
+        collection = MaxarCollection("test-collection", client=mock_client)
+        cql2_filter = {"op": "<", "args": [{"property": "eo:cloud_cover"}, 10]}
+
+        collection.query_items(bbox=[0, 0, 1, 1], cql2_filter=cql2_filter, fields=iter(["gsd"]))
+
+        mock_client.search_items.assert_called_once_with(
+            "test-collection", [0, 0, 1, 1], None, None, cql2_filter, ["gsd"]
+        )
+        mock_client.get_collection_items.assert_not_called()
+
+    def test_results_cached_per_query(self) -> None:
+        from tests.conftest import SAMPLE_ITEM_DATA
+
+        mock_client = _make_mock_client()
+        mock_client.search_items.return_value = [STACItem.model_validate(SAMPLE_ITEM_DATA)]
+        collection = MaxarCollection("test-collection", client=mock_client)
+        start = datetime(2023, 2, 6, tzinfo=UTC)
+
+        first = collection.query_items(bbox=[0, 0, 1, 1], datetime_range=(start, None))
+        again = collection.query_items(bbox=[0, 0, 1, 1], datetime_range=(start, None))
+        collection.query_items(bbox=[0, 0, 2, 2], datetime_range=(start, None))
+
+        assert again is first
+        assert mock_client.search_items.call_count == 2
+
+    def test_refresh_clears_query_cache(self) -> None:
+        mock_client = _make_mock_client()
+        mock_client.search_items.return_value = []
+        collection = MaxarCollection("test-collection", client=mock_client)
+
+        collection.query_items(bbox=[0, 0, 1, 1])
+        collection.refresh()
+        collection.query_items(bbox=[0, 0, 1, 1])
+
+        assert mock_client.search_items.call_count == 2
+
 
 class TestMaxarCollectionMaps:
     def test_collection_bbox_map(self) -> None:
@@ -94,17 +226,25 @@ class TestMaxarCollectionMaps:
         from tests.conftest import SAMPLE_ITEM_DATA
 
         mock_client = _make_mock_client(item_data=SAMPLE_ITEM_DATA)
-        # Mock items to bypass the client call to get_collection_items
         collection = MaxarCollection("test-collection", client=mock_client)
-        collection.__dict__["items"] = []  # Just so it doesn't trigger get_collection_items
-        collection._visualizer.create_pre_post_event_map = MagicMock()
+        collection._visualizer.create_partitioned_event_map = MagicMock()
 
         event_date = datetime(2023, 2, 6, tzinfo=UTC)
         collection.pre_post_map(event_date)
-        collection._visualizer.create_pre_post_event_map.assert_called_once_with(
-            [], event_date, None
+        collection._visualizer.create_partitioned_event_map.assert_called_once_with(
+            [], collection.items, None
         )
 
+    def test_vector_footprints_map(self) -> None:
+        mock_client = _make_mock_client(tilejson_data=SAMPLE_TILEJSON_DATA)
+        mock_client.get_vector_tilejson.return_value = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        collection = MaxarCollection("test-collection", client=mock_client)
+        collection._visualizer.create_vector_footprints_map = MagicMock()
+
+        collection.vector_footprints_map()
+        mock_client.get_vector_tilejson.assert_called_once_with("test-collection")
+        collection._visualizer.create_vector_footprints_map.assert_called_once()
+
     def test_single_cog_map(self) -> None:
         mock_client = _make_mock_client(tilejson_data=SAMPLE_TILEJSON_DATA)
         collection = MaxarCollection("test-collection", client=mock_client)
@@ -177,3 +317,46 @@ class TestMaxarCollectionMaps:
         call_args = mock_client.register_mosaic.call_args
         filter_args = call_args[0][2]
         assert filter_args["args"][1] == "2023-02-06T12:30:00Z"
+
+
+class TestGetMosaicTileJSONs:
+    def test_returns_tilejsons_in_spec_order(self) -> None:
+        mock_client = _make_mock_client(tilejson_data=SAMPLE_TILEJSON_DATA)
+        mock_client.register_mosaic.side_effect = lambda cid, bbox, f, name: name
+        mock_client.get_tilejson.side_effect = lambda search_id: TileJSON.model_validate({
+            **SAMPLE_TILEJSON_DATA,
+            "name": search_id,
+        })
+        collection = MaxarCollection("test-collection", client=mock_client)
+        event_date = datetime(2023, 2, 6, tzinfo=UTC)
+
+        result = collection.get_mosaic_tilejsons([
+            ([1, 2, 3, 4], event_date, "post"),
+            ([1, 2, 3, 4], event_date, "pre"),
+        ])
+
+        assert [tj.name for tj in result] == ["Post-event", "Pre-event"]
+
+    def test_specs_are_resolved_concurrently(self) -> None:
+        mock_client = _make_mock_client(tilejson_data=SAMPLE_TILEJSON_DATA)
+        # Both registrations must be in flight at once for the barrier to release.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def register_mosaic(*args: object) -> str:
+            barrier.wait()
+            return "abc123"
+
+        mock_client.register_mosaic.side_effect = register_mosaic
+        collection = MaxarCollection("test-collection", client=mock_client)
+        event_date = datetime(2023, 2, 6, tzinfo=UTC)
+
+        result = collection.get_mosaic_tilejsons([
+            ([1, 2, 3, 4], event_date, "pre"),
+            ([1, 2, 3, 4], event_date, "post"),
+        ])
+
+        assert len(result) == 2
+
+    def test_empty_specs(self) -> None:
+        collection = MaxarCollection("test-collection", client=MagicMock())
+        assert collection.get_mosaic_tilejsons([]) == []
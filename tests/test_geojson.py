@@ -1,6 +1,23 @@
 """Tests for GeoJSON helper functions."""
 
-from eo_maxar.geojson import bbox_to_polygon_geometry, bboxes_to_feature_collection
+import pytest
+
+from eo_maxar.geojson import (
+    bbox_to_polygon_geometry,
+    bboxes_to_feature_collection,
+    items_to_footprint_collection,
+    tolerance_for_zoom,
+)
+from eo_maxar.models import STACItem
+from tests.conftest import make_item
+
+
+def _dense_item() -> STACItem:
+    # A square with many collinear points along its bottom edge.
+    bottom = [[36.0 + i * 0.005, 37.0] for i in range(101)]
+    ring = [*bottom, [36.5, 37.5], [36.0, 37.5], [36.0, 37.0]]
+    geometry = {"type": "Polygon", "coordinates": [ring]}
+    return make_item(geometry=geometry)
 
 
 class TestBboxToPolygonGeometry:
@@ -56,3 +73,41 @@ class TestBboxesToFeatureCollection:
         bboxes = [[36.0, 37.0, 36.5, 37.5]]
         result = bboxes_to_feature_collection(bboxes, bboxes[0])
         assert result["features"][0]["geometry"]["type"] == "Polygon"
+
+
+class TestToleranceForZoom:
+    def test_zoom_zero_pixel_spans_world_tile(self) -> None:
+        assert tolerance_for_zoom(0, pixels=256) == pytest.approx(360)
+
+    def test_halves_per_zoom_level(self) -> None:
+        assert tolerance_for_zoom(11) == pytest.approx(tolerance_for_zoom(10) / 2)
+
+
+class TestItemsToFootprintCollection:
+    def test_keeps_only_geometry_and_requested_properties(self) -> None:
+        item = make_item()
+        result = items_to_footprint_collection([item])
+        feature = result["features"][0]
+
+        assert result["type"] == "FeatureCollection"
+        assert set(feature) == {"type", "id", "geometry", "properties"}
+        assert feature["id"] == "item-001"
+        assert feature["properties"] == {"datetime": "2023-02-06T10:00:00Z"}
+
+    def test_quantizes_coordinates(self) -> None:
+        geometry = {
+            "type": "Polygon",
+            "coordinates": [[[36.123456, 37.0], [36.5, 37.0], [36.5, 37.5], [36.123456, 37.0]]],
+        }
+        item = make_item(geometry=geometry)
+        feature = items_to_footprint_collection([item], precision=2)["features"][0]
+        assert feature["geometry"]["coordinates"][0][0] == [36.12, 37.0]
+
+    def test_simplifies_by_zoom(self) -> None:
+        feature = items_to_footprint_collection([_dense_item()], zoom=8)["features"][0]
+        assert len(feature["geometry"]["coordinates"][0]) == 5
+
+    def test_falls_back_to_bbox_without_geometry(self) -> None:
+        item = make_item(geometry=None)
+        feature = items_to_footprint_collection([item])["features"][0]
+        assert feature["geometry"]["type"] == "Polygon"
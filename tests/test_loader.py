@@ -1,13 +1,18 @@
 """Tests for DataLoader."""
 
+import io
+import json
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import ANY, MagicMock, patch
 
 import pytest
+from pypgstac.load import Methods
 
 from eo_maxar.config import Settings
-from eo_maxar.loader import DataLoader
+from eo_maxar.loader import BatchTiming, DataLoader, iter_file_records, iter_json_records
+from eo_maxar.manifest import LoadManifest, file_digest
 
 
 @pytest.fixture
@@ -20,6 +25,9 @@ def settings(tmp_path: Path) -> Settings:
         postgres_host="localhost",
         postgres_port=5432,
         postgres_dbname="testdb",
+        loader_incremental=False,
+        loader_max_workers=1,
+        loader_summary_path=tmp_path / "summary" / "load_summary.json",
     )
 
 
@@ -39,80 +47,409 @@ class TestItemTypeFromFilename:
         assert DataLoader._item_type_from_filename("data.zip") == "data"
 
 
-class TestUnzipFiles:
-    def test_unzips_existing_file(self, loader: DataLoader, tmp_path: Path) -> None:
-        zip_path = tmp_path / "collections.json.zip"
-        with zipfile.ZipFile(zip_path, "w") as zf:
-            zf.writestr("collections.json", '{"type": "FeatureCollection"}')
+def write_zip(path: Path, members: dict[str, str]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, text in members.items():
+            zf.writestr(name, text)
+    return path
 
-        loader._unzip_files()
 
-        assert (tmp_path / "collections.json").exists()
+RECORDS = [{"id": str(i), "padding": "x" * i} for i in range(20)]
 
-    def test_skips_missing_file(self, loader: DataLoader, tmp_path: Path) -> None:
-        # No zip files exist — should log a warning but not raise
-        loader._unzip_files()
 
-    def test_creates_data_directory(self, loader: DataLoader, tmp_path: Path) -> None:
-        new_dir = tmp_path / "newsubdir"
-        loader.data_path = new_dir
-        loader._unzip_files()
-        assert new_dir.exists()
+class TestIterJsonRecords:
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_json_array(self, chunk_size: int) -> None:
+        stream = io.StringIO(json.dumps(RECORDS, indent=2))
+        assert list(iter_json_records(stream, chunk_size)) == RECORDS
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+    def test_ndjson(self, chunk_size: int) -> None:
+        stream = io.StringIO("\n".join(json.dumps(record) for record in RECORDS) + "\n")
+        assert list(iter_json_records(stream, chunk_size)) == RECORDS
+
+    def test_feature_collection_yields_features(self) -> None:
+        stream = io.StringIO(json.dumps({"type": "FeatureCollection", "features": RECORDS}))
+        assert list(iter_json_records(stream, 16)) == RECORDS
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 64])
+    def test_multi_chunk_feature_collection_streams_features(self, chunk_size: int) -> None:
+        features = [{"id": f"f{i}", "properties": {"gsd": 0.5 + i}} for i in range(50)]
+        document = {"features": features, "type": "FeatureCollection", "links": []}
+        stream = io.StringIO(json.dumps(document))
+
+        records = iter_json_records(stream, chunk_size)
+
+        assert next(records) == features[0]
+        assert stream.tell() < len(json.dumps(document))
+        assert [features[0], *records] == features
+
+    def test_large_single_record(self) -> None:
+        record = {"id": "c", "type": "Collection", "features": [1, 2], "extent": 12345}
+        assert list(iter_json_records(io.StringIO(json.dumps(record)), 3)) == [record]
+
+    def test_empty_array(self) -> None:
+        assert list(iter_json_records(io.StringIO("[ ]"))) == []
+
+    def test_truncated_record_raises(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_records(io.StringIO('[{"id": "a"'), 4))
+
+
+class TestIterFileRecords:
+    def test_streams_zip_members_skipping_junk(self, tmp_path: Path) -> None:
+        path = write_zip(
+            tmp_path / "collections.json.zip",
+            {
+                "collections.json": json.dumps(RECORDS[:2]),
+                "__MACOSX/._collections.json": "not json",
+                "notes.txt": "not json",
+            },
+        )
+        assert list(iter_file_records(path)) == RECORDS[:2]
+        assert not (tmp_path / "collections.json").exists()
+
+    def test_reads_plain_ndjson_file(self, tmp_path: Path) -> None:
+        path = tmp_path / "items.ndjson"
+        path.write_text('{"id": "a"}\n{"id": "b"}\n')
+        assert [record["id"] for record in iter_file_records(path)] == ["a", "b"]
+
+
+@pytest.fixture
+def pgstac_loader():
+    """Patch pypgstac's in-process loader and yield the mocked ``Loader`` instance."""
+    with (
+        patch("eo_maxar.loader.ConnectionPool"),
+        patch("eo_maxar.loader.PgstacDB") as db_cls,
+        patch("eo_maxar.loader.Loader") as loader_cls,
+    ):
+        db_cls.return_value.__enter__.return_value.query_one.return_value = 0
+        yield loader_cls.return_value
 
 
 class TestLoadDataToPgstac:
-    def test_runs_pypgstac_command(self, loader: DataLoader, tmp_path: Path) -> None:
-        (tmp_path / "collections.json").write_text("{}")
-        (tmp_path / "items.json").write_text("{}")
+    def test_loads_collections_then_items(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        write_zip(tmp_path / "collections.json.zip", {"collections.json": '[{"id": "c"}]'})
+        write_zip(tmp_path / "items.json.zip", {"items.json": '{"id": "a"}\n{"id": "b"}\n'})
+
+        loader._load_data_to_pgstac()
+
+        pgstac_loader.load_collections.assert_called_once()
+        pgstac_loader.load_items.assert_called_once()
+        items = list(pgstac_loader.load_items.call_args[0][0])
+        assert [item["id"] for item in items] == ["a", "b"]
+        assert pgstac_loader.load_items.call_args.kwargs["insert_mode"] == Methods.insert_ignore
+
+    def test_records_timing_per_batch(
+        self, settings: Settings, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        settings.loader_batch_size = 2
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:5])})
+        loader = DataLoader(settings)
+
+        loader._load_data_to_pgstac()
+
+        assert pgstac_loader.load_items.call_count == 3
+        assert [t.rows for t in loader.batch_timings] == [2, 2, 1]
+        assert all(t.item_type == "items" for t in loader.batch_timings)
+
+    def test_raises_on_load_error(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        write_zip(tmp_path / "collections.json.zip", {"collections.json": '[{"id": "c"}]'})
+        pgstac_loader.load_collections.side_effect = Exception("version mismatch")
+
+        with pytest.raises(RuntimeError, match="pypgstac failed"):
+            loader._load_data_to_pgstac()
 
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = "some output"
+    def test_skips_missing_json_file(self, loader: DataLoader, pgstac_loader: MagicMock) -> None:
+        # No data files exist — should log warnings but not load anything
+        loader._load_data_to_pgstac()
+        pgstac_loader.load_collections.assert_not_called()
+        pgstac_loader.load_items.assert_not_called()
+
+
+def thread_pool(max_workers: int, mp_context: object) -> ThreadPoolExecutor:
+    """Stand-in for ProcessPoolExecutor so patched pypgstac mocks reach the workers."""
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+class TestLoadPaths:
+    @pytest.fixture
+    def data_dir(self, tmp_path: Path) -> Path:
+        data_dir = tmp_path / "dumps"
+        data_dir.mkdir()
+        (data_dir / "items_b.ndjson").write_text('{"id": "b1"}\n')
+        (data_dir / "items_a.json").write_text('[{"id": "a1"}, {"id": "a2"}]')
+        write_zip(data_dir / "collections.json.zip", {"collections.json": '[{"id": "c"}]'})
+        (data_dir / "notes.txt").write_text("ignored")
+        return data_dir
+
+    def test_loads_collections_before_items(
+        self, loader: DataLoader, data_dir: Path, pgstac_loader: MagicMock
+    ) -> None:
+        results = loader.load_paths([data_dir], max_workers=1)
+
+        assert [Path(r.path).name for r in results] == [
+            "collections.json.zip",
+            "items_a.json",
+            "items_b.ndjson",
+        ]
+        calls = [name for name, *_ in pgstac_loader.method_calls]
+        assert calls == ["load_collections", "load_items", "load_items"]
+
+    def test_reports_failures_per_file(
+        self, loader: DataLoader, data_dir: Path, pgstac_loader: MagicMock
+    ) -> None:
+        pgstac_loader.load_items.side_effect = [Exception("boom"), None]
+
+        results = loader.load_paths([data_dir], max_workers=1)
+
+        assert [r.status for r in results] == ["loaded", "failed", "loaded"]
+        assert results[1].error == "boom"
+        assert results[2].written == 1
+
+    def test_raises_listing_failed_files(
+        self, loader: DataLoader, data_dir: Path, pgstac_loader: MagicMock
+    ) -> None:
+        pgstac_loader.load_items.side_effect = Exception("boom")
+
+        with pytest.raises(RuntimeError, match=r"items_a\.json: boom") as exc_info:
+            loader._load_data_to_pgstac([data_dir])
+        assert "items_b.ndjson: boom" in str(exc_info.value)
+
+    def test_parallel_workers_collect_results(
+        self, loader: DataLoader, data_dir: Path, pgstac_loader: MagicMock
+    ) -> None:
+        with patch("eo_maxar.loader.ProcessPoolExecutor", thread_pool):
+            results = loader.load_paths([data_dir], max_workers=2)
+
+        assert [r.status for r in results] == ["loaded"] * 3
+        assert sum(r.written for r in results) == 4
+        assert len(loader.batch_timings) == 3
+
+    def test_missing_file_is_reported(self, loader: DataLoader, tmp_path: Path) -> None:
+        results = loader.load_paths([tmp_path / "items.json.zip"])
+        assert results[0].status == "missing"
+
+
+class TestIncrementalLoad:
+    @pytest.fixture
+    def manifest(self, loader: DataLoader) -> MagicMock:
+        loader.settings.loader_incremental = True
+        manifest = MagicMock(spec=LoadManifest)
+        loader._manifest = manifest
+        return manifest
+
+    def test_creates_manifest_tables_before_parallel_workers(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock, manifest: MagicMock
+    ) -> None:
+        for name in ("items_a.json", "items_b.json"):
+            (tmp_path / name).write_text(json.dumps(RECORDS[:1]))
+
+        def executor(max_workers: int, mp_context: object) -> ThreadPoolExecutor:
+            manifest.ensure_schema.assert_called_once_with()
+            return thread_pool(max_workers, mp_context)
+
+        with patch("eo_maxar.loader.ProcessPoolExecutor", executor):
+            results = loader.load_paths([tmp_path], max_workers=2)
+
+        assert [r.status for r in results] == ["loaded", "loaded"]
+
+    def test_skips_unchanged_file(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock, manifest: MagicMock
+    ) -> None:
+        path = write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS)})
+        manifest.is_loaded.return_value = True
+
+        loader._load_data_to_pgstac()
+
+        manifest.is_loaded.assert_called_once_with(path, file_digest(path))
+        pgstac_loader.load_items.assert_not_called()
+        manifest.record_file.assert_not_called()
+
+    def test_upserts_only_changed_records(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock, manifest: MagicMock
+    ) -> None:
+        items = [{"id": "a", "collection": "c"}, {"id": "b", "collection": "c"}]
+        path = write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(items)})
+        manifest.is_loaded.return_value = False
+        manifest.changed.return_value = {("c", "b")}
+
+        loader._load_data_to_pgstac()
+
+        written = list(pgstac_loader.load_items.call_args[0][0])
+        assert written == [items[1]]
+        assert pgstac_loader.load_items.call_args.kwargs["insert_mode"] == Methods.upsert
+        manifest.record_items.assert_called_once_with("items", {("c", "b"): ANY})
+        manifest.record_file.assert_called_once_with(path, file_digest(path), "items", 2)
+        assert (loader.batch_timings[0].rows, loader.batch_timings[0].skipped) == (1, 1)
+
+    def test_batch_with_no_changes_writes_nothing(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock, manifest: MagicMock
+    ) -> None:
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:3])})
+        manifest.is_loaded.return_value = False
+        manifest.changed.return_value = set()
+
+        loader._load_data_to_pgstac()
+
+        pgstac_loader.load_items.assert_not_called()
+        manifest.record_file.assert_called_once()
+
+
+class TestInstrumentation:
+    def test_does_not_count_existing_rows_by_default(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:5])})
+        with patch.object(DataLoader, "_count_existing") as count_existing:
+            loader._load_data_to_pgstac()
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+        count_existing.assert_not_called()
+        timing = loader.batch_timings[0]
+        assert (timing.rows, timing.existing, timing.inserted) == (5, 0, 5)
+
+    def test_counts_existing_rows_as_ignored(
+        self, settings: Settings, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        settings.loader_count_existing = True
+        loader = DataLoader(settings)
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:5])})
+        with patch.object(DataLoader, "_count_existing", return_value=2):
             loader._load_data_to_pgstac()
 
-        assert mock_run.call_count == 2
-        first_call = mock_run.call_args_list[0][0][0]
-        assert first_call[0] == "pypgstac"
-        assert first_call[1] == "load"
-        assert first_call[2] == "collections"
+        timing = loader.batch_timings[0]
+        assert (timing.rows, timing.existing, timing.inserted) == (5, 2, 3)
+        assert timing.parse_seconds >= 0
+
+    def test_count_existing_matches_items_by_collection_and_id(self) -> None:
+        db = MagicMock()
+        db.query_one.return_value = 1
+        records = [{"id": "a", "collection": "c"}, {"id": "b", "collection": "c"}]
 
-    def test_raises_on_nonzero_returncode(self, loader: DataLoader, tmp_path: Path) -> None:
-        (tmp_path / "collections.json").write_text("{}")
+        assert DataLoader._count_existing(db, "items", records) == 1
+        assert db.query_one.call_args[0][1] == [["c", "c"], ["a", "b"]]
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stdout = "out"
-        mock_result.stderr = "err"
+    def test_progress_called_per_batch(
+        self, settings: Settings, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        settings.loader_batch_size = 2
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:5])})
+        updates: list[BatchTiming] = []
 
+        DataLoader(settings, progress=updates.append)._load_data_to_pgstac()
+
+        assert [t.batch for t in updates] == [1, 2, 3]
+
+    def test_run_writes_json_summary(
+        self, loader: DataLoader, tmp_path: Path, pgstac_loader: MagicMock
+    ) -> None:
+        write_zip(tmp_path / "items.json.zip", {"items.json": json.dumps(RECORDS[:5])})
         with (
-            patch("subprocess.run", return_value=mock_result),
-            pytest.raises(RuntimeError, match="pypgstac failed"),
+            patch.object(loader, "_configure_pgstac_context"),
+            patch.object(loader, "_run_maintenance"),
         ):
-            loader._load_data_to_pgstac()
+            summary = loader.run()
+
+        written = json.loads(loader.settings.loader_summary_path.read_text())
+        assert [stage["stage"] for stage in written["stages"]] == [
+            "parse",
+            "load",
+            "configure",
+            "maintenance",
+        ]
+        parse, load = summary.stages[:2]
+        assert parse.bytes_read == (tmp_path / "items.json.zip").stat().st_size
+        assert (load.records, load.inserted, load.ignored) == (5, 5, 0)
+        assert written["files"][1]["status"] == "loaded"
+
+    def test_summary_written_when_run_fails(self, loader: DataLoader) -> None:
+        with (
+            patch.object(loader, "_load_data_to_pgstac", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError),
+        ):
+            loader.run()
 
-    def test_skips_missing_json_file(self, loader: DataLoader, tmp_path: Path) -> None:
-        # No extracted .json files exist — should log warnings but not call subprocess
-        with patch("subprocess.run") as mock_run:
-            loader._load_data_to_pgstac()
-        mock_run.assert_not_called()
+        written = json.loads(loader.settings.loader_summary_path.read_text())
+        assert [stage["stage"] for stage in written["stages"]] == ["parse", "load"]
 
 
 class TestRun:
     def test_run_calls_all_steps(self, loader: DataLoader) -> None:
         with (
-            patch.object(loader, "_unzip_files") as mock_unzip,
             patch.object(loader, "_load_data_to_pgstac") as mock_load,
             patch.object(loader, "_configure_pgstac_context") as mock_config,
+            patch.object(loader, "_run_maintenance") as mock_maintenance,
         ):
             loader.run()
-            mock_unzip.assert_called_once()
             mock_load.assert_called_once()
             mock_config.assert_called_once()
+            mock_maintenance.assert_called_once()
+
+    def test_run_can_skip_maintenance(self, loader: DataLoader) -> None:
+        loader.settings.pgstac_maintenance = False
+        with (
+            patch.object(loader, "_load_data_to_pgstac"),
+            patch.object(loader, "_configure_pgstac_context"),
+            patch.object(loader, "_run_maintenance") as mock_maintenance,
+        ):
+            loader.run()
+        mock_maintenance.assert_not_called()
+
+
+@pytest.fixture
+def mock_cursor():
+    """Patch ``psycopg.connect`` and yield the cursor its connection hands out."""
+    mock_conn = MagicMock()
+    mock_cursor = MagicMock()
+    mock_conn.__enter__.return_value = mock_conn
+    mock_conn.__exit__.return_value = False
+    mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+    mock_conn.cursor.return_value.__exit__.return_value = False
+    with patch("psycopg.connect", return_value=mock_conn):
+        yield mock_cursor
+
+
+class TestRunMaintenance:
+    def test_sets_partitioning_queryables_and_analyzes(
+        self, loader: DataLoader, mock_cursor: MagicMock
+    ) -> None:
+        loader._run_maintenance()
+
+        statements = [" ".join(c[0][0].split()) for c in mock_cursor.execute.call_args_list]
+        assert statements[0].startswith("UPDATE collections SET partition_trunc")
+        assert mock_cursor.execute.call_args_list[0][0][1] == ("month", "month")
+        registered = {
+            c[0][1]["name"] for c in mock_cursor.execute.call_args_list if "queryables" in c[0][0]
+        }
+        assert registered == {"datetime", "tile:clouds_percent", "view:off_nadir", "gsd"}
+        assert statements[-3:] == [
+            "SELECT maintain_partitions();",
+            "ANALYZE collections;",
+            "ANALYZE items;",
+        ]
+
+    def test_leaves_partitioning_alone_when_unset(
+        self, loader: DataLoader, mock_cursor: MagicMock
+    ) -> None:
+        loader.settings.pgstac_partition_trunc = None
+        loader._run_maintenance()
+        assert "partition_trunc" not in mock_cursor.execute.call_args_list[0][0][0]
 
 
 class TestConfigurePgstacContext:
+    def test_context_off_by_default(self, loader: DataLoader, mock_cursor: MagicMock) -> None:
+        loader._configure_pgstac_context()
+        assert mock_cursor.execute.call_args[0][1] == ("off",)
+
+    def test_context_on_when_enabled(self, loader: DataLoader, mock_cursor: MagicMock) -> None:
+        loader.settings.pgstac_context = True
+        loader._configure_pgstac_context()
+        assert mock_cursor.execute.call_args[0][1] == ("on",)
+
     def test_executes_sql_query(self, loader: DataLoader) -> None:
         mock_conn = MagicMock()
         mock_cursor = MagicMock()
@@ -0,0 +1,72 @@
+"""Tests for the load manifest helpers."""
+
+import hashlib
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from eo_maxar.manifest import LoadManifest, file_digest, record_checksums, record_key
+
+
+def mock_pool(rows: list[tuple]) -> tuple[MagicMock, MagicMock]:
+    """Return a mock pool and the connection its ``connection()`` context yields."""
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    conn.execute.return_value.fetchone.return_value = rows[0] if rows else None
+    conn.execute.return_value.fetchall.return_value = rows
+    return pool, conn
+
+
+class TestFileDigest:
+    def test_matches_sha256(self, tmp_path: Path) -> None:
+        path = tmp_path / "items.json"
+        path.write_bytes(b"[]")
+        assert file_digest(path) == hashlib.sha256(b"[]").hexdigest()
+
+
+class TestRecordChecksums:
+    def test_collection_key_has_no_collection(self) -> None:
+        assert record_key({"type": "Collection", "id": "c"}) == ("", "c")
+
+    def test_item_key_includes_collection(self) -> None:
+        assert record_key({"type": "Feature", "id": "a", "collection": "c"}) == ("c", "a")
+
+    def test_checksum_changes_with_content(self) -> None:
+        before = record_checksums([{"id": "a", "collection": "c", "properties": {"gsd": 0.5}}])
+        after = record_checksums([{"id": "a", "collection": "c", "properties": {"gsd": 0.6}}])
+        assert before.keys() == after.keys()
+        assert before != after
+
+
+class TestLoadManifest:
+    def test_is_loaded_compares_digest(self) -> None:
+        pool, _ = mock_pool([("abc",)])
+        manifest = LoadManifest(pool)
+        assert manifest.is_loaded(Path("items.json.zip"), "abc")
+        assert not manifest.is_loaded(Path("items.json.zip"), "def")
+
+    def test_is_loaded_false_for_unknown_file(self) -> None:
+        pool, _ = mock_pool([])
+        assert not LoadManifest(pool).is_loaded(Path("items.json.zip"), "abc")
+
+    def test_changed_returns_keys_from_query(self) -> None:
+        pool, conn = mock_pool([("c", "b")])
+        changed = LoadManifest(pool).changed("items", {("c", "a"): "1", ("c", "b"): "2"})
+
+        assert changed == {("c", "b")}
+        params = conn.execute.call_args[0][1]
+        assert params == (["c", "c"], ["a", "b"], ["1", "2"], "items")
+
+    def test_empty_checksums_skip_database(self) -> None:
+        pool, _ = mock_pool([])
+        manifest = LoadManifest(pool)
+        assert manifest.changed("items", {}) == set()
+        manifest.record_items("items", {})
+        pool.connection.assert_not_called()
+
+    def test_schema_created_once(self) -> None:
+        pool, conn = mock_pool([("abc",)])
+        manifest = LoadManifest(pool)
+        manifest.is_loaded(Path("a"), "abc")
+        manifest.is_loaded(Path("b"), "abc")
+        statements = [call[0][0] for call in conn.execute.call_args_list]
+        assert sum("CREATE TABLE" in statement for statement in statements) == 1
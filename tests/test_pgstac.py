@@ -0,0 +1,129 @@
+"""Tests for PgSTACClient."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from eo_maxar.collection import MaxarCollection
+from eo_maxar.config import settings
+from eo_maxar.models import STACCollection, STACItem
+from eo_maxar.pgstac import PgSTACClient
+from eo_maxar.table import ItemTable
+from tests.conftest import SAMPLE_COLLECTION_DATA, make_item_data
+
+
+def _stored_item(item_id: str) -> dict:
+    """Item JSON as hydrated by pgSTAC, which may have no links."""
+    item = make_item_data(id=item_id)
+    del item["links"]
+    return item
+
+
+@pytest.fixture
+def mock_pool() -> MagicMock:
+    pool = MagicMock()
+    conn = pool.connection.return_value.__enter__.return_value
+    cursor = conn.cursor.return_value.__enter__.return_value
+    cursor.__iter__.return_value = iter([(_stored_item("item-001"),), (_stored_item("item-002"),)])
+    conn.execute.return_value.fetchone.return_value = (
+        "collection = 'test-collection'",
+        "datetime DESC, id DESC",
+    )
+    return pool
+
+
+@pytest.fixture
+def client(mock_pool: MagicMock) -> PgSTACClient:
+    return PgSTACClient(pool=mock_pool)
+
+
+def _conn(pool: MagicMock) -> MagicMock:
+    return pool.connection.return_value.__enter__.return_value
+
+
+def _cursor(pool: MagicMock) -> MagicMock:
+    return _conn(pool).cursor.return_value.__enter__.return_value
+
+
+class TestGetAllCollections:
+    def test_pages_through_collection_search(
+        self, client: PgSTACClient, mock_pool: MagicMock
+    ) -> None:
+        next_link = {"rel": "next", "href": "http://localhost/collections"}
+        _conn(mock_pool).execute.return_value.fetchone.side_effect = [
+            ({"collections": [{"id": "a"}, {"id": "b"}], "links": [next_link]},),
+            ({"collections": [{"id": "c"}], "links": []},),
+        ]
+
+        assert client.get_all_collections() == ["a", "b", "c"]
+        calls = _conn(mock_pool).execute.call_args_list
+        assert all("collection_search" in call.args[0] for call in calls)
+        assert [call.args[1][0].obj["offset"] for call in calls] == [0, 2]
+
+
+class TestGetCollection:
+    def test_validates_collection(self, client: PgSTACClient, mock_pool: MagicMock) -> None:
+        _conn(mock_pool).execute.return_value.fetchone.return_value = (SAMPLE_COLLECTION_DATA,)
+
+        collection = client.get_collection("test-collection")
+
+        assert isinstance(collection, STACCollection)
+        assert collection.id == SAMPLE_COLLECTION_DATA["id"]
+        sql, params = _conn(mock_pool).execute.call_args.args
+        assert "get_collection" in sql
+        assert params == ("test-collection",)
+
+    def test_missing_collection_raises(self, client: PgSTACClient, mock_pool: MagicMock) -> None:
+        _conn(mock_pool).execute.return_value.fetchone.return_value = (None,)
+
+        with pytest.raises(LookupError, match="missing"):
+            client.get_collection("missing")
+
+
+class TestCollectionItems:
+    def test_streams_items_from_server_side_cursor(
+        self, client: PgSTACClient, mock_pool: MagicMock
+    ) -> None:
+        items = client.get_collection_items("test-collection")
+
+        assert [item.id for item in items] == ["item-001", "item-002"]
+        assert all(isinstance(item, STACItem) and item.links == [] for item in items)
+        assert "name" in _conn(mock_pool).cursor.call_args.kwargs
+        cursor = _cursor(mock_pool)
+        assert cursor.itersize == settings.pgstac_itersize
+        clauses_sql, clauses_params = _conn(mock_pool).execute.call_args.args
+        assert "search_query" in clauses_sql
+        assert clauses_params[0].obj == {"collections": ["test-collection"]}
+        query, params = cursor.execute.call_args.args
+        rendered = query.as_string(None)
+        assert "FROM items" in rendered
+        assert "search_rows" not in rendered
+        assert "WHERE collection = 'test-collection'" in rendered
+        assert rendered.endswith("ORDER BY datetime DESC, id DESC")
+        assert params[0].obj == {}
+
+    def test_iter_is_lazy(self, client: PgSTACClient, mock_pool: MagicMock) -> None:
+        items = client.iter_collection_items("test-collection")
+
+        mock_pool.connection.assert_not_called()
+        assert next(items).id == "item-001"
+
+    def test_item_table(self, client: PgSTACClient) -> None:
+        table = client.get_collection_item_table("test-collection")
+
+        assert isinstance(table, ItemTable)
+        assert len(table) == 2
+
+
+class TestClose:
+    def test_does_not_close_supplied_pool(self, mock_pool: MagicMock) -> None:
+        PgSTACClient(pool=mock_pool).close()
+
+        mock_pool.close.assert_not_called()
+
+
+class TestDropInClient:
+    def test_maxar_collection_reads_from_pgstac(self, client: PgSTACClient) -> None:
+        collection = MaxarCollection("test-collection", client=client)
+
+        assert [item.id for item in collection.items] == ["item-001", "item-002"]
@@ -0,0 +1,93 @@
+"""Tests for the mosaic planner."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from eo_maxar.collection import MaxarCollection
+from eo_maxar.geojson import bbox_to_polygon_geometry
+from eo_maxar.models import STACItem, TileJSON
+from eo_maxar.planner import MosaicPlan, item_penalty, plan_mosaic
+from tests.conftest import SAMPLE_TILEJSON_DATA, make_item
+
+EVENT = datetime(2023, 2, 6, tzinfo=UTC)
+AOI = [0.0, 0.0, 2.0, 1.0]
+
+
+def _item(
+    item_id: str,
+    bbox: list[float],
+    dt: str = "2023-02-01T00:00:00Z",
+    cloud: float = 0,
+    off_nadir: float = 0,
+) -> STACItem:
+    return make_item(
+        id=item_id,
+        bbox=bbox,
+        geometry=bbox_to_polygon_geometry(bbox),
+        properties={"datetime": dt, "tile:clouds_percent": cloud, "view:off_nadir": off_nadir},
+    )
+
+
+class TestItemPenalty:
+    def test_ideal_item_has_unit_penalty(self) -> None:
+        assert item_penalty(_item("a", AOI)) == 1
+
+    def test_cloud_and_off_nadir_increase_penalty(self) -> None:
+        assert item_penalty(_item("a", AOI, cloud=100, off_nadir=90)) == 3
+
+
+class TestPlanMosaic:
+    def test_picks_two_halves_over_redundant_items(self) -> None:
+        items = [
+            _item("left", [0.0, 0.0, 1.0, 1.0]),
+            _item("right", [1.0, 0.0, 2.0, 1.0]),
+            _item("middle", [0.5, 0.0, 1.5, 1.0]),
+        ]
+        plan = plan_mosaic(items, AOI, EVENT, "pre")
+
+        assert sorted(plan.item_ids) == ["left", "right"]
+        assert plan.coverage == pytest.approx(1.0)
+
+    def test_prefers_clear_imagery(self) -> None:
+        items = [_item("cloudy", AOI, cloud=80), _item("clear", AOI, cloud=5)]
+        assert plan_mosaic(items, AOI, EVENT, "pre").item_ids == ["clear"]
+
+    def test_filters_by_period(self) -> None:
+        items = [_item("pre", AOI), _item("post", AOI, dt="2023-02-07T00:00:00Z")]
+        assert plan_mosaic(items, AOI, EVENT, "post").item_ids == ["post"]
+
+    def test_reports_partial_coverage(self) -> None:
+        plan = plan_mosaic([_item("left", [0.0, 0.0, 1.0, 1.0])], AOI, EVENT, "pre")
+        assert plan.item_ids == ["left"]
+        assert plan.coverage == pytest.approx(0.5)
+
+    def test_no_candidates(self) -> None:
+        plan = plan_mosaic([_item("far", [10.0, 10.0, 11.0, 11.0])], AOI, EVENT, "pre")
+        assert plan == MosaicPlan(item_ids=[], coverage=0.0)
+
+    def test_zero_area_bbox_raises(self) -> None:
+        with pytest.raises(ValueError, match="non-zero area"):
+            plan_mosaic([], [0.0, 0.0, 0.0, 1.0], EVENT, "pre")
+
+
+class TestCollectionPlannedMosaic:
+    def test_registers_mosaic_limited_to_planned_ids(self) -> None:
+        mock_client = MagicMock()
+        mock_client.get_collection_items.return_value = [_item("a", AOI)]
+        mock_client.register_mosaic.return_value = "abc123"
+        mock_client.get_tilejson.return_value = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        collection = MaxarCollection("test-collection", client=mock_client)
+        collection._visualizer.create_tile_map = MagicMock()
+
+        collection.planned_mosaic_map(AOI, EVENT, "pre")
+
+        filter_args = mock_client.register_mosaic.call_args[0][2]
+        assert filter_args == {"op": "in", "args": [{"property": "id"}, ["a"]]}
+        collection._visualizer.create_tile_map.assert_called_once()
+
+    def test_empty_plan_raises(self) -> None:
+        collection = MaxarCollection("test-collection", client=MagicMock())
+        with pytest.raises(ValueError, match="does not contain any items"):
+            collection.planned_mosaic_tilejson(MosaicPlan(item_ids=[], coverage=0), AOI, "x")
@@ -0,0 +1,125 @@
+"""Tests for the MBTiles store and local tile proxy."""
+
+import sqlite3
+import urllib.request
+from pathlib import Path
+
+import httpx
+import pytest
+import respx
+
+from eo_maxar.models import TileJSON
+from eo_maxar.proxy import MBTilesCache, TileProxy
+from tests.conftest import SAMPLE_TILEJSON_DATA
+
+UPSTREAM = "http://localhost:8082/searches/abc123/tiles"
+
+
+@pytest.fixture
+def store(tmp_path: Path) -> MBTilesCache:
+    return MBTilesCache(tmp_path / "layer.mbtiles", max_bytes=1024)
+
+
+@pytest.fixture
+def proxy(tmp_path: Path):
+    with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+        yield proxy
+
+
+class TestMBTilesCache:
+    def test_set_and_get_round_trip(self, store: MBTilesCache) -> None:
+        store.set(3, 4, 2, b"tile")
+        assert store.get(3, 4, 2) == b"tile"
+        assert store.get(3, 4, 3) is None
+        assert (store.hits, store.misses) == (1, 1)
+
+    def test_rows_use_tms_scheme(self, store: MBTilesCache) -> None:
+        store.set(3, 4, 2, b"tile")
+        conn = sqlite3.connect(store.path)
+        row = conn.execute("SELECT zoom_level, tile_column, tile_row FROM tiles").fetchone()
+        assert row == (3, 4, 5)
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        store = MBTilesCache(tmp_path / "lru.mbtiles", max_bytes=10)
+        store.set(1, 0, 0, b"12345")
+        store.set(1, 0, 1, b"12345")
+        store.get(1, 0, 0)  # (1, 0, 1) is now the least recently used tile
+        store.set(1, 1, 0, b"12345")
+
+        assert store.get(1, 0, 0) is not None
+        assert store.get(1, 0, 1) is None
+        assert len(store) == 2
+
+    def test_metadata(self, store: MBTilesCache) -> None:
+        store.set_metadata(name="Pre-event", minzoom=12)
+        assert store.metadata == {"name": "Pre-event", "minzoom": "12"}
+
+
+class TestTileProxy:
+    def test_register_rewrites_tile_url(self, proxy: TileProxy) -> None:
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        proxied = proxy.register(tilejson)
+
+        assert proxied.tiles[0].startswith(proxy.url)
+        assert proxied.tiles[0].endswith("/{z}/{x}/{y}")
+        assert proxied.bounds == tilejson.bounds
+        assert tilejson.tiles == SAMPLE_TILEJSON_DATA["tiles"]
+
+    @respx.mock
+    def test_serves_repeat_requests_from_cache(self, proxy: TileProxy) -> None:
+        route = respx.get(f"{UPSTREAM}/12/2457/1580").respond(
+            content=b"png", headers={"Content-Type": "image/png"}
+        )
+        proxied = proxy.register(TileJSON.model_validate(SAMPLE_TILEJSON_DATA))
+        url = proxied.tiles[0].format(z=12, x=2457, y=1580)
+
+        for _ in range(2):
+            with urllib.request.urlopen(url) as response:  # noqa: S310
+                assert response.read() == b"png"
+                assert response.headers["Content-Type"] == "image/png"
+
+        assert route.call_count == 1
+
+    @respx.mock
+    def test_serves_stored_tiles_when_upstream_is_down(self, tmp_path: Path) -> None:
+        respx.get(f"{UPSTREAM}/12/2457/1580").respond(content=b"png")
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+            layer_id = proxy.register(tilejson).tiles[0].split("/")[3]
+            proxy.fetch(layer_id, 12, 2457, 1580)
+
+        respx.clear()
+        route = respx.get(url__startswith=UPSTREAM).mock(side_effect=httpx.ConnectError("offline"))
+        with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+            proxy.register(tilejson)
+            status, body, _ = proxy.fetch(layer_id, 12, 2457, 1580)
+            assert (status, body) == (200, b"png")
+            assert proxy.fetch(layer_id, 12, 0, 0)[0] == 502
+        assert route.call_count == 1
+
+    def test_unknown_layer_is_not_found(self, proxy: TileProxy) -> None:
+        assert proxy.fetch("missing", 0, 0, 0)[0] == 404
+
+    @respx.mock
+    def test_reopens_stored_layers_without_tilejson(self, tmp_path: Path) -> None:
+        respx.get(f"{UPSTREAM}/12/2457/1580").respond(content=b"png")
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+            layer_id = proxy.register(tilejson).tiles[0].split("/")[3]
+            proxy.fetch(layer_id, 12, 2457, 1580)
+
+        respx.clear()
+        respx.get(url__startswith=UPSTREAM).mock(side_effect=httpx.ConnectError("offline"))
+        with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+            assert proxy.stored_layers() == [layer_id]
+            reopened = proxy.open(layer_id)
+            assert reopened.tiles[0].startswith(f"{proxy.url}/{layer_id}/")
+            assert (reopened.minzoom, reopened.maxzoom) == (tilejson.minzoom, tilejson.maxzoom)
+            assert reopened.bounds == tilejson.bounds
+
+        with httpx.Client() as client, TileProxy(cache_dir=tmp_path, http_client=client) as proxy:
+            assert proxy.fetch(layer_id, 12, 2457, 1580)[:2] == (200, b"png")
+
+    def test_open_unknown_layer_raises(self, proxy: TileProxy) -> None:
+        with pytest.raises(KeyError, match="missing"):
+            proxy.open("missing")
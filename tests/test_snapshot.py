@@ -0,0 +1,103 @@
+"""Tests for Parquet item snapshots."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pyarrow.parquet as pq
+import pytest
+import respx
+
+from eo_maxar.client import APIClient
+from eo_maxar.collection import MaxarCollection
+from eo_maxar.config import settings
+from eo_maxar.models import STACItem
+from eo_maxar.snapshot import (
+    read_items_snapshot,
+    read_snapshot_geodataframe,
+    write_items_snapshot,
+)
+from tests.conftest import SAMPLE_ITEMS_PAGE_DATA, make_item
+
+
+@pytest.fixture
+def items() -> list[STACItem]:
+    second = make_item(
+        id="item-002",
+        geometry=None,
+        properties={"datetime": "2023-02-07T10:00:00Z", "tile:clouds_percent": 5},
+        links=[{"rel": "self", "href": "http://localhost:8081/item-002"}],
+    )
+    return [make_item(), second]
+
+
+class TestSnapshotRoundTrip:
+    def test_items_round_trip(self, items: list[STACItem], tmp_path: Path) -> None:
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+        assert read_items_snapshot(path) == items
+
+    def test_properties_are_flattened_columns(self, items: list[STACItem], tmp_path: Path) -> None:
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+        columns = pq.read_schema(path).names
+        assert "datetime" in columns
+        assert "tile:clouds_percent" in columns
+        assert "properties" not in columns
+
+    def test_properties_named_like_core_columns_round_trip(self, tmp_path: Path) -> None:
+        items = [make_item(properties={"datetime": "2023-02-07T10:00:00Z", "id": 7, "links": "x"})]
+
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+
+        assert read_items_snapshot(path) == items
+        assert {"properties.id", "properties.links"} <= set(pq.read_schema(path).names)
+
+    def test_mixed_type_properties_round_trip(self, tmp_path: Path) -> None:
+        items = [
+            make_item(id="a", properties={"datetime": None, "gsd": 0.5, "tags": [1, "one"]}),
+            make_item(id="b", properties={"datetime": None, "gsd": "unknown", "tags": {"k": 1}}),
+            make_item(id="c", properties={"datetime": None, "flag": True}),
+        ]
+
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+
+        assert read_items_snapshot(path) == items
+        assert read_snapshot_geodataframe(path)["gsd"].tolist()[:2] == ["0.5", '"unknown"']
+
+    def test_geodataframe_has_geometry(self, items: list[STACItem], tmp_path: Path) -> None:
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+        gdf = read_snapshot_geodataframe(path)
+        assert len(gdf) == 2
+        assert gdf.crs.to_epsg() == 4326
+        assert gdf.geometry.iloc[0].bounds == (36.0, 37.0, 36.5, 37.5)
+
+
+class TestSnapshotSources:
+    @respx.mock
+    def test_client_exports_collection(self, tmp_path: Path) -> None:
+        respx.get(
+            url__startswith=f"{settings.stac_api_url}/collections/turkey-earthquake-2023/items"
+        ).respond(json=SAMPLE_ITEMS_PAGE_DATA)
+
+        with APIClient() as client:
+            path = client.export_collection_items("turkey-earthquake-2023", tmp_path / "s.parquet")
+
+        assert [item.id for item in read_items_snapshot(path)] == ["item-001"]
+
+    def test_collection_reads_items_from_snapshot(
+        self, items: list[STACItem], tmp_path: Path
+    ) -> None:
+        path = write_items_snapshot(items, tmp_path / "items.parquet")
+        mock_client = MagicMock()
+        collection = MaxarCollection("test-collection", client=mock_client, snapshot_path=path)
+
+        assert collection.items == items
+        assert list(collection.item_table.ids) == ["item-001", "item-002"]
+        mock_client.get_collection_items.assert_not_called()
+        mock_client.get_collection_item_table.assert_not_called()
+
+    def test_collection_writes_snapshot(self, items: list[STACItem], tmp_path: Path) -> None:
+        collection = MaxarCollection("test-collection", client=MagicMock())
+        collection.__dict__["items"] = items
+
+        path = collection.to_snapshot(tmp_path / "nested" / "items.parquet")
+
+        assert read_items_snapshot(path) == items
@@ -0,0 +1,47 @@
+"""Tests for ItemSpatialIndex."""
+
+import pytest
+
+from eo_maxar.geojson import bbox_to_polygon_geometry
+from eo_maxar.spatial import ItemSpatialIndex, item_footprint
+from tests.conftest import make_item
+
+
+@pytest.fixture
+def index() -> ItemSpatialIndex:
+    return ItemSpatialIndex([
+        make_item(id="a", bbox=[0, 0, 1, 1], geometry=bbox_to_polygon_geometry([0, 0, 1, 1])),
+        make_item(id="b", bbox=[2, 2, 3, 3], geometry=bbox_to_polygon_geometry([2, 2, 3, 3])),
+        make_item(id="c", bbox=[0.5, 0.5, 2.5, 2.5], geometry=None),
+    ])
+
+
+class TestItemFootprint:
+    def test_falls_back_to_bbox(self) -> None:
+        footprint = item_footprint(make_item(bbox=[0.0, 0.0, 1.0, 2.0], geometry=None))
+        assert footprint.bounds == (0.0, 0.0, 1.0, 2.0)
+
+
+class TestItemSpatialIndex:
+    def test_intersecting_returns_items_in_input_order(self, index: ItemSpatialIndex) -> None:
+        result = index.intersecting([0.8, 0.8, 2.2, 2.2])
+        assert [item.id for item in result] == ["a", "b", "c"]
+
+    def test_intersecting_excludes_disjoint(self, index: ItemSpatialIndex) -> None:
+        assert [item.id for item in index.intersecting([2.6, 2.6, 2.9, 2.9])] == ["b"]
+
+    def test_containing_point(self, index: ItemSpatialIndex) -> None:
+        assert [item.id for item in index.containing((0.75, 0.75))] == ["a", "c"]
+
+    def test_containing_point_on_boundary(self, index: ItemSpatialIndex) -> None:
+        assert [item.id for item in index.containing((3.0, 3.0))] == ["b"]
+
+    def test_nearest(self, index: ItemSpatialIndex) -> None:
+        nearest = index.nearest((10.0, 10.0))
+        assert nearest is not None
+        assert nearest.id == "b"
+
+    def test_empty_index(self) -> None:
+        index = ItemSpatialIndex([])
+        assert index.intersecting([0, 0, 1, 1]) == []
+        assert index.nearest((0.0, 0.0)) is None
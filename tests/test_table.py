@@ -0,0 +1,126 @@
+"""Tests for ItemTable."""
+
+from datetime import UTC, datetime
+
+import numpy as np
+import pytest
+import respx
+
+from eo_maxar.client import APIClient
+from eo_maxar.config import settings
+from eo_maxar.models import STACItem
+from eo_maxar.table import ItemTable, to_datetime64
+from tests.conftest import SAMPLE_ITEMS_PAGE_DATA, make_item, make_item_data
+
+
+@pytest.fixture
+def table() -> ItemTable:
+    return ItemTable.from_features([
+        make_item_data(
+            id="a",
+            bbox=[0.0, 0.0, 1.0, 1.0],
+            properties={
+                "datetime": "2023-02-01T00:00:00Z",
+                "tile:clouds_percent": 10,
+                "view:off_nadir": 20.0,
+                "catalog_id": "cat-1",
+            },
+        ),
+        make_item_data(
+            id="b",
+            bbox=[5.0, 5.0, 6.0, 6.0],
+            properties={
+                "datetime": "2023-02-10T00:00:00Z",
+                "tile:clouds_percent": 0,
+                "view:off_nadir": 5.0,
+                "catalog_id": "cat-2",
+            },
+        ),
+        make_item_data(
+            id="c",
+            bbox=[0.5, 0.5, 2.0, 2.0],
+            properties={"datetime": "2023-02-20T00:00:00Z"},
+        ),
+    ])
+
+
+class TestToDatetime64:
+    def test_parses_z_suffix_as_utc(self) -> None:
+        assert to_datetime64("2023-02-06T10:00:00Z") == np.datetime64("2023-02-06T10:00:00")
+
+    def test_converts_aware_datetime_to_utc(self) -> None:
+        from datetime import timedelta, timezone
+
+        value = datetime(2023, 2, 6, 12, tzinfo=timezone(timedelta(hours=2)))
+        assert to_datetime64(value) == np.datetime64("2023-02-06T10:00:00")
+
+    def test_none_is_nat(self) -> None:
+        assert np.isnat(to_datetime64(None))
+
+
+class TestItemTableColumns:
+    def test_columns_are_populated(self, table: ItemTable) -> None:
+        assert len(table) == 3
+        assert table.bbox.shape == (3, 4)
+        assert table.datetime.dtype == np.dtype("datetime64[ms]")
+        assert list(table.catalog_ids) == ["cat-1", "cat-2", None]
+        assert np.isnan(table.cloud_percent[2])
+
+    def test_empty_table(self) -> None:
+        empty = ItemTable.from_features([])
+        assert len(empty) == 0
+        assert empty.bbox.shape == (0, 4)
+        assert len(empty.filter(bbox=[0, 0, 1, 1])) == 0
+
+
+class TestItemTableFilter:
+    def test_filter_by_bbox(self, table: ItemTable) -> None:
+        assert list(table.filter(bbox=[0.9, 0.9, 1.5, 1.5]).ids) == ["a", "c"]
+
+    def test_filter_by_time_window(self, table: ItemTable) -> None:
+        result = table.filter(
+            start=datetime(2023, 2, 5, tzinfo=UTC), end=datetime(2023, 2, 20, tzinfo=UTC)
+        )
+        assert list(result.ids) == ["b"]
+
+    def test_missing_values_never_match_thresholds(self, table: ItemTable) -> None:
+        assert list(table.filter(max_cloud_percent=50).ids) == ["a", "b"]
+
+    def test_combined_criteria(self, table: ItemTable) -> None:
+        assert list(table.filter(bbox=[0, 0, 10, 10], max_off_nadir=10).ids) == ["b"]
+
+
+class TestItemTableSort:
+    def test_sort_ascending_puts_missing_last(self, table: ItemTable) -> None:
+        assert list(table.sort_by("cloud_percent").ids) == ["b", "a", "c"]
+
+    def test_sort_descending_puts_missing_last(self, table: ItemTable) -> None:
+        assert list(table.sort_by("off_nadir", descending=True).ids) == ["a", "b", "c"]
+
+    def test_sort_by_string_column(self, table: ItemTable) -> None:
+        assert list(table.sort_by("catalog_ids", descending=True).ids) == ["b", "a", "c"]
+
+
+class TestItemTableMaterialise:
+    def test_item_round_trips(self, table: ItemTable) -> None:
+        item = table.item(1)
+        assert isinstance(item, STACItem)
+        assert item.id == "b"
+
+    def test_from_items_matches_from_features(self) -> None:
+        item = make_item()
+        table = ItemTable.from_items([item])
+        assert table.to_items() == [item]
+
+
+class TestClientItemTable:
+    @respx.mock
+    def test_builds_table_from_pages(self) -> None:
+        respx.get(
+            url__startswith=f"{settings.stac_api_url}/collections/turkey-earthquake-2023/items"
+        ).respond(json=SAMPLE_ITEMS_PAGE_DATA)
+
+        with APIClient() as client:
+            table = client.get_collection_item_table("turkey-earthquake-2023")
+
+        assert list(table.ids) == ["item-001"]
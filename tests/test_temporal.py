@@ -0,0 +1,44 @@
+"""Tests for ItemTemporalIndex."""
+
+from datetime import UTC, datetime
+
+import pytest
+
+from eo_maxar.temporal import ItemTemporalIndex
+from tests.conftest import make_item
+
+
+@pytest.fixture
+def index() -> ItemTemporalIndex:
+    return ItemTemporalIndex([
+        make_item(id="late", properties={"datetime": "2023-02-20T00:00:00Z"}),
+        make_item(id="undated", properties={"datetime": None}),
+        make_item(id="early", properties={"datetime": "2023-02-01T00:00:00Z"}),
+        make_item(id="event", properties={"datetime": "2023-02-06T00:00:00Z"}),
+    ])
+
+
+EVENT = datetime(2023, 2, 6, tzinfo=UTC)
+
+
+class TestItemTemporalIndex:
+    def test_items_sorted_and_undated_excluded(self, index: ItemTemporalIndex) -> None:
+        assert [item.id for item in index.items] == ["early", "event", "late"]
+
+    def test_before_is_exclusive(self, index: ItemTemporalIndex) -> None:
+        assert [item.id for item in index.before(EVENT)] == ["early"]
+
+    def test_after_is_inclusive(self, index: ItemTemporalIndex) -> None:
+        assert [item.id for item in index.after(EVENT)] == ["event", "late"]
+
+    def test_between(self, index: ItemTemporalIndex) -> None:
+        result = index.between(datetime(2023, 2, 2, tzinfo=UTC), datetime(2023, 2, 20, tzinfo=UTC))
+        assert [item.id for item in result] == ["event"]
+
+    def test_partition_matches_before_and_after(self, index: ItemTemporalIndex) -> None:
+        pre, post = index.partition(EVENT)
+        assert pre == index.before(EVENT)
+        assert post == index.after(EVENT)
+
+    def test_naive_dates_treated_as_utc(self, index: ItemTemporalIndex) -> None:
+        assert index.before(datetime(2023, 2, 6)) == index.before(EVENT)
@@ -0,0 +1,113 @@
+"""Tests for tile helpers and the tile cache warmer."""
+
+import httpx
+import pytest
+import respx
+
+from eo_maxar.config import settings
+from eo_maxar.models import TileJSON
+from eo_maxar.tiles import (
+    PrefetchStats,
+    count_tiles,
+    lonlat_to_tile,
+    prefetch_tiles,
+    tile_url,
+    tiles_for_bbox,
+)
+from tests.conftest import SAMPLE_TILEJSON_DATA
+
+
+class TestLonLatToTile:
+    def test_zoom_zero_is_single_tile(self) -> None:
+        assert lonlat_to_tile(36.0, 37.0, 0) == (0, 0)
+
+    def test_known_tile(self) -> None:
+        # London at zoom 10.
+        assert lonlat_to_tile(-0.1276, 51.5072, 10) == (511, 340)
+
+    def test_clamps_to_matrix(self) -> None:
+        assert lonlat_to_tile(180.0, -90.0, 2) == (3, 3)
+
+
+class TestTilesForBbox:
+    def test_covers_bbox(self) -> None:
+        tiles = list(tiles_for_bbox([-1.0, -1.0, 1.0, 1.0], 1))
+        assert sorted(tiles) == [(1, 0, 0), (1, 0, 1), (1, 1, 0), (1, 1, 1)]
+
+    def test_small_bbox_single_tile(self) -> None:
+        assert len(list(tiles_for_bbox([36.0, 37.0, 36.001, 37.001], 10))) == 1
+
+    def test_count_matches_enumeration(self) -> None:
+        bbox = [36.0, 37.0, 36.5, 37.5]
+        assert count_tiles(bbox, 12) == len(list(tiles_for_bbox(bbox, 12)))
+
+
+class TestTileURL:
+    def test_fills_placeholders(self) -> None:
+        template = "http://localhost:8082/tiles/{z}/{x}/{y}?assets=visual"
+        assert tile_url(template, 3, 4, 5) == "http://localhost:8082/tiles/3/4/5?assets=visual"
+
+
+class TestPrefetchTiles:
+    @respx.mock
+    def test_requests_each_tile_and_reports_stats(self) -> None:
+        route = respx.get(url__startswith="http://localhost:8082/searches/abc123/tiles").respond(
+            content=b"tile"
+        )
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        updates: list[PrefetchStats] = []
+
+        with httpx.Client() as client:
+            stats = prefetch_tiles(
+                tilejson,
+                [-1.0, -1.0, 1.0, 1.0],
+                zooms=[0, 1],
+                max_workers=2,
+                http_client=client,
+                progress=updates.append,
+            )
+
+        assert route.call_count == 5
+        assert stats.total == 5
+        assert stats.succeeded == 5
+        assert stats.bytes == 20
+        assert len(updates) == 5
+        assert updates[-1].completed == 5
+
+    @respx.mock
+    def test_counts_failures(self) -> None:
+        respx.get(url__startswith="http://localhost:8082").respond(status_code=500)
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+
+        with httpx.Client() as client:
+            stats = prefetch_tiles(tilejson, [0.0, 0.0, 1.0, 1.0], zooms=[0], http_client=client)
+
+        assert stats.failed == 1
+        assert stats.succeeded == 0
+
+    def test_rejects_too_many_tiles(self) -> None:
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        with pytest.raises(ValueError, match="more than the limit"):
+            prefetch_tiles(tilejson, [-180.0, -85.0, 180.0, 85.0], zooms=[12])
+
+    @respx.mock
+    def test_default_zooms_stop_at_tile_budget(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(settings, "prefetch_max_tiles", 200)
+        respx.get(url__startswith="http://localhost:8082").respond(content=b"tile")
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        # Roughly 2 km across: every zoom up to maxzoom 22 would be ~90,000 tiles.
+        bbox = [36.2, 37.2, 36.22, 37.22]
+
+        with httpx.Client() as client:
+            stats = prefetch_tiles(tilejson, bbox, http_client=client)
+
+        assert stats.zooms[0] == tilejson.minzoom
+        assert stats.zooms[-1] < tilejson.maxzoom
+        assert stats.total <= settings.prefetch_max_tiles
+        assert stats.total + count_tiles(bbox, stats.zooms[-1] + 1) > settings.prefetch_max_tiles
+        assert stats.succeeded == stats.total
+
+    def test_default_zooms_skip_bbox_over_budget(self) -> None:
+        tilejson = TileJSON.model_validate(SAMPLE_TILEJSON_DATA)
+        stats = prefetch_tiles(tilejson, [-180.0, -85.0, 180.0, 85.0])
+        assert (stats.total, stats.zooms) == (0, [])
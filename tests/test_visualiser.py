@@ -1,21 +1,28 @@
 """Tests for MapVisualizer."""
 
 from datetime import UTC, datetime
+from pathlib import Path
 
+import ipyleaflet
 import pytest
 
+from eo_maxar.config import settings
 from eo_maxar.models import STACCollection, STACItem, TileJSON
+from eo_maxar.proxy import TileProxy
+from eo_maxar.spatial import ItemSpatialIndex
 from eo_maxar.visualiser import (
     _FEATURE_STYLE,
     _MAIN_BBOX_STYLE,
     _POST_EVENT_COLOR,
     _PRE_EVENT_COLOR,
     MapVisualizer,
+    ViewportFootprints,
 )
 from tests.conftest import (
     SAMPLE_COLLECTION_DATA,
     SAMPLE_ITEM_DATA,
     SAMPLE_TILEJSON_DATA,
+    make_item,
 )
 
 
@@ -82,25 +89,65 @@ class TestCollectionFootprintsStyleCallback:
         assert layer.style_callback(other_feature) == _FEATURE_STYLE
 
 
-class TestPrePostEventStyleCallback:
-    """Test the date-based colour logic in create_pre_post_event_map."""
+class TestPrePostEventLayers:
+    """Test the per-period layers in create_pre_post_event_map."""
 
-    def test_pre_event_item_gets_blue(self, visualizer: MapVisualizer, item: STACItem) -> None:
+    def test_partitions_by_event_date(self, visualizer: MapVisualizer) -> None:
         import ipyleaflet
 
-        event_date = datetime(2023, 2, 6, tzinfo=UTC)
-        m = visualizer.create_pre_post_event_map([item], event_date)
-        layer = next(layer for layer in m.layers if isinstance(layer, ipyleaflet.GeoJSON))
+        items = [
+            make_item(id="before", properties={"datetime": "2023-02-01T00:00:00Z"}),
+            make_item(id="after", properties={"datetime": "2023-02-07T00:00:00Z"}),
+            make_item(id="undated", properties={"datetime": None}),
+        ]
+
+        m = visualizer.create_pre_post_event_map(items, datetime(2023, 2, 6, tzinfo=UTC))
+        layers = {layer.name: layer for layer in m.layers if isinstance(layer, ipyleaflet.GeoJSON)}
+
+        assert [f["id"] for f in layers["Pre-event"].data["features"]] == ["before"]
+        assert [f["id"] for f in layers["Post-event"].data["features"]] == ["after"]
+
+    def test_periods_get_fixed_colours(self, visualizer: MapVisualizer, item: STACItem) -> None:
+        import ipyleaflet
+
+        m = visualizer.create_partitioned_event_map([item], [item])
+        layers = {layer.name: layer for layer in m.layers if isinstance(layer, ipyleaflet.GeoJSON)}
+
+        assert layers["Pre-event"].style["fillColor"] == _PRE_EVENT_COLOR
+        assert layers["Post-event"].style["fillColor"] == _POST_EVENT_COLOR
+
+    def test_items_split_across_layers(self, visualizer: MapVisualizer, item: STACItem) -> None:
+        import ipyleaflet
 
-        pre_feature = {"properties": {"datetime": "2023-02-05T10:00:00Z"}}
-        post_feature = {"properties": {"datetime": "2023-02-07T10:00:00Z"}}
+        m = visualizer.create_partitioned_event_map([], [item])
+        layers = {layer.name: layer for layer in m.layers if isinstance(layer, ipyleaflet.GeoJSON)}
 
-        assert layer.style_callback(pre_feature)["fillColor"] == _PRE_EVENT_COLOR
-        assert layer.style_callback(post_feature)["fillColor"] == _POST_EVENT_COLOR
+        assert layers["Pre-event"].data["features"] == []
+        assert len(layers["Post-event"].data["features"]) == 1
+
+    def test_simplification_is_opt_in(
+        self, visualizer: MapVisualizer, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        import ipyleaflet
+
+        ring = [[36.0 + i * 1e-5, 37.0 + (i % 2) * 1e-6] for i in range(50)]
+        ring += [[36.5, 37.5], [36.0, 37.5], ring[0]]
+        item = make_item(geometry={"type": "Polygon", "coordinates": [ring]})
+
+        def vertex_count() -> int:
+            m = visualizer.create_partitioned_event_map([item], [])
+            layer = next(layer for layer in m.layers if isinstance(layer, ipyleaflet.GeoJSON))
+            return len(layer.data["features"][0]["geometry"]["coordinates"][0])
+
+        assert vertex_count() == len(ring)
+        monkeypatch.setattr(settings, "footprint_simplify_zoom", 8)
+        assert vertex_count() < len(ring)
 
     def test_empty_items_raises(self, visualizer: MapVisualizer) -> None:
         with pytest.raises(ValueError, match="Item list cannot be empty"):
             visualizer.create_pre_post_event_map([], datetime(2023, 2, 6, tzinfo=UTC))
+        with pytest.raises(ValueError, match="Item list cannot be empty"):
+            visualizer.create_partitioned_event_map([], [])
 
 
 class TestCreateSplitMap:
@@ -129,6 +176,12 @@ class TestCreateTileMap:
         # Should have the OSM base layer + our custom tile layer
         assert len(tile_layers) >= 1
 
+    def test_routes_tiles_through_proxy(self, tilejson: TileJSON, tmp_path: Path) -> None:
+        with TileProxy(cache_dir=tmp_path) as proxy:
+            m = MapVisualizer(tile_proxy=proxy).create_tile_map(tilejson)
+            urls = [layer.url for layer in m.layers if isinstance(layer, ipyleaflet.TileLayer)]
+        assert any(url.startswith(proxy.url) for url in urls)
+
 
 class TestCreateCollectionFootprintsMap:
     def test_returns_map(self, visualizer: MapVisualizer, collection: STACCollection) -> None:
@@ -136,3 +189,68 @@ class TestCreateCollectionFootprintsMap:
 
         m = visualizer.create_collection_footprints_map(collection)
         assert isinstance(m, ipyleaflet.Map)
+
+
+class TestCreateVectorFootprintsMap:
+    def test_adds_vector_tile_layer(self, visualizer: MapVisualizer, tilejson: TileJSON) -> None:
+        import ipyleaflet
+
+        m = visualizer.create_vector_footprints_map(tilejson)
+        layers = [layer for layer in m.layers if isinstance(layer, ipyleaflet.VectorTileLayer)]
+
+        assert len(layers) == 1
+        assert layers[0].url == tilejson.tiles[0]
+        assert "default" in layers[0].layer_styles
+
+
+class TestViewportFootprints:
+    @staticmethod
+    def _index() -> ItemSpatialIndex:
+        from eo_maxar.geojson import bbox_to_polygon_geometry
+
+        items = [
+            make_item(
+                id=f"item-{i}",
+                bbox=[float(i), 0.0, i + 0.5, 0.5],
+                geometry=bbox_to_polygon_geometry([float(i), 0.0, i + 0.5, 0.5]),
+            )
+            for i in range(5)
+        ]
+        return ItemSpatialIndex(items)
+
+    def test_update_adds_and_removes_incrementally(self, visualizer: MapVisualizer) -> None:
+        m = visualizer._create_base_map([0.0, 0.0, 5.0, 1.0])
+        viewport = ViewportFootprints(m, self._index())
+
+        viewport.update(((0.0, 0.0), (1.0, 1.2)))
+        assert viewport.visible_ids == {"item-0", "item-1"}
+        kept_layer = viewport._layers["item-1"]
+
+        viewport.update(((0.0, 1.2), (1.0, 2.2)))
+        assert viewport.visible_ids == {"item-1", "item-2"}
+        assert viewport._layers["item-1"] is kept_layer
+        assert len(viewport.group.layers) == 2
+
+    def test_caps_features_per_view(self, visualizer: MapVisualizer) -> None:
+        m = visualizer._create_base_map([0.0, 0.0, 5.0, 1.0])
+        viewport = ViewportFootprints(m, self._index(), max_features=2)
+
+        viewport.update(((0.0, 0.0), (1.0, 5.0)))
+        assert len(viewport.visible_ids) == 2
+
+    def test_no_bounds_yet_is_noop(self, visualizer: MapVisualizer) -> None:
+        m = visualizer._create_base_map([0.0, 0.0, 5.0, 1.0])
+        viewport = ViewportFootprints(m, self._index())
+        viewport.update()
+        assert viewport.visible_ids == set()
+
+    def test_create_viewport_map_adds_layer_group(self, visualizer: MapVisualizer) -> None:
+        import ipyleaflet
+
+        m = visualizer.create_viewport_footprints_map(self._index())
+        assert any(isinstance(layer, ipyleaflet.LayerGroup) for layer in m.layers)
+        assert m.center == [0.25, 2.25]
+
+    def test_create_viewport_map_empty_raises(self, visualizer: MapVisualizer) -> None:
+        with pytest.raises(ValueError, match="Item list cannot be empty"):
+            visualizer.create_viewport_footprints_map(ItemSpatialIndex([]))